@@ -1,572 +1 @@
-window.BENCHMARK_PAGE_DATA = {
-  "example_rows": [
-    {
-      "example": "state_machine",
-      "name": "state_machine_default",
-      "rust_prove_avg_seconds": 0.004039,
-      "rust_prove_rss_peak_kb": 2000.0,
-      "rust_verify_avg_seconds": 0.003096,
-      "rust_verify_rss_peak_kb": 1936.0,
-      "zig_over_rust_peak_rss_kb": 0.864,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.813073,
-      "zig_over_rust_verify": 0.975775,
-      "zig_prove_avg_seconds": 0.003284,
-      "zig_prove_rss_peak_kb": 1728.0,
-      "zig_verify_avg_seconds": 0.003021,
-      "zig_verify_rss_peak_kb": 1616.0
-    },
-    {
-      "example": "state_machine",
-      "name": "state_machine_medium",
-      "rust_prove_avg_seconds": 0.00374,
-      "rust_prove_rss_peak_kb": 2160.0,
-      "rust_verify_avg_seconds": 0.002889,
-      "rust_verify_rss_peak_kb": 1904.0,
-      "zig_over_rust_peak_rss_kb": 0.8518518518518519,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.784759,
-      "zig_over_rust_verify": 0.909311,
-      "zig_prove_avg_seconds": 0.002935,
-      "zig_prove_rss_peak_kb": 1840.0,
-      "zig_verify_avg_seconds": 0.002627,
-      "zig_verify_rss_peak_kb": 1600.0
-    },
-    {
-      "example": "poseidon",
-      "name": "poseidon_large",
-      "rust_prove_avg_seconds": 0.012814,
-      "rust_prove_rss_peak_kb": 5792.0,
-      "rust_verify_avg_seconds": 0.004465,
-      "rust_verify_rss_peak_kb": 3184.0,
-      "zig_over_rust_peak_rss_kb": 1.1353591160220995,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.945997,
-      "zig_over_rust_verify": 0.970437,
-      "zig_prove_avg_seconds": 0.012122,
-      "zig_prove_rss_peak_kb": 6576.0,
-      "zig_verify_avg_seconds": 0.004333,
-      "zig_verify_rss_peak_kb": 2768.0
-    },
-    {
-      "example": "blake",
-      "name": "blake_large",
-      "rust_prove_avg_seconds": 0.02777,
-      "rust_prove_rss_peak_kb": 10208.0,
-      "rust_verify_avg_seconds": 0.003732,
-      "rust_verify_rss_peak_kb": 2960.0,
-      "zig_over_rust_peak_rss_kb": 1.3150470219435737,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.980014,
-      "zig_over_rust_verify": 1.092176,
-      "zig_prove_avg_seconds": 0.027215,
-      "zig_prove_rss_peak_kb": 13424.0,
-      "zig_verify_avg_seconds": 0.004076,
-      "zig_verify_rss_peak_kb": 2544.0
-    },
-    {
-      "example": "wide_fibonacci",
-      "name": "wide_fibonacci_fib100",
-      "rust_prove_avg_seconds": 0.011563,
-      "rust_prove_rss_peak_kb": 3184.0,
-      "rust_verify_avg_seconds": 0.003105,
-      "rust_verify_rss_peak_kb": 2064.0,
-      "zig_over_rust_peak_rss_kb": 1.236180904522613,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.654674,
-      "zig_over_rust_verify": 1.031884,
-      "zig_prove_avg_seconds": 0.00757,
-      "zig_prove_rss_peak_kb": 3936.0,
-      "zig_verify_avg_seconds": 0.003204,
-      "zig_verify_rss_peak_kb": 1904.0
-    },
-    {
-      "example": "wide_fibonacci",
-      "name": "wide_fibonacci_fib500",
-      "rust_prove_avg_seconds": 0.03504,
-      "rust_prove_rss_peak_kb": 10528.0,
-      "rust_verify_avg_seconds": 0.003702,
-      "rust_verify_rss_peak_kb": 2544.0,
-      "zig_over_rust_peak_rss_kb": 1.3632218844984803,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.913071,
-      "zig_over_rust_verify": 0.987574,
-      "zig_prove_avg_seconds": 0.031994,
-      "zig_prove_rss_peak_kb": 14352.0,
-      "zig_verify_avg_seconds": 0.003656,
-      "zig_verify_rss_peak_kb": 2368.0
-    },
-    {
-      "example": "wide_fibonacci",
-      "name": "wide_fibonacci_fib1000",
-      "rust_prove_avg_seconds": 0.106713,
-      "rust_prove_rss_peak_kb": 31040.0,
-      "rust_verify_avg_seconds": 0.004469,
-      "rust_verify_rss_peak_kb": 3168.0,
-      "zig_over_rust_peak_rss_kb": 1.5128865979381443,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 1.226936,
-      "zig_over_rust_verify": 0.939808,
-      "zig_prove_avg_seconds": 0.13093,
-      "zig_prove_rss_peak_kb": 46960.0,
-      "zig_verify_avg_seconds": 0.0042,
-      "zig_verify_rss_peak_kb": 2864.0
-    },
-    {
-      "example": "plonk",
-      "name": "plonk_large",
-      "rust_prove_avg_seconds": 0.067036,
-      "rust_prove_rss_peak_kb": 10192.0,
-      "rust_verify_avg_seconds": 0.003409,
-      "rust_verify_rss_peak_kb": 2192.0,
-      "zig_over_rust_peak_rss_kb": 1.1554160125588697,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.302196,
-      "zig_over_rust_verify": 1.004693,
-      "zig_prove_avg_seconds": 0.020258,
-      "zig_prove_rss_peak_kb": 11776.0,
-      "zig_verify_avg_seconds": 0.003425,
-      "zig_verify_rss_peak_kb": 1760.0
-    },
-    {
-      "example": "poseidon",
-      "name": "poseidon_deep",
-      "rust_prove_avg_seconds": 0.035035,
-      "rust_prove_rss_peak_kb": 12432.0,
-      "rust_verify_avg_seconds": 0.004211,
-      "rust_verify_rss_peak_kb": 3232.0,
-      "zig_over_rust_peak_rss_kb": 1.3577863577863578,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 1.073041,
-      "zig_over_rust_verify": 1.370933,
-      "zig_prove_avg_seconds": 0.037594,
-      "zig_prove_rss_peak_kb": 16880.0,
-      "zig_verify_avg_seconds": 0.005773,
-      "zig_verify_rss_peak_kb": 3056.0
-    },
-    {
-      "example": "blake",
-      "name": "blake_deep",
-      "rust_prove_avg_seconds": 0.150913,
-      "rust_prove_rss_peak_kb": 43168.0,
-      "rust_verify_avg_seconds": 0.004711,
-      "rust_verify_rss_peak_kb": 4176.0,
-      "zig_over_rust_peak_rss_kb": 1.0266864343958488,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 1.20757,
-      "zig_over_rust_verify": 1.067077,
-      "zig_prove_avg_seconds": 0.182238,
-      "zig_prove_rss_peak_kb": 44320.0,
-      "zig_verify_avg_seconds": 0.005027,
-      "zig_verify_rss_peak_kb": 3568.0
-    },
-    {
-      "example": "wide_fibonacci",
-      "name": "wide_fibonacci_fib2000",
-      "rust_prove_avg_seconds": 0.391137,
-      "rust_prove_rss_peak_kb": 92944.0,
-      "rust_verify_avg_seconds": 0.004867,
-      "rust_verify_rss_peak_kb": 4736.0,
-      "zig_over_rust_peak_rss_kb": 1.1600964021346187,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 1.03802,
-      "zig_over_rust_verify": 1.088145,
-      "zig_prove_avg_seconds": 0.406008,
-      "zig_prove_rss_peak_kb": 107824.0,
-      "zig_verify_avg_seconds": 0.005296,
-      "zig_verify_rss_peak_kb": 3824.0
-    },
-    {
-      "example": "wide_fibonacci",
-      "name": "wide_fibonacci_fib5000",
-      "rust_prove_avg_seconds": 1.855803,
-      "rust_prove_rss_peak_kb": 368064.0,
-      "rust_verify_avg_seconds": 0.007807,
-      "rust_verify_rss_peak_kb": 8304.0,
-      "zig_over_rust_peak_rss_kb": 1.366284124500087,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 1.117953,
-      "zig_over_rust_verify": 1.079288,
-      "zig_prove_avg_seconds": 2.0747,
-      "zig_prove_rss_peak_kb": 502880.0,
-      "zig_verify_avg_seconds": 0.008426,
-      "zig_verify_rss_peak_kb": 7248.0
-    }
-  ],
-  "family_rows": [
-    {
-      "example": "xor",
-      "family": "bit_rev",
-      "rust_peak_rss_kb": 60240.0,
-      "rust_prove_avg_seconds": 0.2856725136666667,
-      "rust_verify_avg_seconds": 0.0002659303333333333,
-      "zig_over_rust_peak_rss_kb": 0.929615,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.187335,
-      "zig_over_rust_verify": 1.680891,
-      "zig_peak_rss_kb": 56000.0,
-      "zig_prove_avg_seconds": 0.05351633333333333,
-      "zig_verify_avg_seconds": 0.00044699999999999997
-    },
-    {
-      "example": "wide_fibonacci",
-      "family": "eval_at_point",
-      "rust_peak_rss_kb": 20128.0,
-      "rust_prove_avg_seconds": 0.030523222,
-      "rust_verify_avg_seconds": 0.00036951366666666667,
-      "zig_over_rust_peak_rss_kb": 1.646264,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.895329,
-      "zig_over_rust_verify": 1.352228,
-      "zig_peak_rss_kb": 33136.0,
-      "zig_prove_avg_seconds": 0.027328333333333333,
-      "zig_verify_avg_seconds": 0.0004996666666666666
-    },
-    {
-      "example": "plonk",
-      "family": "barycentric_eval_at_point",
-      "rust_peak_rss_kb": 20672.0,
-      "rust_prove_avg_seconds": 0.06311295833333333,
-      "rust_verify_avg_seconds": 0.000207625,
-      "zig_over_rust_peak_rss_kb": 0.983746,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.250667,
-      "zig_over_rust_verify": 1.740317,
-      "zig_peak_rss_kb": 20336.0,
-      "zig_prove_avg_seconds": 0.015820333333333336,
-      "zig_verify_avg_seconds": 0.0003613333333333333
-    },
-    {
-      "example": "wide_fibonacci",
-      "family": "eval_at_point_by_folding",
-      "rust_peak_rss_kb": 57680.0,
-      "rust_prove_avg_seconds": 0.100878222,
-      "rust_verify_avg_seconds": 0.000646986,
-      "zig_over_rust_peak_rss_kb": 1.319279,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 1.239501,
-      "zig_over_rust_verify": 1.368396,
-      "zig_peak_rss_kb": 76096.0,
-      "zig_prove_avg_seconds": 0.12503866666666666,
-      "zig_verify_avg_seconds": 0.0008853333333333335
-    },
-    {
-      "example": "wide_fibonacci",
-      "family": "fft",
-      "rust_peak_rss_kb": 65248.0,
-      "rust_prove_avg_seconds": 0.10093155566666667,
-      "rust_verify_avg_seconds": 0.000626639,
-      "zig_over_rust_peak_rss_kb": 1.462482,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 1.245415,
-      "zig_over_rust_verify": 1.408573,
-      "zig_peak_rss_kb": 95424.0,
-      "zig_prove_avg_seconds": 0.12570166666666668,
-      "zig_verify_avg_seconds": 0.0008826666666666667
-    },
-    {
-      "example": "xor",
-      "family": "field",
-      "rust_peak_rss_kb": 133408.0,
-      "rust_prove_avg_seconds": 0.6153319863333334,
-      "rust_verify_avg_seconds": 0.00030243066666666666,
-      "zig_over_rust_peak_rss_kb": 0.835332,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.164731,
-      "zig_over_rust_verify": 1.894649,
-      "zig_peak_rss_kb": 111440.0,
-      "zig_prove_avg_seconds": 0.10136433333333333,
-      "zig_verify_avg_seconds": 0.000573
-    },
-    {
-      "example": "state_machine",
-      "family": "fri",
-      "rust_peak_rss_kb": 17168.0,
-      "rust_prove_avg_seconds": 0.062598792,
-      "rust_verify_avg_seconds": 0.00016530600000000002,
-      "zig_over_rust_peak_rss_kb": 0.934762,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.246645,
-      "zig_over_rust_verify": 1.738191,
-      "zig_peak_rss_kb": 16048.0,
-      "zig_prove_avg_seconds": 0.015439666666666666,
-      "zig_verify_avg_seconds": 0.0002873333333333334
-    },
-    {
-      "example": "state_machine",
-      "family": "lookups",
-      "rust_peak_rss_kb": 42896.0,
-      "rust_prove_avg_seconds": 0.13635586133333333,
-      "rust_verify_avg_seconds": 0.00023093066666666668,
-      "zig_over_rust_peak_rss_kb": 0.991794,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.212818,
-      "zig_over_rust_verify": 1.792746,
-      "zig_peak_rss_kb": 42544.0,
-      "zig_prove_avg_seconds": 0.029019000000000003,
-      "zig_verify_avg_seconds": 0.00041400000000000003
-    },
-    {
-      "example": "plonk",
-      "family": "merkle",
-      "rust_peak_rss_kb": 24448.0,
-      "rust_prove_avg_seconds": 0.06491413866666666,
-      "rust_verify_avg_seconds": 0.00020825,
-      "zig_over_rust_peak_rss_kb": 1.060209,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.245796,
-      "zig_over_rust_verify": 1.709484,
-      "zig_peak_rss_kb": 25920.0,
-      "zig_prove_avg_seconds": 0.015955666666666663,
-      "zig_verify_avg_seconds": 0.000356
-    },
-    {
-      "example": "state_machine",
-      "family": "prefix_sum",
-      "rust_peak_rss_kb": 16032.0,
-      "rust_prove_avg_seconds": 0.063004375,
-      "rust_verify_avg_seconds": 0.00017248600000000002,
-      "zig_over_rust_peak_rss_kb": 1.04491,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.243576,
-      "zig_over_rust_verify": 2.058138,
-      "zig_peak_rss_kb": 16752.0,
-      "zig_prove_avg_seconds": 0.015346333333333332,
-      "zig_verify_avg_seconds": 0.000355
-    },
-    {
-      "example": "plonk",
-      "family": "pcs",
-      "rust_peak_rss_kb": 18912.0,
-      "rust_prove_avg_seconds": 0.06291152766666668,
-      "rust_verify_avg_seconds": 0.00020626366666666668,
-      "zig_over_rust_peak_rss_kb": 1.058376,
-      "zig_over_rust_proof_wire_bytes": 1.0,
-      "zig_over_rust_prove": 0.258246,
-      "zig_over_rust_verify": 1.758267,
-      "zig_peak_rss_kb": 20016.0,
-      "zig_prove_avg_seconds": 0.01624666666666667,
-      "zig_verify_avg_seconds": 0.0003626666666666667
-    }
-  ],
-  "fib5000_flow": {
-    "rust_total_seconds": 1.8448,
-    "top_level_rows": [
-      {
-        "color_index": 0,
-        "id": "channel_and_scheme_init",
-        "label": "Channel and scheme init",
-        "rust_seconds": 0.000129,
-        "rust_share": 6.992627927146574e-05,
-        "zig_over_rust": 0.06201550387596899,
-        "zig_seconds": 8e-06,
-        "zig_share": 3.8866195349271065e-06
-      },
-      {
-        "color_index": 1,
-        "id": "preprocessed_commit",
-        "label": "Preprocessed commit",
-        "rust_seconds": 1.4e-05,
-        "rust_share": 7.588898525585429e-06,
-        "zig_over_rust": 1.2857142857142858,
-        "zig_seconds": 1.8e-05,
-        "zig_share": 8.74489395358599e-06
-      },
-      {
-        "color_index": 2,
-        "id": "trace_generation",
-        "label": "Trace generation",
-        "rust_seconds": 0.203798,
-        "rust_share": 0.1104715958369471,
-        "zig_over_rust": 0.28798614314173837,
-        "zig_seconds": 0.058691,
-        "zig_share": 0.028513698390550853
-      },
-      {
-        "color_index": 3,
-        "id": "main_trace_commit",
-        "label": "Main trace commit",
-        "rust_seconds": 0.946358,
-        "rust_share": 0.5129867736339982,
-        "zig_over_rust": 0.892005985050055,
-        "zig_seconds": 0.844157,
-        "zig_share": 0.4101146358431827
-      },
-      {
-        "color_index": 4,
-        "id": "statement_mix",
-        "label": "Statement mix",
-        "rust_seconds": 0.0,
-        "rust_share": 0.0,
-        "zig_over_rust": 0.0,
-        "zig_seconds": 0.0,
-        "zig_share": 0.0
-      },
-      {
-        "color_index": 5,
-        "id": "core_prove",
-        "label": "Core prove",
-        "rust_seconds": 0.692666,
-        "rust_share": 0.3754694275802255,
-        "zig_over_rust": 1.6658707082489972,
-        "zig_seconds": 1.153892,
-        "zig_share": 0.5605923985495136
-      },
-      {
-        "color_index": 6,
-        "id": "proof_wire_encode",
-        "label": "Proof wire encode",
-        "rust_seconds": 0.000689,
-        "rust_share": 0.00037348222029488293,
-        "zig_over_rust": 0.8287373004354136,
-        "zig_seconds": 0.000571,
-        "zig_share": 0.00027740746930542224
-      },
-      {
-        "color_index": 7,
-        "id": "artifact_write",
-        "label": "Artifact write",
-        "rust_seconds": 0.001146,
-        "rust_share": 0.0006212055507372074,
-        "zig_over_rust": 0.8787085514834206,
-        "zig_seconds": 0.001007,
-        "zig_share": 0.0004892282339589496
-      }
-    ],
-    "workload": "wide_fibonacci_fib5000",
-    "zig_core_prove": [
-      {
-        "id": "draw_random_coeff",
-        "label": "Draw random coefficient",
-        "seconds": 0.0,
-        "share": 0.0
-      },
-      {
-        "id": "composition_trace_extract",
-        "label": "Composition trace extract",
-        "seconds": 9e-06,
-        "share": 7.799845563057851e-06
-      },
-      {
-        "id": "composition_evaluation",
-        "label": "Composition evaluation",
-        "seconds": 0.000238,
-        "share": 0.00020626258266752986
-      },
-      {
-        "id": "composition_interpolate_and_split",
-        "label": "Composition interpolate and split",
-        "seconds": 0.000319,
-        "share": 0.0002764611927350505
-      },
-      {
-        "id": "composition_commit",
-        "label": "Composition commit",
-        "seconds": 0.004413,
-        "share": 0.0038245242744193667
-      },
-      {
-        "id": "oods_point_and_mask_points",
-        "label": "OODS point and mask points",
-        "seconds": 6.9e-05,
-        "share": 5.9798815983443526e-05
-      },
-      {
-        "id": "sampled_value_evaluation",
-        "label": "Sampled-value evaluation",
-        "seconds": 0.495228,
-        "share": 0.42918910205577926
-      },
-      {
-        "id": "sampled_value_channel_mix",
-        "label": "Sampled-value channel mix",
-        "seconds": 8.7e-05,
-        "share": 7.539850710955923e-05
-      },
-      {
-        "id": "fri_quotient_build",
-        "label": "FRI quotient build",
-        "seconds": 0.644055,
-        "share": 0.558169948235025
-      },
-      {
-        "id": "fri_commit",
-        "label": "FRI commit",
-        "seconds": 0.009155,
-        "share": 0.007934176236643848
-      },
-      {
-        "id": "proof_of_work",
-        "label": "Proof of work",
-        "seconds": 1e-06,
-        "share": 8.666495070064279e-07
-      },
-      {
-        "id": "fri_decommit",
-        "label": "FRI decommit",
-        "seconds": 6e-05,
-        "share": 5.1998970420385677e-05
-      },
-      {
-        "id": "trace_decommit",
-        "label": "Trace decommit",
-        "seconds": 0.000233,
-        "share": 0.0002019293351324977
-      },
-      {
-        "id": "constraint_check_and_assembly",
-        "label": "Constraint check and assembly",
-        "seconds": 2e-06,
-        "share": 1.7332990140128559e-06
-      }
-    ],
-    "zig_main_trace_commit": [
-      {
-        "id": "interpolate_columns",
-        "label": "Interpolate columns",
-        "seconds": 0.149018,
-        "share": 0.17652898279464935
-      },
-      {
-        "id": "evaluate_extended_domain",
-        "label": "Evaluate extended domain",
-        "seconds": 0.315115,
-        "share": 0.3732900080079985
-      },
-      {
-        "id": "merkle_commit",
-        "label": "Merkle commit",
-        "seconds": 0.380023,
-        "share": 0.45018100919735216
-      }
-    ],
-    "zig_total_seconds": 2.058344
-  },
-  "schema_version": 3,
-  "sources": {
-    "examples_report": "vectors/reports/benchmark_contrast_long_report.json",
-    "families_report": "vectors/reports/benchmark_full_report.json"
-  },
-  "summaries": {
-    "examples": {
-      "avg_zig_over_rust_peak_rss_kb": 1.195401,
-      "avg_zig_over_rust_prove": 0.921442,
-      "avg_zig_over_rust_verify": 1.043092,
-      "failure_count": 0,
-      "max_zig_over_rust_peak_rss_kb": 1.512887,
-      "max_zig_over_rust_prove": 1.226936,
-      "max_zig_over_rust_verify": 1.370933,
-      "workloads": 12
-    },
-    "families": {
-      "avg_zig_over_rust_peak_rss_kb": 1.115161,
-      "avg_zig_over_rust_prove": 0.471824,
-      "avg_zig_over_rust_verify": 1.681989,
-      "failure_count": 0,
-      "families": 11,
-      "max_zig_over_rust_peak_rss_kb": 1.646264,
-      "max_zig_over_rust_prove": 1.245415,
-      "max_zig_over_rust_verify": 2.058138
-    }
-  }
-};
+window.BENCHMARK_PAGE_DATA = {"schema_version":3,"sources":{"families_report":"vectors/reports/benchmark_full_report.json","examples_report":"vectors/reports/benchmark_contrast_long_report.json"},"summaries":{"families":{"avg_zig_over_rust_peak_rss_kb":1.115161,"avg_zig_over_rust_prove":0.471824,"avg_zig_over_rust_verify":1.681989,"failure_count":0,"families":11,"max_zig_over_rust_peak_rss_kb":1.646264,"max_zig_over_rust_prove":1.245415,"max_zig_over_rust_verify":2.058138},"examples":{"avg_zig_over_rust_peak_rss_kb":1.195401,"avg_zig_over_rust_prove":0.921442,"avg_zig_over_rust_verify":1.043092,"failure_count":0,"max_zig_over_rust_peak_rss_kb":1.512887,"max_zig_over_rust_prove":1.226936,"max_zig_over_rust_verify":1.370933,"workloads":12}},"fib5000_flow":{"workload":"wide_fibonacci_fib5000","rust_total_seconds":1.8448,"zig_total_seconds":2.058344,"top_level_rows":[{"id":"channel_and_scheme_init","label":"Channel and scheme init","color_index":0,"rust_seconds":0.000129,"rust_share":6.992627927146574e-05,"zig_seconds":8e-06,"zig_share":3.8866195349271065e-06,"zig_over_rust":0.06201550387596899},{"id":"preprocessed_commit","label":"Preprocessed commit","color_index":1,"rust_seconds":1.4e-05,"rust_share":7.588898525585429e-06,"zig_seconds":1.8e-05,"zig_share":8.74489395358599e-06,"zig_over_rust":1.2857142857142858},{"id":"trace_generation","label":"Trace generation","color_index":2,"rust_seconds":0.203798,"rust_share":0.1104715958369471,"zig_seconds":0.058691,"zig_share":0.028513698390550853,"zig_over_rust":0.28798614314173837},{"id":"main_trace_commit","label":"Main trace commit","color_index":3,"rust_seconds":0.946358,"rust_share":0.5129867736339982,"zig_seconds":0.844157,"zig_share":0.4101146358431827,"zig_over_rust":0.892005985050055},{"id":"statement_mix","label":"Statement mix","color_index":4,"rust_seconds":0.0,"rust_share":0.0,"zig_seconds":0.0,"zig_share":0.0,"zig_over_rust":0.0},{"id":"core_prove","label":"Core prove","color_index":5,"rust_seconds":0.692666,"rust_share":0.3754694275802255,"zig_seconds":1.153892,"zig_share":0.5605923985495136,"zig_over_rust":1.6658707082489972},{"id":"proof_wire_encode","label":"Proof wire encode","color_index":6,"rust_seconds":0.000689,"rust_share":0.00037348222029488293,"zig_seconds":0.000571,"zig_share":0.00027740746930542224,"zig_over_rust":0.8287373004354136},{"id":"artifact_write","label":"Artifact write","color_index":7,"rust_seconds":0.001146,"rust_share":0.0006212055507372074,"zig_seconds":0.001007,"zig_share":0.0004892282339589496,"zig_over_rust":0.8787085514834206}],"zig_main_trace_commit":[{"id":"interpolate_columns","label":"Interpolate columns","seconds":0.149018,"share":0.17652898279464935},{"id":"evaluate_extended_domain","label":"Evaluate extended domain","seconds":0.315115,"share":0.3732900080079985},{"id":"merkle_commit","label":"Merkle commit","seconds":0.380023,"share":0.45018100919735216}],"zig_core_prove":[{"id":"draw_random_coeff","label":"Draw random coefficient","seconds":0.0,"share":0.0},{"id":"composition_trace_extract","label":"Composition trace extract","seconds":9e-06,"share":7.799845563057853e-06},{"id":"composition_evaluation","label":"Composition evaluation","seconds":0.000238,"share":0.0002062625826675299},{"id":"composition_interpolate_and_split","label":"Composition interpolate and split","seconds":0.000319,"share":0.00027646119273505056},{"id":"composition_commit","label":"Composition commit","seconds":0.004413,"share":0.003824524274419367},{"id":"oods_point_and_mask_points","label":"OODS point and mask points","seconds":6.9e-05,"share":5.979881598344353e-05},{"id":"sampled_value_evaluation","label":"Sampled-value evaluation","seconds":0.495228,"share":0.42918910205577937},{"id":"sampled_value_channel_mix","label":"Sampled-value channel mix","seconds":8.7e-05,"share":7.539850710955925e-05},{"id":"fri_quotient_build","label":"FRI quotient build","seconds":0.644055,"share":0.5581699482350251},{"id":"fri_commit","label":"FRI commit","seconds":0.009155,"share":0.00793417623664385},{"id":"proof_of_work","label":"Proof of work","seconds":1e-06,"share":8.66649507006428e-07},{"id":"fri_decommit","label":"FRI decommit","seconds":6e-05,"share":5.199897042038568e-05},{"id":"trace_decommit","label":"Trace decommit","seconds":0.000233,"share":0.00020192933513249773},{"id":"constraint_check_and_assembly","label":"Constraint check and assembly","seconds":2e-06,"share":1.733299014012856e-06}]},"family_rows":[{"family":"bit_rev","example":"xor","zig_over_rust_prove":0.187335,"zig_over_rust_verify":1.680891,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":0.929615,"rust_prove_avg_seconds":0.2856725136666667,"rust_verify_avg_seconds":0.0002659303333333333,"zig_prove_avg_seconds":0.05351633333333333,"zig_verify_avg_seconds":0.00044699999999999997,"rust_peak_rss_kb":60240.0,"zig_peak_rss_kb":56000.0},{"family":"eval_at_point","example":"wide_fibonacci","zig_over_rust_prove":0.895329,"zig_over_rust_verify":1.352228,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.646264,"rust_prove_avg_seconds":0.030523222,"rust_verify_avg_seconds":0.00036951366666666667,"zig_prove_avg_seconds":0.027328333333333333,"zig_verify_avg_seconds":0.0004996666666666666,"rust_peak_rss_kb":20128.0,"zig_peak_rss_kb":33136.0},{"family":"barycentric_eval_at_point","example":"plonk","zig_over_rust_prove":0.250667,"zig_over_rust_verify":1.740317,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":0.983746,"rust_prove_avg_seconds":0.06311295833333333,"rust_verify_avg_seconds":0.000207625,"zig_prove_avg_seconds":0.015820333333333336,"zig_verify_avg_seconds":0.0003613333333333333,"rust_peak_rss_kb":20672.0,"zig_peak_rss_kb":20336.0},{"family":"eval_at_point_by_folding","example":"wide_fibonacci","zig_over_rust_prove":1.239501,"zig_over_rust_verify":1.368396,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.319279,"rust_prove_avg_seconds":0.100878222,"rust_verify_avg_seconds":0.000646986,"zig_prove_avg_seconds":0.12503866666666666,"zig_verify_avg_seconds":0.0008853333333333335,"rust_peak_rss_kb":57680.0,"zig_peak_rss_kb":76096.0},{"family":"fft","example":"wide_fibonacci","zig_over_rust_prove":1.245415,"zig_over_rust_verify":1.408573,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.462482,"rust_prove_avg_seconds":0.10093155566666667,"rust_verify_avg_seconds":0.000626639,"zig_prove_avg_seconds":0.12570166666666668,"zig_verify_avg_seconds":0.0008826666666666667,"rust_peak_rss_kb":65248.0,"zig_peak_rss_kb":95424.0},{"family":"field","example":"xor","zig_over_rust_prove":0.164731,"zig_over_rust_verify":1.894649,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":0.835332,"rust_prove_avg_seconds":0.6153319863333334,"rust_verify_avg_seconds":0.00030243066666666666,"zig_prove_avg_seconds":0.10136433333333333,"zig_verify_avg_seconds":0.000573,"rust_peak_rss_kb":133408.0,"zig_peak_rss_kb":111440.0},{"family":"fri","example":"state_machine","zig_over_rust_prove":0.246645,"zig_over_rust_verify":1.738191,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":0.934762,"rust_prove_avg_seconds":0.062598792,"rust_verify_avg_seconds":0.00016530600000000002,"zig_prove_avg_seconds":0.015439666666666666,"zig_verify_avg_seconds":0.0002873333333333334,"rust_peak_rss_kb":17168.0,"zig_peak_rss_kb":16048.0},{"family":"lookups","example":"state_machine","zig_over_rust_prove":0.212818,"zig_over_rust_verify":1.792746,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":0.991794,"rust_prove_avg_seconds":0.13635586133333333,"rust_verify_avg_seconds":0.00023093066666666668,"zig_prove_avg_seconds":0.029019000000000003,"zig_verify_avg_seconds":0.00041400000000000003,"rust_peak_rss_kb":42896.0,"zig_peak_rss_kb":42544.0},{"family":"merkle","example":"plonk","zig_over_rust_prove":0.245796,"zig_over_rust_verify":1.709484,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.060209,"rust_prove_avg_seconds":0.06491413866666666,"rust_verify_avg_seconds":0.00020825,"zig_prove_avg_seconds":0.015955666666666663,"zig_verify_avg_seconds":0.000356,"rust_peak_rss_kb":24448.0,"zig_peak_rss_kb":25920.0},{"family":"prefix_sum","example":"state_machine","zig_over_rust_prove":0.243576,"zig_over_rust_verify":2.058138,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.04491,"rust_prove_avg_seconds":0.063004375,"rust_verify_avg_seconds":0.00017248600000000002,"zig_prove_avg_seconds":0.015346333333333332,"zig_verify_avg_seconds":0.000355,"rust_peak_rss_kb":16032.0,"zig_peak_rss_kb":16752.0},{"family":"pcs","example":"plonk","zig_over_rust_prove":0.258246,"zig_over_rust_verify":1.758267,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.058376,"rust_prove_avg_seconds":0.06291152766666668,"rust_verify_avg_seconds":0.00020626366666666668,"zig_prove_avg_seconds":0.01624666666666667,"zig_verify_avg_seconds":0.0003626666666666667,"rust_peak_rss_kb":18912.0,"zig_peak_rss_kb":20016.0}],"example_rows":[{"name":"state_machine_default","example":"state_machine","zig_over_rust_prove":0.813073,"zig_over_rust_verify":0.975775,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":0.864,"rust_prove_avg_seconds":0.004039,"rust_verify_avg_seconds":0.003096,"zig_prove_avg_seconds":0.003284,"zig_verify_avg_seconds":0.003021,"rust_prove_rss_peak_kb":2000.0,"zig_prove_rss_peak_kb":1728.0,"rust_verify_rss_peak_kb":1936.0,"zig_verify_rss_peak_kb":1616.0},{"name":"state_machine_medium","example":"state_machine","zig_over_rust_prove":0.784759,"zig_over_rust_verify":0.909311,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":0.8518518518518519,"rust_prove_avg_seconds":0.00374,"rust_verify_avg_seconds":0.002889,"zig_prove_avg_seconds":0.002935,"zig_verify_avg_seconds":0.002627,"rust_prove_rss_peak_kb":2160.0,"zig_prove_rss_peak_kb":1840.0,"rust_verify_rss_peak_kb":1904.0,"zig_verify_rss_peak_kb":1600.0},{"name":"poseidon_large","example":"poseidon","zig_over_rust_prove":0.945997,"zig_over_rust_verify":0.970437,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.1353591160220995,"rust_prove_avg_seconds":0.012814,"rust_verify_avg_seconds":0.004465,"zig_prove_avg_seconds":0.012122,"zig_verify_avg_seconds":0.004333,"rust_prove_rss_peak_kb":5792.0,"zig_prove_rss_peak_kb":6576.0,"rust_verify_rss_peak_kb":3184.0,"zig_verify_rss_peak_kb":2768.0},{"name":"blake_large","example":"blake","zig_over_rust_prove":0.980014,"zig_over_rust_verify":1.092176,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.3150470219435737,"rust_prove_avg_seconds":0.02777,"rust_verify_avg_seconds":0.003732,"zig_prove_avg_seconds":0.027215,"zig_verify_avg_seconds":0.004076,"rust_prove_rss_peak_kb":10208.0,"zig_prove_rss_peak_kb":13424.0,"rust_verify_rss_peak_kb":2960.0,"zig_verify_rss_peak_kb":2544.0},{"name":"wide_fibonacci_fib100","example":"wide_fibonacci","zig_over_rust_prove":0.654674,"zig_over_rust_verify":1.031884,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.236180904522613,"rust_prove_avg_seconds":0.011563,"rust_verify_avg_seconds":0.003105,"zig_prove_avg_seconds":0.00757,"zig_verify_avg_seconds":0.003204,"rust_prove_rss_peak_kb":3184.0,"zig_prove_rss_peak_kb":3936.0,"rust_verify_rss_peak_kb":2064.0,"zig_verify_rss_peak_kb":1904.0},{"name":"wide_fibonacci_fib500","example":"wide_fibonacci","zig_over_rust_prove":0.913071,"zig_over_rust_verify":0.987574,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.3632218844984803,"rust_prove_avg_seconds":0.03504,"rust_verify_avg_seconds":0.003702,"zig_prove_avg_seconds":0.031994,"zig_verify_avg_seconds":0.003656,"rust_prove_rss_peak_kb":10528.0,"zig_prove_rss_peak_kb":14352.0,"rust_verify_rss_peak_kb":2544.0,"zig_verify_rss_peak_kb":2368.0},{"name":"wide_fibonacci_fib1000","example":"wide_fibonacci","zig_over_rust_prove":1.226936,"zig_over_rust_verify":0.939808,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.5128865979381443,"rust_prove_avg_seconds":0.106713,"rust_verify_avg_seconds":0.004469,"zig_prove_avg_seconds":0.13093,"zig_verify_avg_seconds":0.0042,"rust_prove_rss_peak_kb":31040.0,"zig_prove_rss_peak_kb":46960.0,"rust_verify_rss_peak_kb":3168.0,"zig_verify_rss_peak_kb":2864.0},{"name":"plonk_large","example":"plonk","zig_over_rust_prove":0.302196,"zig_over_rust_verify":1.004693,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.1554160125588697,"rust_prove_avg_seconds":0.067036,"rust_verify_avg_seconds":0.003409,"zig_prove_avg_seconds":0.020258,"zig_verify_avg_seconds":0.003425,"rust_prove_rss_peak_kb":10192.0,"zig_prove_rss_peak_kb":11776.0,"rust_verify_rss_peak_kb":2192.0,"zig_verify_rss_peak_kb":1760.0},{"name":"poseidon_deep","example":"poseidon","zig_over_rust_prove":1.073041,"zig_over_rust_verify":1.370933,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.3577863577863578,"rust_prove_avg_seconds":0.035035,"rust_verify_avg_seconds":0.004211,"zig_prove_avg_seconds":0.037594,"zig_verify_avg_seconds":0.005773,"rust_prove_rss_peak_kb":12432.0,"zig_prove_rss_peak_kb":16880.0,"rust_verify_rss_peak_kb":3232.0,"zig_verify_rss_peak_kb":3056.0},{"name":"blake_deep","example":"blake","zig_over_rust_prove":1.20757,"zig_over_rust_verify":1.067077,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.0266864343958488,"rust_prove_avg_seconds":0.150913,"rust_verify_avg_seconds":0.004711,"zig_prove_avg_seconds":0.182238,"zig_verify_avg_seconds":0.005027,"rust_prove_rss_peak_kb":43168.0,"zig_prove_rss_peak_kb":44320.0,"rust_verify_rss_peak_kb":4176.0,"zig_verify_rss_peak_kb":3568.0},{"name":"wide_fibonacci_fib2000","example":"wide_fibonacci","zig_over_rust_prove":1.03802,"zig_over_rust_verify":1.088145,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.1600964021346187,"rust_prove_avg_seconds":0.391137,"rust_verify_avg_seconds":0.004867,"zig_prove_avg_seconds":0.406008,"zig_verify_avg_seconds":0.005296,"rust_prove_rss_peak_kb":92944.0,"zig_prove_rss_peak_kb":107824.0,"rust_verify_rss_peak_kb":4736.0,"zig_verify_rss_peak_kb":3824.0},{"name":"wide_fibonacci_fib5000","example":"wide_fibonacci","zig_over_rust_prove":1.117953,"zig_over_rust_verify":1.079288,"zig_over_rust_proof_wire_bytes":1.0,"zig_over_rust_peak_rss_kb":1.366284124500087,"rust_prove_avg_seconds":1.855803,"rust_verify_avg_seconds":0.007807,"zig_prove_avg_seconds":2.0747,"zig_verify_avg_seconds":0.008426,"rust_prove_rss_peak_kb":368064.0,"zig_prove_rss_peak_kb":502880.0,"rust_verify_rss_peak_kb":8304.0,"zig_verify_rss_peak_kb":7248.0}]};
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Report and build helpers shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+
+ROOT = Path(__file__).resolve().parent.parent
+PERF_EVENTS = ("cycles", "instructions", "task-clock", "cache-misses")
+
+
+def loads_json(raw: bytes | str) -> Any:
+    # orjson only speeds up parsing. It rejects the Infinity token stdlib json
+    # writes for infinite ratios, so those inputs fall back to json.loads.
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def write_json_report(path: Path, report: dict[str, Any]) -> None:
+    # Stream the encoder's chunks through a 1 MiB buffer instead of building the
+    # full report string (and its encoded copy) in memory first.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as fp:
+        json.dump(report, fp, indent=2, sort_keys=True)
+        fp.write("\n")
+
+
+def publish_latest(report: Path, latest: Path) -> None:
+    # Point `latest` at the report without copying its bytes: hard-link into a
+    # temp name and atomically rename over the old pointer. Copy only when the
+    # filesystem cannot link (e.g. cross-device). The two names share an inode,
+    # so the latest_ file must be treated as read-only.
+    staging = latest.with_name(latest.name + ".tmp")
+    staging.unlink(missing_ok=True)
+    try:
+        os.link(report, staging)
+    except OSError:
+        shutil.copyfile(report, staging)
+    os.replace(staging, latest)
+
+
+def append_ndjson(fp: Any, lock: threading.Lock, record: dict[str, Any]) -> None:
+    # One durable line per record: a crash later in the run cannot lose it.
+    line = json.dumps(record, sort_keys=True) + "\n"
+    with lock:
+        fp.write(line)
+        fp.flush()
+        os.fsync(fp.fileno())
+
+
+def toolchain_version(cmd: list[str]) -> bytes:
+    # A missing toolchain leaves the key empty; the build itself reports it.
+    try:
+        proc = subprocess.run(cmd, cwd=ROOT, capture_output=True)
+    except OSError:
+        return b""
+    return proc.stdout.strip() if proc.returncode == 0 else b""
+
+
+def build_stamp(cmd: list[str], source_root: Path, toolchain_version_cmd: list[str]) -> str:
+    # Freshness key: the build command, the compiler version and the path and
+    # contents of every source file (Cargo's `target/` output tree excluded).
+    # Content hashing keeps stamps valid across checkouts that only touch mtimes.
+    hasher = hashlib.blake2b(digest_size=32)
+    hasher.update("\0".join(cmd).encode("utf-8"))
+    hasher.update(b"\0" + toolchain_version(toolchain_version_cmd))
+    for dirpath, dirnames, filenames in os.walk(source_root):
+        dirnames[:] = sorted(name for name in dirnames if name != "target")
+        for name in sorted(filenames):
+            path = Path(dirpath) / name
+            content = path.read_bytes()
+            hasher.update(f"\n{path.relative_to(source_root)}:{len(content)}:".encode("utf-8"))
+            hasher.update(content)
+    return hasher.hexdigest()
+
+
+def stamp_path(binary: Path) -> Path:
+    return binary.with_name(binary.name + ".build_stamp")
+
+
+def build_if_stale(
+    *,
+    label: str,
+    cmd: list[str],
+    binary: Path,
+    source_root: Path,
+    toolchain_version_cmd: list[str],
+    force_rebuild: bool,
+    env: dict[str, str] | None = None,
+) -> None:
+    stamp = build_stamp(cmd, source_root, toolchain_version_cmd)
+    stamp_file = stamp_path(binary)
+    if (
+        not force_rebuild
+        and binary.exists()
+        and stamp_file.exists()
+        and stamp_file.read_text(encoding="utf-8").strip() == stamp
+    ):
+        return
+    build_env = {**os.environ, **env} if env else None
+    proc = subprocess.run(cmd, cwd=ROOT, env=build_env, capture_output=True)
+    if proc.returncode != 0:
+        stderr = proc.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(f"{label} benchmark binary build failed:\n{stderr}")
+    stamp_file.write_text(stamp + "\n", encoding="utf-8")
+
+
+def split_cpu_groups(jobs: int) -> list[list[int]] | None:
+    # Disjoint CPU sets, one per concurrent job, carved out of the CPUs this
+    # process may run on (respects cgroup/affinity limits).
+    if jobs <= 1:
+        return None
+    if shutil.which("taskset") is None:
+        print("warning: taskset not found; concurrent jobs share all CPUs", file=sys.stderr)
+        return None
+    try:
+        cpus = sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = list(range(os.cpu_count() or 1))
+    per_group = len(cpus) // jobs
+    if per_group == 0:
+        print(f"warning: {len(cpus)} CPUs cannot give {jobs} jobs a core each; not pinning", file=sys.stderr)
+        return None
+    return [cpus[slot * per_group : (slot + 1) * per_group] for slot in range(jobs)]
+
+
+def bench_prefix(cpus: str | None, perf_out: Path | None) -> list[str]:
+    # Optional wrappers for bench binary invocations (never builds): CPU pinning
+    # to a taskset cpu list and hardware counters written as CSV to `perf_out`.
+    # Tools resolve to absolute paths so subprocess can take the posix_spawn path.
+    prefix: list[str] = []
+    if cpus is not None:
+        prefix.extend([str(shutil.which("taskset")), "-c", cpus])
+    if perf_out is not None:
+        prefix.extend(
+            [str(shutil.which("perf")), "stat", "-x,", "-o", str(perf_out), "-e", ",".join(PERF_EVENTS), "--"]
+        )
+    return prefix
+
+
+def parse_perf_stat(text: str) -> dict[str, Any]:
+    # `perf stat -x,` rows are `value,unit,event,...`; events may carry a
+    # modifier suffix (`cycles:u`) and unsupported counters report `<...>`.
+    counters: dict[str, float] = {}
+    for line in text.splitlines():
+        fields = line.split(",")
+        if line.startswith("#") or len(fields) < 3:
+            continue
+        event = fields[2].split(":")[0]
+        try:
+            counters[event] = float(fields[0])
+        except ValueError:
+            continue
+    stats: dict[str, Any] = {}
+    for event in ("cycles", "instructions", "cache-misses"):
+        if event in counters:
+            stats[event.replace("-", "_")] = int(counters[event])
+    if "task-clock" in counters:
+        stats["task_clock_ms"] = round(counters["task-clock"], 3)
+    if stats.get("cycles"):
+        stats["ipc"] = round(stats.get("instructions", 0) / stats["cycles"], 6)
+    return stats
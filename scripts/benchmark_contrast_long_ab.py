@@ -4,10 +4,13 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+
+from bench_io import loads_json
 
 
 ROOT = Path(__file__).resolve().parent.parent
@@ -15,7 +18,7 @@ DEFAULT_OUT = ROOT / "vectors" / "reports" / "benchmark_contrast_long_ab_decisio
 
 
 def load(path: Path) -> Dict[str, Any]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = loads_json(path.read_bytes())
     if not isinstance(payload, dict):
         raise RuntimeError(f"invalid report payload: {path}")
     return payload
@@ -27,25 +30,34 @@ def ratio_delta_pct(current: float, baseline: float) -> float:
     return ((current / baseline) - 1.0) * 100.0
 
 
+PROVE_KEY = "zig_over_rust_prove"
+RSS_KEY = "zig_over_rust_peak_rss_kb"
+
+
+def load_workload_ratios(path: Path) -> Dict[str, Tuple[float, float]]:
+    # Workload entries also carry full Rust/Zig payloads; project them away right
+    # after parsing so only (prove, rss) ratio pairs stay alive for the comparison.
+    report = load(path)
+    return {
+        str(workload["name"]): (
+            float(workload["ratios"][PROVE_KEY]),
+            float(workload["ratios"][RSS_KEY]),
+        )
+        for workload in report["workloads"]
+    }
+
+
 def rows_for_comparison(
-    baseline_workloads: Dict[str, Dict[str, Any]],
-    candidate_workloads: Dict[str, Dict[str, Any]],
-    *,
-    prove_key: str,
-    rss_key: str,
+    baseline_workloads: Dict[str, Tuple[float, float]],
+    candidate_workloads: Dict[str, Tuple[float, float]],
 ) -> List[Dict[str, Any]]:
     rows: List[Dict[str, Any]] = []
     for name in sorted(baseline_workloads):
         if name not in candidate_workloads:
             raise RuntimeError(f"candidate report missing workload: {name}")
 
-        baseline_ratios = baseline_workloads[name]["ratios"]
-        candidate_ratios = candidate_workloads[name]["ratios"]
-
-        baseline_prove = float(baseline_ratios[prove_key])
-        baseline_rss = float(baseline_ratios[rss_key])
-        candidate_prove = float(candidate_ratios[prove_key])
-        candidate_rss = float(candidate_ratios[rss_key])
+        baseline_prove, baseline_rss = baseline_workloads[name]
+        candidate_prove, candidate_rss = candidate_workloads[name]
 
         rows.append(
             {
@@ -84,6 +96,7 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+@functools.lru_cache(maxsize=None)
 def rel(path: Path) -> str:
     try:
         return str(path.relative_to(ROOT))
@@ -94,33 +107,18 @@ def rel(path: Path) -> str:
 def main() -> int:
     args = parse_args()
 
-    no_reuse = load(args.no_reuse_report)
-    reuse = load(args.reuse_report)
-    json_codec = load(args.json_codec_report)
-    binary_codec = load(args.binary_codec_report)
-
-    no_reuse_workloads = {w["name"]: w for w in no_reuse["workloads"]}
-    reuse_workloads = {w["name"]: w for w in reuse["workloads"]}
-    json_workloads = {w["name"]: w for w in json_codec["workloads"]}
-    binary_workloads = {w["name"]: w for w in binary_codec["workloads"]}
+    no_reuse_workloads = load_workload_ratios(args.no_reuse_report)
+    reuse_workloads = load_workload_ratios(args.reuse_report)
+    json_workloads = load_workload_ratios(args.json_codec_report)
+    binary_workloads = load_workload_ratios(args.binary_codec_report)
 
-    if sorted(no_reuse_workloads) != sorted(reuse_workloads):
+    if no_reuse_workloads.keys() != reuse_workloads.keys():
         raise RuntimeError("reuse and no-reuse reports use different workload sets")
-    if sorted(json_workloads) != sorted(binary_workloads):
+    if json_workloads.keys() != binary_workloads.keys():
         raise RuntimeError("json and binary codec reports use different workload sets")
 
-    reuse_rows = rows_for_comparison(
-        no_reuse_workloads,
-        reuse_workloads,
-        prove_key="zig_over_rust_prove",
-        rss_key="zig_over_rust_peak_rss_kb",
-    )
-    codec_rows = rows_for_comparison(
-        json_workloads,
-        binary_workloads,
-        prove_key="zig_over_rust_prove",
-        rss_key="zig_over_rust_peak_rss_kb",
-    )
+    reuse_rows = rows_for_comparison(no_reuse_workloads, reuse_workloads)
+    codec_rows = rows_for_comparison(json_workloads, binary_workloads)
 
     deep_long = {
         "blake_deep",
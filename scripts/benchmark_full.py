@@ -4,29 +4,57 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
 import os
-import re
+import queue
 import sys
 import shutil
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from bench_io import (
+    append_ndjson,
+    bench_prefix,
+    build_if_stale,
+    loads_json,
+    parse_perf_stat,
+    publish_latest,
+    split_cpu_groups,
+    write_json_report,
+)
+
 
 ROOT = Path(__file__).resolve().parent.parent
 REPORT_DEFAULT = ROOT / "vectors" / "reports" / "benchmark_full_report.json"
 ARTIFACT_DIR = ROOT / "vectors" / ".bench_full_artifacts"
+# Per user and per checkout, so concurrent runs from different users or
+# worktrees never share (or fail to open) each other's artifact directory.
+TMPFS_ARTIFACT_DIR = Path("/dev/shm") / (
+    f"stwo_bench-{os.getuid()}-{hashlib.blake2b(str(ROOT).encode('utf-8'), digest_size=6).hexdigest()}"
+)
 
 RUST_MANIFEST = ROOT / "tools" / "stwo-interop-rs" / "Cargo.toml"
 RUST_BIN = ROOT / "tools" / "stwo-interop-rs" / "target" / "release" / "stwo-interop-rs"
 ZIG_BIN = ROOT / "vectors" / ".bench_full.zig_interop"
+RUST_SOURCE_ROOT = RUST_MANIFEST.parent
+ZIG_SOURCE_ROOT = ROOT / "src"
 
 RUST_TOOLCHAIN_DEFAULT = "nightly-2025-07-14"
 SUPPORTED_BENCH_PROOF_CODECS = ("json", "binary")
 FAMILY_RUNNER = ROOT / "src" / "bench" / "full_runner.zig"
 TIME_BIN = Path("/usr/bin/time")
-RSS_RE = re.compile(r"^\s*(\d+)\s+maximum resident set size\s*$", re.MULTILINE)
+# Probed once: run_timed sits on the per-sample path and the answer cannot
+# change during a run.
+HAS_TIME_BIN = TIME_BIN.exists()
+RSS_MARKER = b"maximum resident set size"
+# Only the tail of a child's stderr is kept for failure diagnostics.
+STDERR_TAIL_LINES = 200
 
 UPSTREAM_FAMILIES = (
     "bit_rev",
@@ -42,6 +70,18 @@ UPSTREAM_FAMILIES = (
     "pcs",
 )
 
+# Proof-of-work/FRI config shared by every family workload.
+FRI_BASE_ARGS = (
+    "--pow-bits",
+    "0",
+    "--fri-log-blowup",
+    "1",
+    "--fri-log-last-layer",
+    "0",
+    "--fri-n-queries",
+    "3",
+)
+
 # Deterministic workload mapping for the upstream family names.
 # Each family keeps a stable config but spreads across multiple example surfaces
 # (`state_machine`, `xor`, `wide_fibonacci`, `plonk`) for better hotspot contrast.
@@ -49,14 +89,7 @@ WORKLOADS: dict[str, dict[str, Any]] = {
     "bit_rev": {
         "example": "xor",
         "args": [
-            "--pow-bits",
-            "0",
-            "--fri-log-blowup",
-            "1",
-            "--fri-log-last-layer",
-            "0",
-            "--fri-n-queries",
-            "3",
+            *FRI_BASE_ARGS,
             "--xor-log-size",
             "14",
             "--xor-log-step",
@@ -70,14 +103,7 @@ WORKLOADS: dict[str, dict[str, Any]] = {
     "eval_at_point": {
         "example": "wide_fibonacci",
         "args": [
-            "--pow-bits",
-            "0",
-            "--fri-log-blowup",
-            "1",
-            "--fri-log-last-layer",
-            "0",
-            "--fri-n-queries",
-            "3",
+            *FRI_BASE_ARGS,
             "--wf-log-n-rows",
             "10",
             "--wf-sequence-len",
@@ -89,14 +115,7 @@ WORKLOADS: dict[str, dict[str, Any]] = {
     "barycentric_eval_at_point": {
         "example": "plonk",
         "args": [
-            "--pow-bits",
-            "0",
-            "--fri-log-blowup",
-            "1",
-            "--fri-log-last-layer",
-            "0",
-            "--fri-n-queries",
-            "3",
+            *FRI_BASE_ARGS,
             "--plonk-log-n-rows",
             "12",
         ],
@@ -106,14 +125,7 @@ WORKLOADS: dict[str, dict[str, Any]] = {
     "eval_at_point_by_folding": {
         "example": "wide_fibonacci",
         "args": [
-            "--pow-bits",
-            "0",
-            "--fri-log-blowup",
-            "1",
-            "--fri-log-last-layer",
-            "0",
-            "--fri-n-queries",
-            "3",
+            *FRI_BASE_ARGS,
             "--wf-log-n-rows",
             "11",
             "--wf-sequence-len",
@@ -125,14 +137,7 @@ WORKLOADS: dict[str, dict[str, Any]] = {
     "fft": {
         "example": "wide_fibonacci",
         "args": [
-            "--pow-bits",
-            "0",
-            "--fri-log-blowup",
-            "1",
-            "--fri-log-last-layer",
-            "0",
-            "--fri-n-queries",
-            "3",
+            *FRI_BASE_ARGS,
             "--wf-log-n-rows",
             "11",
             "--wf-sequence-len",
@@ -144,14 +149,7 @@ WORKLOADS: dict[str, dict[str, Any]] = {
     "field": {
         "example": "xor",
         "args": [
-            "--pow-bits",
-            "0",
-            "--fri-log-blowup",
-            "1",
-            "--fri-log-last-layer",
-            "0",
-            "--fri-n-queries",
-            "3",
+            *FRI_BASE_ARGS,
             "--xor-log-size",
             "15",
             "--xor-log-step",
@@ -165,14 +163,7 @@ WORKLOADS: dict[str, dict[str, Any]] = {
     "fri": {
         "example": "state_machine",
         "args": [
-            "--pow-bits",
-            "0",
-            "--fri-log-blowup",
-            "1",
-            "--fri-log-last-layer",
-            "0",
-            "--fri-n-queries",
-            "3",
+            *FRI_BASE_ARGS,
             "--sm-log-n-rows",
             "12",
             "--sm-initial-0",
@@ -186,14 +177,7 @@ WORKLOADS: dict[str, dict[str, Any]] = {
     "lookups": {
         "example": "state_machine",
         "args": [
-            "--pow-bits",
-            "0",
-            "--fri-log-blowup",
-            "1",
-            "--fri-log-last-layer",
-            "0",
-            "--fri-n-queries",
-            "3",
+            *FRI_BASE_ARGS,
             "--sm-log-n-rows",
             "13",
             "--sm-initial-0",
@@ -207,14 +191,7 @@ WORKLOADS: dict[str, dict[str, Any]] = {
     "merkle": {
         "example": "plonk",
         "args": [
-            "--pow-bits",
-            "0",
-            "--fri-log-blowup",
-            "1",
-            "--fri-log-last-layer",
-            "0",
-            "--fri-n-queries",
-            "3",
+            *FRI_BASE_ARGS,
             "--plonk-log-n-rows",
             "12",
         ],
@@ -224,14 +201,7 @@ WORKLOADS: dict[str, dict[str, Any]] = {
     "prefix_sum": {
         "example": "state_machine",
         "args": [
-            "--pow-bits",
-            "0",
-            "--fri-log-blowup",
-            "1",
-            "--fri-log-last-layer",
-            "0",
-            "--fri-n-queries",
-            "3",
+            *FRI_BASE_ARGS,
             "--sm-log-n-rows",
             "12",
             "--sm-initial-0",
@@ -245,14 +215,7 @@ WORKLOADS: dict[str, dict[str, Any]] = {
     "pcs": {
         "example": "plonk",
         "args": [
-            "--pow-bits",
-            "0",
-            "--fri-log-blowup",
-            "1",
-            "--fri-log-last-layer",
-            "0",
-            "--fri-n-queries",
-            "3",
+            *FRI_BASE_ARGS,
             "--plonk-log-n-rows",
             "12",
         ],
@@ -262,23 +225,101 @@ WORKLOADS: dict[str, dict[str, Any]] = {
 }
 
 
+def workload_bench_argv(workload: dict[str, Any]) -> tuple[str, ...]:
+    return (
+        "--example",
+        str(workload["example"]),
+        "--prove-mode",
+        str(workload["prove_mode"]),
+        "--include-all-preprocessed-columns",
+        str(workload["include_all_preprocessed_columns"]),
+        *(str(arg) for arg in workload["args"]),
+    )
+
+
+# Per-family bench flags are fixed for the whole run; stringify them once.
+WORKLOAD_BENCH_ARGV: dict[str, tuple[str, ...]] = {
+    family: workload_bench_argv(workload) for family, workload in WORKLOADS.items()
+}
+
+
+@functools.lru_cache(maxsize=None)
+def cached_env(extra_items: tuple[tuple[str, str], ...]) -> dict[str, str]:
+    env = dict(os.environ)
+    env.update(extra_items)
+    return env
+
+
 def merged_env(extra_env: dict[str, str] | None) -> dict[str, str] | None:
     if not extra_env:
         return None
-    env = dict(os.environ)
-    env.update(extra_env)
-    return env
+    # The same few Zig env overrides repeat for every family; copy os.environ
+    # once per distinct override set. Callers must treat the result as read-only.
+    return cached_env(tuple(sorted(extra_env.items())))
+
+
+def drain_stderr(stream: Any, tail: deque[bytes], rss: list[int]) -> None:
+    for line in stream:
+        if not rss:
+            marker = line.find(RSS_MARKER)
+            if marker >= 0:
+                raw_maxrss = line[:marker].strip()
+                if raw_maxrss.isdigit():
+                    rss.append(int(raw_maxrss))
+        tail.append(line)
 
 
-def run(cmd: list[str], env: dict[str, str] | None = None) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
+def run_streaming(
+    cmd: list[str],
+    env: dict[str, str] | None = None,
+    *,
+    bench_spawn: bool = False,
+) -> tuple[subprocess.CompletedProcess[bytes], list[int]]:
+    # Children may log heavily before their final JSON line, so output is never
+    # buffered whole: stdout keeps only its last non-empty line and stderr a
+    # bounded tail for failure messages (scanned for a max-RSS line on the way).
+    # Output stays bytes; the JSON payload is parsed straight from bytes and
+    # only failure messages are decoded.
+    stderr_tail: deque[bytes] = deque(maxlen=STDERR_TAIL_LINES)
+    rss: list[int] = []
+    last_stdout_line = b""
+    # CPython only launches through posix_spawn (instead of fork/vfork + exec)
+    # when cwd is unset and close_fds is off. Bench commands use absolute paths
+    # only, and fds Python creates are non-inheritable (PEP 446), so bench
+    # launches qualify; builds still need cwd=ROOT for their relative paths.
+    with subprocess.Popen(
         cmd,
-        cwd=ROOT,
-        text=True,
-        capture_output=True,
-        check=False,
+        cwd=None if bench_spawn else ROOT,
+        close_fds=not bench_spawn,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
         env=merged_env(env),
+    ) as child:
+        # Drain stderr on a side thread so neither pipe can fill up and block
+        # the child.
+        stderr_reader = threading.Thread(
+            target=drain_stderr,
+            args=(child.stderr, stderr_tail, rss),
+            daemon=True,
+        )
+        stderr_reader.start()
+        for line in child.stdout:
+            if line.strip():
+                last_stdout_line = line
+        stderr_reader.join()
+        returncode = child.wait()
+    proc = subprocess.CompletedProcess(
+        cmd,
+        returncode,
+        stdout=last_stdout_line,
+        stderr=b"".join(stderr_tail),
     )
+    return proc, rss
+
+
+def run(cmd: list[str], env: dict[str, str] | None = None) -> subprocess.CompletedProcess[bytes]:
+    proc, _ = run_streaming(cmd, env=env)
+    return proc
 
 
 def maxrss_to_kb(raw_maxrss: int) -> int:
@@ -291,20 +332,12 @@ def maxrss_to_kb(raw_maxrss: int) -> int:
 def run_timed(
     cmd: list[str],
     env: dict[str, str] | None = None,
-) -> tuple[subprocess.CompletedProcess[str], int | None]:
-    if TIME_BIN.exists():
-        proc = subprocess.run(
-            [str(TIME_BIN), "-l", *cmd],
-            cwd=ROOT,
-            text=True,
-            capture_output=True,
-            check=False,
-            env=merged_env(env),
-        )
-        match = RSS_RE.search(proc.stderr)
-        peak_rss_kb = maxrss_to_kb(int(match.group(1))) if match else None
+) -> tuple[subprocess.CompletedProcess[bytes], int | None]:
+    if HAS_TIME_BIN:
+        proc, rss = run_streaming([str(TIME_BIN), "-l", *cmd], env=env, bench_spawn=True)
+        peak_rss_kb = maxrss_to_kb(rss[0]) if rss else None
         return proc, peak_rss_kb
-    proc = run(cmd, env=env)
+    proc, _ = run_streaming(cmd, env=env, bench_spawn=True)
     return proc, None
 
 
@@ -312,41 +345,76 @@ def ratio(a: float, b: float) -> float:
     return a / b if b != 0.0 else float("inf")
 
 
-def parse_json_stdout(stdout: str) -> dict[str, Any]:
-    for line in reversed(stdout.splitlines()):
-        line = line.strip()
-        if not line:
-            continue
-        return json.loads(line)
+def summarize_ratios(families_report: list[dict[str, Any]], key: str) -> tuple[float, float]:
+    if not families_report:
+        return 0.0, 0.0
+    # One pass for both the max and the running total.
+    highest = total = families_report[0]["ratios"][key]
+    for entry in families_report[1:]:
+        value = entry["ratios"][key]
+        if value > highest:
+            highest = value
+        total += value
+    return highest, round(total / len(families_report), 6)
+
+
+def decode_output(raw: bytes) -> str:
+    return raw.decode("utf-8", errors="replace")
+
+
+def parse_json_stdout(stdout: bytes) -> dict[str, Any]:
+    # Scan backwards for the last non-empty line rather than splitting every log
+    # line the child printed before its final JSON payload.
+    end = len(stdout)
+    while end > 0:
+        start = stdout.rfind(b"\n", 0, end)
+        line = stdout[start + 1 : end].strip()
+        if line:
+            return loads_json(line)
+        end = start if start >= 0 else 0
     raise RuntimeError("missing JSON payload in command stdout")
 
 
-def ensure_binaries(rust_toolchain: str) -> None:
-    rust_build = run(
-        [
+def ensure_binaries(rust_toolchain: str, force_rebuild: bool = False) -> None:
+    # Route rustc through sccache when it is installed so dependency crates
+    # compiled by earlier runs (or other checkouts) are reused. An explicit
+    # RUSTC_WRAPPER in the environment wins. `zig build-exe` needs no wrapper:
+    # it already reuses the local Zig cache under the repo root.
+    rust_env: dict[str, str] | None = None
+    if "RUSTC_WRAPPER" not in os.environ and shutil.which("sccache"):
+        rust_env = {"RUSTC_WRAPPER": "sccache"}
+
+    build_if_stale(
+        label="rust",
+        cmd=[
             "cargo",
             f"+{rust_toolchain}",
             "build",
             "--release",
             "--manifest-path",
             str(RUST_MANIFEST),
-        ]
+        ],
+        binary=RUST_BIN,
+        source_root=RUST_SOURCE_ROOT,
+        toolchain_version_cmd=["rustc", f"+{rust_toolchain}", "--version"],
+        force_rebuild=force_rebuild,
+        env=rust_env,
     )
-    if rust_build.returncode != 0:
-        raise RuntimeError(f"rust benchmark binary build failed:\n{rust_build.stderr}")
-
-    zig_build = run(
-        [
+    build_if_stale(
+        label="zig",
+        cmd=[
             "zig",
             "build-exe",
             "src/interop_cli.zig",
             "-O",
             "ReleaseFast",
             "-femit-bin=" + str(ZIG_BIN),
-        ]
+        ],
+        binary=ZIG_BIN,
+        source_root=ZIG_SOURCE_ROOT,
+        toolchain_version_cmd=["zig", "version"],
+        force_rebuild=force_rebuild,
     )
-    if zig_build.returncode != 0:
-        raise RuntimeError(f"zig benchmark binary build failed:\n{zig_build.stderr}")
 
 
 def list_runner_families() -> tuple[str, ...]:
@@ -361,43 +429,74 @@ def list_runner_families() -> tuple[str, ...]:
         ]
     )
     if proc.returncode != 0:
-        raise RuntimeError(f"failed to read family list from runner:\n{proc.stderr}")
+        raise RuntimeError(f"failed to read family list from runner:\n{decode_output(proc.stderr)}")
     payload = parse_json_stdout(proc.stdout)
     if not isinstance(payload, list) or not all(isinstance(item, str) for item in payload):
         raise RuntimeError("invalid family payload from full_runner")
     return tuple(payload)
 
 
+def mount_fstype(path: Path) -> str | None:
+    # Filesystem type of the longest mount point containing `path` (Linux only).
+    try:
+        mounts = Path("/proc/self/mounts").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+    resolved = str(path.resolve())
+    best_point = ""
+    best_type: str | None = None
+    for line in mounts:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        point = fields[1]
+        inside = resolved == point or resolved.startswith(point.rstrip("/") + "/")
+        if inside and len(point) > len(best_point):
+            best_point = point
+            best_type = fields[2]
+    return best_type
+
+
+def default_artifact_dir() -> Path:
+    # Proof artifacts are written by every bench run but never read back here,
+    # so keep them in RAM when a writable tmpfs is available.
+    shm = TMPFS_ARTIFACT_DIR.parent
+    if sys.platform.startswith("linux") and shm.is_dir() and os.access(shm, os.W_OK):
+        if mount_fstype(shm) == "tmpfs":
+            return TMPFS_ARTIFACT_DIR
+    return ARTIFACT_DIR
+
+
 def bench_runtime(
     *,
     runtime: str,
     family: str,
-    workload: dict[str, Any],
+    artifact_dir: Path,
     warmups: int,
     repeats: int,
     zig_bench_proof_codec: str,
     merkle_workers: int | None,
     merkle_pool_reuse: bool,
+    cpus: str | None = None,
+    perf_stat: bool = False,
 ) -> dict[str, Any]:
-    artifact = ARTIFACT_DIR / f"{runtime}_{family}.json"
+    artifact = artifact_dir / f"{runtime}_{family}.json"
+    # Counters cover the whole bench process: warmups, repeats and verification.
+    perf_out = artifact_dir / f"{runtime}_{family}.perf.csv" if perf_stat else None
     binary = str(RUST_BIN if runtime == "rust" else ZIG_BIN)
     cmd = [
+        *bench_prefix(cpus, perf_out),
         binary,
         "--mode",
         "bench",
-        "--example",
-        str(workload["example"]),
         "--artifact",
         str(artifact),
-        "--prove-mode",
-        str(workload["prove_mode"]),
-        "--include-all-preprocessed-columns",
-        str(workload["include_all_preprocessed_columns"]),
         "--bench-warmups",
         str(warmups),
         "--bench-repeats",
         str(repeats),
-    ] + [str(arg) for arg in workload["args"]]
+        *WORKLOAD_BENCH_ARGV[family],
+    ]
     if runtime == "zig":
         cmd.extend(["--bench-proof-codec", zig_bench_proof_codec])
 
@@ -417,15 +516,112 @@ def bench_runtime(
         raise RuntimeError(
             f"{runtime} bench failed for family '{family}'\n"
             f"command: {' '.join(cmd)}\n"
-            f"stderr:\n{proc.stderr}"
+            f"stderr:\n{decode_output(proc.stderr)}"
         )
     payload = parse_json_stdout(proc.stdout)
     if not isinstance(payload, dict):
         raise RuntimeError(f"{runtime} bench payload for family '{family}' is not an object")
     payload["peak_rss_kb"] = peak_rss_kb
+    if perf_out is not None:
+        payload["perf_stat"] = parse_perf_stat(perf_out.read_text(encoding="utf-8"))
     return payload
 
 
+def bench_family(
+    family: str,
+    *,
+    artifact_dir: Path,
+    warmups: int,
+    repeats: int,
+    max_zig_over_rust: float,
+    zig_bench_proof_codec: str,
+    merkle_workers: int | None,
+    merkle_pool_reuse: bool,
+    runtime_pool: ThreadPoolExecutor | None,
+    pin_core: int | None = None,
+    perf_stat: bool = False,
+    cpu_group: list[int] | None = None,
+) -> tuple[dict[str, Any], list[str]]:
+    workload = WORKLOADS[family]
+    family_failures: list[str] = []
+    cpus: str | None = None
+    if cpu_group is not None:
+        cpus = ",".join(str(cpu) for cpu in cpu_group)
+    elif pin_core is not None:
+        cpus = str(pin_core)
+
+    def bench(runtime: str) -> dict[str, Any]:
+        return bench_runtime(
+            runtime=runtime,
+            family=family,
+            artifact_dir=artifact_dir,
+            warmups=warmups,
+            repeats=repeats,
+            zig_bench_proof_codec=zig_bench_proof_codec,
+            merkle_workers=merkle_workers,
+            merkle_pool_reuse=merkle_pool_reuse,
+            cpus=cpus,
+            perf_stat=perf_stat,
+        )
+
+    if runtime_pool is not None:
+        rust, zig = runtime_pool.map(bench, ("rust", "zig"))
+    else:
+        rust = bench("rust")
+        zig = bench("zig")
+
+    prove_ratio = ratio(
+        float(zig["prove"]["avg_seconds"]),
+        float(rust["prove"]["avg_seconds"]),
+    )
+    verify_ratio = ratio(
+        float(zig["verify"]["avg_seconds"]),
+        float(rust["verify"]["avg_seconds"]),
+    )
+    proof_size_ratio = ratio(
+        float(zig["proof_metrics"]["proof_wire_bytes"]),
+        float(rust["proof_metrics"]["proof_wire_bytes"]),
+    )
+    peak_rss_ratio = ratio(
+        float(zig.get("peak_rss_kb") or 0.0),
+        float(rust.get("peak_rss_kb") or 0.0),
+    )
+
+    if prove_ratio > max_zig_over_rust:
+        family_failures.append(
+            f"{family}: prove ratio {prove_ratio:.6f} exceeds {max_zig_over_rust:.2f}"
+        )
+    if verify_ratio > max_zig_over_rust:
+        family_failures.append(
+            f"{family}: verify ratio {verify_ratio:.6f} exceeds {max_zig_over_rust:.2f}"
+        )
+    if rust["proof_metrics"]["commitments_count"] != zig["proof_metrics"]["commitments_count"]:
+        family_failures.append(f"{family}: commitments_count mismatch")
+    if rust["proof_metrics"]["decommitments_count"] != zig["proof_metrics"]["decommitments_count"]:
+        family_failures.append(f"{family}: decommitments_count mismatch")
+
+    entry = {
+        "family": family,
+        "mapped_workload": {
+            "example": workload["example"],
+            "args": workload["args"],
+            "prove_mode": workload["prove_mode"],
+            "include_all_preprocessed_columns": workload["include_all_preprocessed_columns"],
+        },
+        "rust": rust,
+        "zig": zig,
+        "ratios": {
+            "zig_over_rust_prove": round(prove_ratio, 6),
+            "zig_over_rust_verify": round(verify_ratio, 6),
+            "zig_over_rust_proof_wire_bytes": round(proof_size_ratio, 6),
+            "zig_over_rust_peak_rss_kb": round(peak_rss_ratio, 6),
+        },
+    }
+    if cpu_group is not None:
+        entry["cpu_group"] = cpu_group
+    return entry, family_failures
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Full upstream-family benchmark parity harness")
     parser.add_argument("--rust-toolchain", default=RUST_TOOLCHAIN_DEFAULT)
@@ -449,6 +645,50 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Enable STWO_ZIG_MERKLE_POOL_REUSE=1 for Zig runtime runs.",
     )
+    runtime_scheduling = parser.add_mutually_exclusive_group()
+    runtime_scheduling.add_argument(
+        "--parallel-runtimes",
+        dest="parallel_runtimes",
+        action="store_const",
+        const=True,
+        default=None,
+        help="Run the Rust and Zig benches of each family concurrently.",
+    )
+    runtime_scheduling.add_argument(
+        "--serial-runtimes",
+        dest="parallel_runtimes",
+        action="store_const",
+        const=False,
+        help="Run the Rust and Zig benches of each family back to back.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of families benchmarked concurrently (default 1 keeps timings contention-free).",
+    )
+    parser.add_argument(
+        "--pin-core",
+        type=int,
+        default=None,
+        help="Pin bench binary runs to this CPU core with taskset (implies serial runtimes and --jobs 1).",
+    )
+    parser.add_argument(
+        "--perf-stat",
+        action="store_true",
+        help="Collect perf stat counters (cycles, instructions, cache misses) for each bench binary run.",
+    )
+    parser.add_argument(
+        "--force-rebuild",
+        action="store_true",
+        help="Rebuild the Rust and Zig bench binaries even when their source fingerprints match.",
+    )
+    parser.add_argument(
+        "--artifact-dir",
+        type=Path,
+        default=None,
+        help=f"Directory for bench proof artifacts (default: {TMPFS_ARTIFACT_DIR} when tmpfs, else {ARTIFACT_DIR}).",
+    )
     parser.add_argument(
         "--check-families",
         action="store_true",
@@ -467,6 +707,17 @@ def main() -> int:
     args = parse_args()
     if args.merkle_workers is not None and args.merkle_workers <= 0:
         raise ValueError("--merkle-workers must be positive when provided")
+    if args.jobs <= 0:
+        raise ValueError("--jobs must be positive")
+    if args.pin_core is not None:
+        if args.pin_core < 0:
+            raise ValueError("--pin-core must be non-negative")
+        if args.jobs > 1 or args.parallel_runtimes:
+            raise ValueError("--pin-core runs one bench at a time; drop --jobs/--parallel-runtimes")
+        if shutil.which("taskset") is None:
+            raise RuntimeError("--pin-core requires 'taskset' on PATH")
+    if args.perf_stat and shutil.which("perf") is None:
+        raise RuntimeError("--perf-stat requires 'perf' on PATH")
 
     runner_families = list_runner_families()
     if runner_families != UPSTREAM_FAMILIES:
@@ -480,88 +731,85 @@ def main() -> int:
         print(json.dumps({"status": "ok", "families": list(UPSTREAM_FAMILIES)}, sort_keys=True))
         return 0
 
-    ARTIFACT_DIR.mkdir(parents=True, exist_ok=True)
-    ensure_binaries(args.rust_toolchain)
+    # Bench binaries launch without cwd=ROOT, so a relative --artifact-dir is
+    # anchored at the repo root rather than the caller's cwd.
+    artifact_dir = ROOT / args.artifact_dir if args.artifact_dir is not None else default_artifact_dir()
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    artifact_tmpfs = mount_fstype(artifact_dir) == "tmpfs"
+    ensure_binaries(args.rust_toolchain, force_rebuild=args.force_rebuild)
+
+    # Concurrent runtimes contend for cores and skew timing ratios, so only
+    # smoke-style runs (no warmups, single repeat, no core pinning) default to parallel.
+    parallel_runtimes = args.parallel_runtimes
+    if parallel_runtimes is None:
+        parallel_runtimes = args.warmups == 0 and args.repeats == 1 and args.pin_core is None
+
+    runtime_pool = ThreadPoolExecutor(max_workers=2 * args.jobs) if parallel_runtimes else None
+    family_pool = ThreadPoolExecutor(max_workers=args.jobs) if args.jobs > 1 else None
+
+    # Each running family borrows a CPU group and returns it when done, so no
+    # two concurrent families share cores or (group-aligned) caches.
+    cpu_groups = split_cpu_groups(args.jobs)
+    free_cpu_groups: queue.SimpleQueue[list[int]] = queue.SimpleQueue()
+    for group in cpu_groups or ():
+        free_cpu_groups.put(group)
+
+    # Completed families are streamed to a sibling NDJSON file as they finish so
+    # a crash mid-matrix keeps every finished measurement. It is removed once
+    # the aggregate report has been written.
+    args.report_out.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = args.report_out.with_suffix(".ndjson")
+    partial_lock = threading.Lock()
+
+    def run_family(family: str) -> tuple[dict[str, Any], list[str]]:
+        cpu_group = free_cpu_groups.get() if cpu_groups else None
+        try:
+            result = bench_family(
+                family,
+                artifact_dir=artifact_dir,
+                warmups=args.warmups,
+                repeats=args.repeats,
+                max_zig_over_rust=args.max_zig_over_rust,
+                zig_bench_proof_codec=args.zig_bench_proof_codec,
+                merkle_workers=args.merkle_workers,
+                merkle_pool_reuse=args.merkle_pool_reuse,
+                runtime_pool=runtime_pool,
+                pin_core=args.pin_core,
+                perf_stat=args.perf_stat,
+                cpu_group=cpu_group,
+            )
+        finally:
+            if cpu_group is not None:
+                free_cpu_groups.put(cpu_group)
+        append_ndjson(partial, partial_lock, {"entry": result[0], "failures": result[1]})
+        return result
+
+    with partial_path.open("w", encoding="utf-8") as partial:
+        try:
+            # `map` yields in family order, keeping the report and failure order
+            # deterministic regardless of which family finishes first.
+            if family_pool is not None:
+                family_results = list(family_pool.map(run_family, UPSTREAM_FAMILIES))
+            else:
+                family_results = [run_family(family) for family in UPSTREAM_FAMILIES]
+        except BaseException:
+            print(f"warning: benchmark aborted; completed families kept in {partial_path}", file=sys.stderr)
+            raise
+        finally:
+            if family_pool is not None:
+                family_pool.shutdown()
+            if runtime_pool is not None:
+                runtime_pool.shutdown()
 
     families_report: list[dict[str, Any]] = []
     failures: list[str] = []
+    for entry, family_failures in family_results:
+        families_report.append(entry)
+        failures.extend(family_failures)
 
-    for family in UPSTREAM_FAMILIES:
-        workload = WORKLOADS[family]
-        rust = bench_runtime(
-            runtime="rust",
-            family=family,
-            workload=workload,
-            warmups=args.warmups,
-            repeats=args.repeats,
-            zig_bench_proof_codec=args.zig_bench_proof_codec,
-            merkle_workers=args.merkle_workers,
-            merkle_pool_reuse=args.merkle_pool_reuse,
-        )
-        zig = bench_runtime(
-            runtime="zig",
-            family=family,
-            workload=workload,
-            warmups=args.warmups,
-            repeats=args.repeats,
-            zig_bench_proof_codec=args.zig_bench_proof_codec,
-            merkle_workers=args.merkle_workers,
-            merkle_pool_reuse=args.merkle_pool_reuse,
-        )
-
-        prove_ratio = ratio(
-            float(zig["prove"]["avg_seconds"]),
-            float(rust["prove"]["avg_seconds"]),
-        )
-        verify_ratio = ratio(
-            float(zig["verify"]["avg_seconds"]),
-            float(rust["verify"]["avg_seconds"]),
-        )
-        proof_size_ratio = ratio(
-            float(zig["proof_metrics"]["proof_wire_bytes"]),
-            float(rust["proof_metrics"]["proof_wire_bytes"]),
-        )
-        peak_rss_ratio = ratio(
-            float(zig.get("peak_rss_kb") or 0.0),
-            float(rust.get("peak_rss_kb") or 0.0),
-        )
-
-        if prove_ratio > args.max_zig_over_rust:
-            failures.append(
-                f"{family}: prove ratio {prove_ratio:.6f} exceeds {args.max_zig_over_rust:.2f}"
-            )
-        if verify_ratio > args.max_zig_over_rust:
-            failures.append(
-                f"{family}: verify ratio {verify_ratio:.6f} exceeds {args.max_zig_over_rust:.2f}"
-            )
-        if rust["proof_metrics"]["commitments_count"] != zig["proof_metrics"]["commitments_count"]:
-            failures.append(f"{family}: commitments_count mismatch")
-        if rust["proof_metrics"]["decommitments_count"] != zig["proof_metrics"]["decommitments_count"]:
-            failures.append(f"{family}: decommitments_count mismatch")
-
-        families_report.append(
-            {
-                "family": family,
-                "mapped_workload": {
-                    "example": workload["example"],
-                    "args": workload["args"],
-                    "prove_mode": workload["prove_mode"],
-                    "include_all_preprocessed_columns": workload["include_all_preprocessed_columns"],
-                },
-                "rust": rust,
-                "zig": zig,
-                "ratios": {
-                    "zig_over_rust_prove": round(prove_ratio, 6),
-                    "zig_over_rust_verify": round(verify_ratio, 6),
-                    "zig_over_rust_proof_wire_bytes": round(proof_size_ratio, 6),
-                    "zig_over_rust_peak_rss_kb": round(peak_rss_ratio, 6),
-                },
-            }
-        )
-
-    prove_ratios = [entry["ratios"]["zig_over_rust_prove"] for entry in families_report]
-    verify_ratios = [entry["ratios"]["zig_over_rust_verify"] for entry in families_report]
-    rss_ratios = [entry["ratios"]["zig_over_rust_peak_rss_kb"] for entry in families_report]
+    prove_max, prove_avg = summarize_ratios(families_report, "zig_over_rust_prove")
+    verify_max, verify_avg = summarize_ratios(families_report, "zig_over_rust_verify")
+    rss_max, rss_avg = summarize_ratios(families_report, "zig_over_rust_peak_rss_kb")
     status = "ok" if not failures else "failed"
 
     report = {
@@ -576,32 +824,32 @@ def main() -> int:
             "zig_bench_proof_codec": args.zig_bench_proof_codec,
             "merkle_workers": args.merkle_workers,
             "merkle_pool_reuse": args.merkle_pool_reuse,
+            "parallel_runtimes": parallel_runtimes,
+            "jobs": args.jobs,
+            "artifact_tmpfs": artifact_tmpfs,
+            "pin_core": args.pin_core,
+            "cpu_groups": cpu_groups,
+            "perf_stat": args.perf_stat,
         },
         "summary": {
             "families": len(families_report),
-            "max_zig_over_rust_prove": max(prove_ratios) if prove_ratios else 0.0,
-            "max_zig_over_rust_verify": max(verify_ratios) if verify_ratios else 0.0,
-            "avg_zig_over_rust_prove": round(sum(prove_ratios) / len(prove_ratios), 6)
-            if prove_ratios
-            else 0.0,
-            "avg_zig_over_rust_verify": round(sum(verify_ratios) / len(verify_ratios), 6)
-            if verify_ratios
-            else 0.0,
-            "max_zig_over_rust_peak_rss_kb": max(rss_ratios) if rss_ratios else 0.0,
-            "avg_zig_over_rust_peak_rss_kb": round(sum(rss_ratios) / len(rss_ratios), 6)
-            if rss_ratios
-            else 0.0,
+            "max_zig_over_rust_prove": prove_max,
+            "max_zig_over_rust_verify": verify_max,
+            "avg_zig_over_rust_prove": prove_avg,
+            "avg_zig_over_rust_verify": verify_avg,
+            "max_zig_over_rust_peak_rss_kb": rss_max,
+            "avg_zig_over_rust_peak_rss_kb": rss_avg,
             "failure_count": len(failures),
         },
         "families": families_report,
         "failures": failures,
     }
 
-    args.report_out.parent.mkdir(parents=True, exist_ok=True)
-    args.report_out.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    write_json_report(args.report_out, report)
+    partial_path.unlink()
     latest = args.report_out.parent / "latest_benchmark_full_report.json"
     if latest != args.report_out:
-        shutil.copyfile(args.report_out, latest)
+        publish_latest(args.report_out, latest)
 
     return 0 if status == "ok" else 1
 
@@ -6,20 +6,36 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import os
 import shutil
 import statistics
 import subprocess
+import sys
+import threading
 import time
 from pathlib import Path
 from typing import Any, Dict, List
 
+from bench_io import (
+    bench_prefix,
+    build_if_stale,
+    loads_json,
+    parse_perf_stat,
+    publish_latest,
+    write_json_report,
+)
+
 
 ROOT = Path(__file__).resolve().parent.parent
 RUNNER = ROOT / "src" / "bench_kernels.zig"
 ZIG_BIN = ROOT / "vectors" / ".bench_kernels"
+ZIG_SOURCE_ROOT = ROOT / "src"
 REPORT_DEFAULT = ROOT / "vectors" / "reports" / "benchmark_kernels_report.json"
 LATEST_REPORT = ROOT / "vectors" / "reports" / "latest_benchmark_kernels_report.json"
 
+# SHA-256 of the canonical encoding of {"a": 1, "b": [2, 3]}.
+CANONICAL_HASH_PROBE_DIGEST = "efbd0040190fb0871831e606c581f8a66db79d8e2bb836745a70051306956070"
+
 SUPPORTED_ZIG_OPT_MODES = ("Debug", "ReleaseSafe", "ReleaseFast", "ReleaseSmall")
 
 WORKLOADS: List[Dict[str, Any]] = [
@@ -42,17 +58,50 @@ WORKLOADS: List[Dict[str, Any]] = [
 ]
 
 
-def run(cmd: List[str]) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
+def run(cmd: List[str], stdin_text: str | None = None) -> subprocess.CompletedProcess[str]:
+    # Stream stdout keeping only its last non-empty line (the JSON payload) and
+    # drain stderr on a side thread so neither pipe can fill up and block the child.
+    # `stdin_text` is written in full and closed before any output is read; the
+    # runner consumes all of stdin before it emits anything.
+    stderr_lines: List[str] = []
+    last_stdout_line = ""
+    with subprocess.Popen(
         cmd,
         cwd=ROOT,
         text=True,
-        capture_output=True,
-        check=False,
+        stdin=subprocess.PIPE if stdin_text is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    ) as child:
+        stderr_reader = threading.Thread(
+            target=stderr_lines.extend,
+            args=(child.stderr,),
+            daemon=True,
+        )
+        stderr_reader.start()
+        if stdin_text is not None:
+            try:
+                child.stdin.write(stdin_text)
+                child.stdin.close()
+            except BrokenPipeError:
+                pass  # The runner exited early; its stderr and exit code say why.
+        for line in child.stdout:
+            if line.strip():
+                last_stdout_line = line
+        stderr_reader.join()
+        returncode = child.wait()
+    return subprocess.CompletedProcess(
+        cmd,
+        returncode,
+        stdout=last_stdout_line,
+        stderr="".join(stderr_lines),
     )
 
 
 def canonical_hash(payload: Any) -> str:
+    # Stays SHA-256: settings/workload hashes are compared against committed
+    # optimization baselines, and the inputs are a few hundred bytes, so a faster
+    # digest would buy nothing while invalidating every recorded hash.
     encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
     return hashlib.sha256(encoded).hexdigest()
 
@@ -62,11 +111,11 @@ def parse_json_stdout_any(stdout: str) -> Any:
         stripped = line.strip()
         if not stripped:
             continue
-        return json.loads(stripped)
+        return loads_json(stripped)
     raise RuntimeError("missing JSON payload in kernel benchmark output")
 
 
-def ensure_binary(zig_opt_mode: str, zig_cpu: str) -> None:
+def ensure_binary(zig_opt_mode: str, zig_cpu: str, force_rebuild: bool = False) -> None:
     cmd = [
         "zig",
         "build-exe",
@@ -77,10 +126,14 @@ def ensure_binary(zig_opt_mode: str, zig_cpu: str) -> None:
     ]
     if zig_cpu != "baseline":
         cmd.append("-mcpu=" + zig_cpu)
-    proc = run(cmd)
-    if proc.returncode != 0:
-        raise RuntimeError(f"failed building kernel benchmark runner:\n{proc.stderr}")
-
+    build_if_stale(
+        label="kernel",
+        cmd=cmd,
+        binary=ZIG_BIN,
+        source_root=ZIG_SOURCE_ROOT,
+        toolchain_version_cmd=["zig", "version"],
+        force_rebuild=force_rebuild,
+    )
 
 def list_kernels() -> List[str]:
     proc = run([str(ZIG_BIN), "--mode", "list-kernels"])
@@ -94,9 +147,24 @@ def list_kernels() -> List[str]:
     return list(payload)
 
 
-def bench_once(name: str, log_size: int, iterations: int) -> Dict[str, Any]:
+def pin_cpus(pin_core: int | None) -> str | None:
+    # taskset cpu list for the optional single pinned core.
+    return None if pin_core is None else str(pin_core)
+
+
+def bench_samples(
+    name: str,
+    log_size: int,
+    iterations: int,
+    samples: int,
+    pin_core: int | None = None,
+    perf_out: Path | None = None,
+) -> List[Dict[str, Any]]:
+    # One runner process per kernel: warmups and repeats run back to back inside
+    # it, so per-sample cost excludes process spawn and binary load.
     proc = run(
         [
+            *bench_prefix(pin_cpus(pin_core), perf_out),
             str(ZIG_BIN),
             "--mode",
             "bench",
@@ -106,6 +174,8 @@ def bench_once(name: str, log_size: int, iterations: int) -> Dict[str, Any]:
             str(log_size),
             "--iterations",
             str(iterations),
+            "--samples",
+            str(samples),
         ]
     )
     if proc.returncode != 0:
@@ -114,11 +184,99 @@ def bench_once(name: str, log_size: int, iterations: int) -> Dict[str, Any]:
             f"stderr:\n{proc.stderr}"
         )
     payload = parse_json_stdout_any(proc.stdout)
-    if not isinstance(payload, dict):
-        raise RuntimeError(f"kernel payload for '{name}' is not an object")
+    if not isinstance(payload, list) or len(payload) != samples:
+        raise RuntimeError(f"kernel payload for '{name}' is not an array of {samples} samples")
+    if not all(isinstance(item, dict) for item in payload):
+        raise RuntimeError(f"kernel payload for '{name}' contains non-object samples")
     return payload
 
 
+def bench_batch(samples_per_kernel: int, pin_core: int | None = None) -> Dict[str, List[Dict[str, Any]]]:
+    # The whole workload matrix in one runner invocation: the spec goes out on
+    # stdin as a single JSON array (argv would cap it at ARG_MAX) and comes back
+    # as one flat array, split here per kernel.
+    spec = [
+        {
+            "kernel": workload["name"],
+            "log_size": int(workload["log_size"]),
+            "iterations": int(workload["iterations"]),
+            "samples": samples_per_kernel,
+        }
+        for workload in WORKLOADS
+    ]
+    proc = run(
+        [
+            *bench_prefix(pin_cpus(pin_core), None),
+            str(ZIG_BIN),
+            "--mode",
+            "bench-batch",
+        ],
+        stdin_text=json.dumps(spec, separators=(",", ":")),
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"kernel batch bench failed\nstderr:\n{proc.stderr}")
+    payload = parse_json_stdout_any(proc.stdout)
+    expected = samples_per_kernel * len(spec)
+    if not isinstance(payload, list) or len(payload) != expected:
+        raise RuntimeError(f"kernel batch payload is not an array of {expected} samples")
+
+    by_kernel: Dict[str, List[Dict[str, Any]]] = {}
+    for offset, entry in zip(range(0, expected, samples_per_kernel), spec):
+        chunk = payload[offset : offset + samples_per_kernel]
+        if not all(isinstance(item, dict) and item.get("kernel") == entry["kernel"] for item in chunk):
+            raise RuntimeError(f"kernel batch payload is out of order for '{entry['kernel']}'")
+        by_kernel[entry["kernel"]] = chunk
+    return by_kernel
+
+
+def bench_matrix(
+    warmups: int,
+    repeats: int,
+    drop_caches: bool,
+    pin_core: int | None = None,
+) -> tuple[Dict[str, List[Dict[str, Any]]], bool | None]:
+    if not drop_caches:
+        return bench_batch(warmups + repeats, pin_core), None
+    # Same split as the per-kernel path: warm up, drop the page cache, then
+    # measure in a fresh process.
+    run_payloads = bench_batch(warmups, pin_core) if warmups else {workload["name"]: [] for workload in WORKLOADS}
+    page_cache_dropped = drop_page_cache()
+    for name, measured in bench_batch(repeats, pin_core).items():
+        run_payloads[name] = run_payloads[name] + measured
+    return run_payloads, page_cache_dropped
+
+
+def min_max_total(values: List[float]) -> tuple[float, float, float]:
+    # Single traversal for the min/max/sum triple used by the summaries.
+    lo = hi = total = values[0]
+    for value in values[1:]:
+        if value < lo:
+            lo = value
+        elif value > hi:
+            hi = value
+        total += value
+    return lo, hi, total
+
+
+def drop_page_cache() -> bool:
+    if not sys.platform.startswith("linux"):
+        print("warning: --drop-caches is only supported on Linux; page cache left warm", file=sys.stderr)
+        return False
+    os.sync()
+    try:
+        proc = subprocess.run(
+            ["sudo", "-n", "sh", "-c", "sync && echo 3 > /proc/sys/vm/drop_caches"],
+            capture_output=True,
+            check=False,
+        )
+    except OSError:
+        proc = None
+    if proc is None or proc.returncode != 0:
+        print("warning: failed to drop page cache (needs passwordless sudo)", file=sys.stderr)
+        return False
+    return True
+
+
 def summarize_runs(
     *,
     name: str,
@@ -126,31 +284,51 @@ def summarize_runs(
     iterations: int,
     warmups: int,
     repeats: int,
+    drop_caches: bool = False,
+    run_payloads: List[Dict[str, Any]] | None = None,
+    page_cache_dropped: bool | None = None,
+    pin_core: int | None = None,
+    perf_out: Path | None = None,
 ) -> Dict[str, Any]:
     if repeats <= 0:
         raise ValueError("--repeats must be positive")
     if warmups < 0:
         raise ValueError("--warmups must be non-negative")
 
-    checksums: List[List[int]] = []
+    first_checksum: List[int] | None = None
     samples: List[float] = []
 
-    for i in range(warmups + repeats):
-        run_payload = bench_once(name, log_size, iterations)
+    # `run_payloads` arrives pre-measured from the batched matrix run; otherwise
+    # this kernel gets its own runner process.
+    if run_payloads is None and (drop_caches or perf_out is not None):
+        # Warm up in one process, then measure in a fresh one: samples do not
+        # inherit file-backed pages from the warmup phase once the page cache is
+        # dropped, and perf counters cover the measured repeats only.
+        run_payloads = bench_samples(name, log_size, iterations, warmups, pin_core) if warmups else []
+        if drop_caches:
+            page_cache_dropped = drop_page_cache()
+        run_payloads += bench_samples(name, log_size, iterations, repeats, pin_core, perf_out)
+    elif run_payloads is None:
+        run_payloads = bench_samples(name, log_size, iterations, warmups + repeats, pin_core)
+
+    for i, run_payload in enumerate(run_payloads):
         checksum = run_payload.get("checksum")
         if not isinstance(checksum, list) or len(checksum) != 4:
             raise RuntimeError(f"invalid checksum payload for kernel '{name}'")
-        checksums.append([int(v) for v in checksum])
+        # Compare each checksum against the first as it arrives; only the first
+        # is kept for the report.
+        checksum = [int(v) for v in checksum]
+        if first_checksum is None:
+            first_checksum = checksum
+        elif checksum != first_checksum:
+            raise RuntimeError(f"non-deterministic checksum observed for kernel '{name}'")
         if i >= warmups:
             samples.append(float(run_payload.get("seconds", 0.0)))
 
-    first_checksum = checksums[0]
-    if any(checksum != first_checksum for checksum in checksums[1:]):
-        raise RuntimeError(f"non-deterministic checksum observed for kernel '{name}'")
-
-    avg_seconds = sum(samples) / len(samples)
+    min_seconds, max_seconds, total_seconds = min_max_total(samples)
+    avg_seconds = total_seconds / len(samples)
     median_seconds = statistics.median(samples)
-    return {
+    summary = {
         "name": name,
         "log_size": log_size,
         "iterations": iterations,
@@ -160,11 +338,16 @@ def summarize_runs(
         "summary": {
             "avg_seconds": round(avg_seconds, 9),
             "median_seconds": round(median_seconds, 9),
-            "min_seconds": round(min(samples), 9),
-            "max_seconds": round(max(samples), 9),
+            "min_seconds": round(min_seconds, 9),
+            "max_seconds": round(max_seconds, 9),
             "samples_seconds": [round(v, 9) for v in samples],
         },
     }
+    if page_cache_dropped is not None:
+        summary["page_cache_dropped"] = page_cache_dropped
+    if perf_out is not None:
+        summary["perf_stat"] = parse_perf_stat(perf_out.read_text(encoding="utf-8"))
+    return summary
 
 
 def run_self_test() -> None:
@@ -182,6 +365,8 @@ def run_self_test() -> None:
     digest_b = canonical_hash({"b": [2, 3], "a": 1})
     if digest_a != digest_b:
         raise RuntimeError("canonical hash must be stable under key order")
+    if digest_a != CANONICAL_HASH_PROBE_DIGEST:
+        raise RuntimeError("canonical hash digest changed; recorded baseline hashes would no longer match")
 
 
 def parse_args() -> argparse.Namespace:
@@ -199,6 +384,27 @@ def parse_args() -> argparse.Namespace:
         default="native",
         help="Zig CPU target. Use 'baseline' to omit -mcpu, or 'native' for tuned local runs.",
     )
+    parser.add_argument(
+        "--force-rebuild",
+        action="store_true",
+        help="Rebuild the kernel runner even when its source fingerprint matches.",
+    )
+    parser.add_argument(
+        "--drop-caches",
+        action="store_true",
+        help="Drop the Linux page cache between warmups and measured repeats (needs passwordless sudo).",
+    )
+    parser.add_argument(
+        "--pin-core",
+        type=int,
+        default=None,
+        help="Pin kernel runner processes to this CPU core with taskset.",
+    )
+    parser.add_argument(
+        "--perf-stat",
+        action="store_true",
+        help="Collect perf stat counters (cycles, instructions, cache misses) per kernel over its measured repeats.",
+    )
     parser.add_argument(
         "--report-label",
         default="benchmark_kernels",
@@ -226,7 +432,14 @@ def main() -> int:
         print(json.dumps({"status": "ok", "self_check": True}, sort_keys=True))
         return 0
 
-    ensure_binary(args.zig_opt_mode, args.zig_cpu)
+    if args.pin_core is not None and args.pin_core < 0:
+        raise ValueError("--pin-core must be non-negative")
+    if args.pin_core is not None and shutil.which("taskset") is None:
+        raise RuntimeError("--pin-core requires 'taskset' on PATH")
+    if args.perf_stat and shutil.which("perf") is None:
+        raise RuntimeError("--perf-stat requires 'perf' on PATH")
+
+    ensure_binary(args.zig_opt_mode, args.zig_cpu, force_rebuild=args.force_rebuild)
 
     listed_kernels = list_kernels()
     expected_kernels = [workload["name"] for workload in WORKLOADS]
@@ -240,7 +453,25 @@ def main() -> int:
     kernels_report: List[Dict[str, Any]] = []
     failures: List[str] = []
 
+    batched: Dict[str, List[Dict[str, Any]]] | None = None
+    batch_page_cache_dropped: bool | None = None
+    # Perf counters are collected per kernel process, so --perf-stat skips the
+    # batched matrix run.
+    if args.repeats > 0 and args.warmups >= 0 and not args.perf_stat:
+        try:
+            batched, batch_page_cache_dropped = bench_matrix(
+                args.warmups,
+                args.repeats,
+                args.drop_caches,
+                args.pin_core,
+            )
+        except RuntimeError as exc:
+            # Fall back to one runner per kernel so a failure is attributed to
+            # the kernel that caused it.
+            print(f"warning: batched kernel run failed, retrying per kernel: {exc}", file=sys.stderr)
+
     for workload in WORKLOADS:
+        perf_out = ZIG_BIN.with_name(f".bench_kernels_{workload['name']}.perf.csv") if args.perf_stat else None
         try:
             kernels_report.append(
                 summarize_runs(
@@ -249,12 +480,18 @@ def main() -> int:
                     iterations=int(workload["iterations"]),
                     warmups=args.warmups,
                     repeats=args.repeats,
+                    drop_caches=args.drop_caches,
+                    run_payloads=batched[workload["name"]] if batched is not None else None,
+                    page_cache_dropped=batch_page_cache_dropped,
+                    pin_core=args.pin_core,
+                    perf_out=perf_out,
                 )
             )
         except Exception as exc:  # noqa: BLE001
             failures.append(f"{workload['name']}: {exc}")
 
     avg_seconds = [kernel["summary"]["avg_seconds"] for kernel in kernels_report]
+    kernel_min, kernel_max, kernel_total = min_max_total(avg_seconds) if avg_seconds else (0.0, 0.0, 0.0)
     settings = {
         "warmups": args.warmups,
         "repeats": args.repeats,
@@ -262,6 +499,14 @@ def main() -> int:
         "zig_cpu": args.zig_cpu,
         "report_label": args.report_label,
     }
+    # Measurement options are only recorded when enabled so default runs keep
+    # their settings_hash.
+    if args.drop_caches:
+        settings["drop_caches"] = True
+    if args.pin_core is not None:
+        settings["pin_core"] = args.pin_core
+    if args.perf_stat:
+        settings["perf_stat"] = True
     status = "ok" if not failures else "failed"
 
     report = {
@@ -274,9 +519,9 @@ def main() -> int:
         "workload_matrix_hash": canonical_hash(WORKLOADS),
         "summary": {
             "kernels": len(kernels_report),
-            "avg_seconds": round(sum(avg_seconds) / len(avg_seconds), 9) if avg_seconds else 0.0,
-            "min_seconds": min(avg_seconds) if avg_seconds else 0.0,
-            "max_seconds": max(avg_seconds) if avg_seconds else 0.0,
+            "avg_seconds": round(kernel_total / len(avg_seconds), 9) if avg_seconds else 0.0,
+            "min_seconds": kernel_min,
+            "max_seconds": kernel_max,
             "failure_count": len(failures),
         },
         "kernels": kernels_report,
@@ -284,9 +529,9 @@ def main() -> int:
     }
 
     args.report_out.parent.mkdir(parents=True, exist_ok=True)
-    args.report_out.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    write_json_report(args.report_out, report)
     if args.report_out != LATEST_REPORT:
-        shutil.copyfile(args.report_out, LATEST_REPORT)
+        publish_latest(args.report_out, LATEST_REPORT)
 
     print(json.dumps({"status": status, "failures": failures}, sort_keys=True))
     return 0 if status == "ok" else 1
@@ -11,9 +11,19 @@ The generated data includes prove/verify/proof-size ratios and peak-RSS RAM rati
 from __future__ import annotations
 
 import argparse
+import dataclasses
+import functools
+import hashlib
+import html
 import json
+import math
+import os
+import string
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+from bench_io import loads_json
 
 
 ROOT = Path(__file__).resolve().parent.parent
@@ -52,6 +62,26 @@ FLOW_CORE_PROVE_STAGE_IDS = [
     "trace_decommit",
     "constraint_check_and_assembly",
 ]
+# (row key, key path into the report entry) for the numeric chart columns.
+RATIO_ROW_FIELDS = (
+    ("zig_over_rust_prove", ("ratios", "zig_over_rust_prove")),
+    ("zig_over_rust_verify", ("ratios", "zig_over_rust_verify")),
+    ("zig_over_rust_proof_wire_bytes", ("ratios", "zig_over_rust_proof_wire_bytes")),
+    ("rust_prove_avg_seconds", ("rust", "prove", "avg_seconds")),
+    ("rust_verify_avg_seconds", ("rust", "verify", "avg_seconds")),
+    ("zig_prove_avg_seconds", ("zig", "prove", "avg_seconds")),
+    ("zig_verify_avg_seconds", ("zig", "verify", "avg_seconds")),
+)
+FAMILY_ROW_FIELDS = RATIO_ROW_FIELDS + (
+    ("rust_peak_rss_kb", ("rust", "peak_rss_kb")),
+    ("zig_peak_rss_kb", ("zig", "peak_rss_kb")),
+)
+EXAMPLE_ROW_FIELDS = RATIO_ROW_FIELDS + (
+    ("rust_prove_rss_peak_kb", ("rust", "prove", "rss_peak_kb")),
+    ("zig_prove_rss_peak_kb", ("zig", "prove", "rss_peak_kb")),
+    ("rust_verify_rss_peak_kb", ("rust", "verify", "rss_peak_kb")),
+    ("zig_verify_rss_peak_kb", ("zig", "verify", "rss_peak_kb")),
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -79,86 +109,105 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Validate existing assets match generated content without writing.",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Render data.js indented with sorted keys (validate against the same mode).",
+    )
     return parser.parse_args()
 
 
 def ratio(numerator: float, denominator: float) -> float:
-    if denominator == 0.0:
-        return 0.0
-    return numerator / denominator
-
-
-def build_family_rows(report: dict[str, Any]) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    for family in report.get("families", []):
-        name = str(family.get("family", "unknown"))
-        mapped = family.get("mapped_workload", {})
-        ratios = family.get("ratios", {})
-        rust = family.get("rust", {})
-        zig = family.get("zig", {})
-
-        rust_peak_rss = float(rust.get("peak_rss_kb") or 0.0)
-        zig_peak_rss = float(zig.get("peak_rss_kb") or 0.0)
-        zig_over_rust_peak_rss = float(
-            ratios.get("zig_over_rust_peak_rss_kb")
-            if ratios.get("zig_over_rust_peak_rss_kb") is not None
-            else ratio(zig_peak_rss, rust_peak_rss)
-        )
-
-        rows.append(
-            {
-                "family": name,
-                "example": str(mapped.get("example", "")),
-                "zig_over_rust_prove": float(ratios.get("zig_over_rust_prove", 0.0)),
-                "zig_over_rust_verify": float(ratios.get("zig_over_rust_verify", 0.0)),
-                "zig_over_rust_proof_wire_bytes": float(ratios.get("zig_over_rust_proof_wire_bytes", 0.0)),
-                "zig_over_rust_peak_rss_kb": zig_over_rust_peak_rss,
-                "rust_prove_avg_seconds": float(rust.get("prove", {}).get("avg_seconds", 0.0)),
-                "rust_verify_avg_seconds": float(rust.get("verify", {}).get("avg_seconds", 0.0)),
-                "zig_prove_avg_seconds": float(zig.get("prove", {}).get("avg_seconds", 0.0)),
-                "zig_verify_avg_seconds": float(zig.get("verify", {}).get("avg_seconds", 0.0)),
-                "rust_peak_rss_kb": rust_peak_rss,
-                "zig_peak_rss_kb": zig_peak_rss,
-            }
-        )
-    return rows
-
-
-def build_example_rows(report: dict[str, Any]) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    for workload in report.get("workloads", []):
-        ratios = workload.get("ratios", {})
-        rust = workload.get("rust", {})
-        zig = workload.get("zig", {})
-
-        rust_prove_rss_peak_kb = float(rust.get("prove", {}).get("rss_peak_kb") or 0.0)
-        zig_prove_rss_peak_kb = float(zig.get("prove", {}).get("rss_peak_kb") or 0.0)
-        rust_verify_rss_peak_kb = float(rust.get("verify", {}).get("rss_peak_kb") or 0.0)
-        zig_verify_rss_peak_kb = float(zig.get("verify", {}).get("rss_peak_kb") or 0.0)
-
-        rows.append(
-            {
-                "name": str(workload.get("name", "unknown")),
-                "example": str(workload.get("example", "")),
-                "zig_over_rust_prove": float(ratios.get("zig_over_rust_prove", 0.0)),
-                "zig_over_rust_verify": float(ratios.get("zig_over_rust_verify", 0.0)),
-                "zig_over_rust_proof_wire_bytes": float(ratios.get("zig_over_rust_proof_wire_bytes", 0.0)),
-                "zig_over_rust_peak_rss_kb": ratio(zig_prove_rss_peak_kb, rust_prove_rss_peak_kb),
-                "rust_prove_avg_seconds": float(rust.get("prove", {}).get("avg_seconds", 0.0)),
-                "rust_verify_avg_seconds": float(rust.get("verify", {}).get("avg_seconds", 0.0)),
-                "zig_prove_avg_seconds": float(zig.get("prove", {}).get("avg_seconds", 0.0)),
-                "zig_verify_avg_seconds": float(zig.get("verify", {}).get("avg_seconds", 0.0)),
-                "rust_prove_rss_peak_kb": rust_prove_rss_peak_kb,
-                "zig_prove_rss_peak_kb": zig_prove_rss_peak_kb,
-                "rust_verify_rss_peak_kb": rust_verify_rss_peak_kb,
-                "zig_verify_rss_peak_kb": zig_verify_rss_peak_kb,
-            }
-        )
-    return rows
+    return numerator / denominator if denominator else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class FamilyRow:
+    family: str
+    example: str
+    zig_over_rust_prove: float
+    zig_over_rust_verify: float
+    zig_over_rust_proof_wire_bytes: float
+    zig_over_rust_peak_rss_kb: float
+    rust_prove_avg_seconds: float
+    rust_verify_avg_seconds: float
+    zig_prove_avg_seconds: float
+    zig_verify_avg_seconds: float
+    rust_peak_rss_kb: float
+    zig_peak_rss_kb: float
+
+
+@dataclass(frozen=True, slots=True)
+class ExampleRow:
+    name: str
+    example: str
+    zig_over_rust_prove: float
+    zig_over_rust_verify: float
+    zig_over_rust_proof_wire_bytes: float
+    zig_over_rust_peak_rss_kb: float
+    rust_prove_avg_seconds: float
+    rust_verify_avg_seconds: float
+    zig_prove_avg_seconds: float
+    zig_verify_avg_seconds: float
+    rust_prove_rss_peak_kb: float
+    zig_prove_rss_peak_kb: float
+    rust_verify_rss_peak_kb: float
+    zig_verify_rss_peak_kb: float
+
+
+@functools.lru_cache(maxsize=None)
+def path_getter(path: tuple[str, ...]) -> Callable[[Any], Any]:
+    # One getter per key path, shared by every row; missing steps yield None
+    # without allocating placeholder dicts.
+    def get(value: Any) -> Any:
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        return value
+
+    return get
+
+
+def compile_fields(
+    fields: tuple[tuple[str, tuple[str, ...]], ...],
+) -> tuple[tuple[str, Callable[[Any], Any]], ...]:
+    return tuple((out_key, path_getter(path)) for out_key, path in fields)
+
+
+FAMILY_ROW_GETTERS = compile_fields(FAMILY_ROW_FIELDS)
+EXAMPLE_ROW_GETTERS = compile_fields(EXAMPLE_ROW_FIELDS)
+get_recorded_peak_rss_ratio = path_getter(("ratios", "zig_over_rust_peak_rss_kb"))
+get_mapped_example = path_getter(("mapped_workload", "example"))
+
+
+def project_floats(record: dict[str, Any], getters: tuple[tuple[str, Callable[[Any], Any]], ...]) -> dict[str, float]:
+    # Missing or null values project to 0.0.
+    return {out_key: float(get(record) or 0.0) for out_key, get in getters}
+
+
+def build_family_row(family: dict[str, Any]) -> FamilyRow:
+    columns = project_floats(family, FAMILY_ROW_GETTERS)
+    recorded_peak_rss_ratio = get_recorded_peak_rss_ratio(family)
+    mapped_example = get_mapped_example(family)
+    return FamilyRow(
+        family=str(family.get("family", "unknown")),
+        example=str(mapped_example if mapped_example is not None else ""),
+        zig_over_rust_peak_rss_kb=float(
+            recorded_peak_rss_ratio
+            if recorded_peak_rss_ratio is not None
+            else ratio(columns["zig_peak_rss_kb"], columns["rust_peak_rss_kb"])
+        ),
+        **columns,
+    )
 
 
-def ratio_or_zero(numerator: float, denominator: float) -> float:
-    return ratio(numerator, denominator)
+def build_example_row(workload: dict[str, Any]) -> ExampleRow:
+    columns = project_floats(workload, EXAMPLE_ROW_GETTERS)
+    return ExampleRow(
+        name=str(workload.get("name", "unknown")),
+        example=str(workload.get("example", "")),
+        zig_over_rust_peak_rss_kb=ratio(columns["zig_prove_rss_peak_kb"], columns["rust_prove_rss_peak_kb"]),
+        **columns,
+    )
 
 
 def find_stage(stages: list[dict[str, Any]], stage_id: str) -> dict[str, Any]:
@@ -193,10 +242,10 @@ def build_stage_rows(
                 "label": str(rust_stage.get("label", "")),
                 "color_index": idx,
                 "rust_seconds": rust_seconds,
-                "rust_share": ratio_or_zero(rust_seconds, rust_total),
+                "rust_share": ratio(rust_seconds, rust_total),
                 "zig_seconds": zig_seconds,
-                "zig_share": ratio_or_zero(zig_seconds, zig_total),
-                "zig_over_rust": ratio_or_zero(zig_seconds, rust_seconds),
+                "zig_share": ratio(zig_seconds, zig_total),
+                "zig_over_rust": ratio(zig_seconds, rust_seconds),
             }
         )
     return rows
@@ -213,17 +262,13 @@ def build_nested_stage_rows(
             "id": str(stage.get("id", "")),
             "label": str(stage.get("label", "")),
             "seconds": float(stage.get("seconds", 0.0)),
-            "share": ratio_or_zero(float(stage.get("seconds", 0.0)), total),
+            "share": ratio(float(stage.get("seconds", 0.0)), total),
         }
         for stage in stages
     ]
 
 
-def build_fib5000_flow(report: dict[str, Any]) -> dict[str, Any]:
-    workload = next(
-        (workload for workload in report.get("workloads", []) if workload.get("name") == FIB5000_WORKLOAD),
-        None,
-    )
+def build_fib5000_flow(workload: dict[str, Any] | None) -> dict[str, Any]:
     if workload is None:
         raise RuntimeError(f"missing workload '{FIB5000_WORKLOAD}' in examples report")
 
@@ -259,6 +304,14 @@ def build_payload(
     examples_report: dict[str, Any],
     examples_report_path: Path,
 ) -> dict[str, Any]:
+    family_rows = [build_family_row(family) for family in family_report.get("families", [])]
+    # One walk over the example workloads yields both the rows and the fib5000 flow source.
+    example_rows: list[ExampleRow] = []
+    fib5000_workload = None
+    for workload in examples_report.get("workloads", []):
+        example_rows.append(build_example_row(workload))
+        if fib5000_workload is None and workload.get("name") == FIB5000_WORKLOAD:
+            fib5000_workload = workload
     return {
         "schema_version": 3,
         "sources": {
@@ -269,22 +322,30 @@ def build_payload(
             "families": family_report.get("summary", {}),
             "examples": examples_report.get("summary", {}),
         },
-        "fib5000_flow": build_fib5000_flow(examples_report),
-        "family_rows": build_family_rows(family_report),
-        "example_rows": build_example_rows(examples_report),
+        "fib5000_flow": build_fib5000_flow(fib5000_workload),
+        "family_rows": family_rows,
+        "example_rows": example_rows,
     }
 
 
-def render_data_js(payload: dict[str, Any]) -> str:
-    return "window.BENCHMARK_PAGE_DATA = " + json.dumps(payload, indent=2, sort_keys=True) + ";\n"
+def render_data_js(payload: dict[str, Any], pretty: bool = False) -> str:
+    # Row records serialize as their field dicts. The published asset is compact;
+    # --pretty restores the indented, key-sorted layout for reading by hand.
+    if pretty:
+        encoded = json.dumps(payload, indent=2, sort_keys=True, default=dataclasses.asdict)
+    else:
+        encoded = json.dumps(payload, separators=(",", ":"), default=dataclasses.asdict)
+    return "window.BENCHMARK_PAGE_DATA = " + encoded + ";\n"
 
 
-def render_index_html() -> str:
-    return """<!DOCTYPE html>
-<html lang=\"en\">
+# Page shell. Charts and tables are rendered here in Python, so the page needs
+# no client-side script; data.js is still published as the machine-readable data.
+INDEX_HTML_TEMPLATE = string.Template(
+    """<!DOCTYPE html>
+<html lang="en">
 <head>
-  <meta charset=\"utf-8\" />
-  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
   <title>stwo-zig benchmark parity</title>
   <style>
     body { font-family: ui-sans-serif, system-ui, sans-serif; margin: 24px; color: #222; background: #f6f8fa; }
@@ -326,21 +387,21 @@ def render_index_html() -> str:
   <h1>stwo-zig Benchmark Parity</h1>
   <p>Generated from committed benchmark data and includes peak-RSS RAM metrics plus a fib5000 proof-flow explainer built from averaged benchmark samples.</p>
 
-  <div class=\"card\">
+  <div class="card">
     <h2>Family Benchmarks</h2>
     <h3>Prove Ratio (Zig over Rust)</h3>
-    <div id=\"familyProveChart\" class=\"chart\"></div>
+    <div id="familyProveChart" class="chart">$family_prove_chart</div>
     <h3>Verify Ratio (Zig over Rust)</h3>
-    <div id=\"familyVerifyChart\" class=\"chart\"></div>
+    <div id="familyVerifyChart" class="chart">$family_verify_chart</div>
     <h3>Proof-Size Ratio (Zig over Rust)</h3>
-    <div id=\"familySizeChart\" class=\"chart\"></div>
+    <div id="familySizeChart" class="chart">$family_size_chart</div>
     <h3>Peak-RSS Ratio (Zig over Rust)</h3>
-    <div id=\"familyRssChart\" class=\"chart\"></div>
+    <div id="familyRssChart" class="chart">$family_rss_chart</div>
   </div>
 
-  <div class=\"card\">
+  <div class="card">
     <h2>Family Raw Metrics</h2>
-    <table id=\"familyTable\">
+    <table id="familyTable">
       <thead>
         <tr>
           <th>Family</th>
@@ -357,28 +418,28 @@ def render_index_html() -> str:
           <th>Zig Verify (s)</th>
         </tr>
       </thead>
-      <tbody></tbody>
+      <tbody>$family_table_rows</tbody>
     </table>
   </div>
 
-  <div class=\"card\">
+  <div class="card">
     <h2>Example Workload Benchmarks</h2>
     <h3>Prove Ratio (Zig over Rust)</h3>
-    <div id=\"exampleProveChart\" class=\"chart\"></div>
+    <div id="exampleProveChart" class="chart">$example_prove_chart</div>
     <h3>Verify Ratio (Zig over Rust)</h3>
-    <div id=\"exampleVerifyChart\" class=\"chart\"></div>
+    <div id="exampleVerifyChart" class="chart">$example_verify_chart</div>
     <h3>Proof-Size Ratio (Zig over Rust)</h3>
-    <div id=\"exampleSizeChart\" class=\"chart\"></div>
+    <div id="exampleSizeChart" class="chart">$example_size_chart</div>
     <h3>Peak-RSS Ratio (Zig over Rust)</h3>
-    <div id=\"exampleRssChart\" class=\"chart\"></div>
+    <div id="exampleRssChart" class="chart">$example_rss_chart</div>
   </div>
 
-  <div class=\"card\">
+  <div class="card">
     <h2>Fib5000 Proof Flow</h2>
-    <p>Shared top-level prove stages are shown side-by-side for Rust and Zig. Zig also breaks out the two main internal regions we are actively optimizing: <span class=\"mono\">main_trace_commit</span> and <span class=\"mono\">core_prove</span>.</p>
-    <div id=\"fib5000FlowLegend\" class=\"flow-legend\"></div>
-    <div id=\"fib5000FlowBars\" class=\"flow-chart\"></div>
-    <table id=\"fib5000FlowTable\">
+    <p>Shared top-level prove stages are shown side-by-side for Rust and Zig. Zig also breaks out the two main internal regions we are actively optimizing: <span class="mono">main_trace_commit</span> and <span class="mono">core_prove</span>.</p>
+    <div id="fib5000FlowLegend" class="flow-legend">$flow_legend</div>
+    <div id="fib5000FlowBars" class="flow-chart">$flow_bars</div>
+    <table id="fib5000FlowTable">
       <thead>
         <tr>
           <th>Stage</th>
@@ -389,23 +450,23 @@ def render_index_html() -> str:
           <th>Zig/Rust</th>
         </tr>
       </thead>
-      <tbody></tbody>
+      <tbody>$flow_table_rows</tbody>
     </table>
-    <div class=\"flow-detail-grid\">
+    <div class="flow-detail-grid">
       <div>
         <h3>Zig main_trace_commit</h3>
-        <div id=\"fib5000MainTraceDetail\" class=\"chart\"></div>
+        <div id="fib5000MainTraceDetail" class="chart">$flow_main_trace_detail</div>
       </div>
       <div>
         <h3>Zig core_prove</h3>
-        <div id=\"fib5000CoreProveDetail\" class=\"chart\"></div>
+        <div id="fib5000CoreProveDetail" class="chart">$flow_core_prove_detail</div>
       </div>
     </div>
   </div>
 
-  <div class=\"card\">
+  <div class="card">
     <h2>Example Raw Metrics</h2>
-    <table id=\"exampleTable\">
+    <table id="exampleTable">
       <thead>
         <tr>
           <th>Workload</th>
@@ -424,317 +485,286 @@ def render_index_html() -> str:
           <th>Zig Verify (s)</th>
         </tr>
       </thead>
-      <tbody></tbody>
+      <tbody>$example_table_rows</tbody>
     </table>
-    <p class=\"mono\" id=\"meta\"></p>
+    <p class="mono" id="meta">$meta</p>
   </div>
+</body>
+</html>
+"""
+)
+RATIO_KEYS = (
+    "zig_over_rust_prove",
+    "zig_over_rust_verify",
+    "zig_over_rust_proof_wire_bytes",
+    "zig_over_rust_peak_rss_kb",
+)
+FLOW_PALETTE = (
+    "#1f6feb",
+    "#2a9d8f",
+    "#fb8500",
+    "#8b5cf6",
+    "#e63946",
+    "#0e9f6e",
+    "#f4a261",
+    "#577590",
+    "#4361ee",
+    "#9c6644",
+    "#3a86ff",
+    "#bc4749",
+    "#6a4c93",
+    "#2d6a4f",
+)
+
+
+def compute_shared_axis_max(rows: list[FamilyRow | ExampleRow]) -> float:
+    values = [
+        value
+        for row in rows
+        for value in (getattr(row, key) for key in RATIO_KEYS)
+        if math.isfinite(value) and value >= 0
+    ]
+    observed_max = max(values) if values else 1.0
+    return max(1.0, math.ceil(observed_max * 10.0) / 10.0)
 
-  <script src=\"data.js\"></script>
-  <script>
-    const data = window.BENCHMARK_PAGE_DATA;
-    const familyRows = data.family_rows || [];
-    const exampleRows = data.example_rows || [];
-    const fib5000Flow = data.fib5000_flow || null;
-
-    const ratioKeys = [
-      'zig_over_rust_prove',
-      'zig_over_rust_verify',
-      'zig_over_rust_proof_wire_bytes',
-      'zig_over_rust_peak_rss_kb',
-    ];
-
-    function computeSharedAxisMax(family, examples) {
-      const values = [];
-      [family, examples].forEach((rows) => {
-        rows.forEach((row) => {
-          ratioKeys.forEach((key) => {
-            const value = Number(row[key]);
-            if (Number.isFinite(value) && value >= 0) {
-              values.push(value);
-            }
-          });
-        });
-      });
-      const observedMax = values.length > 0 ? Math.max(...values) : 1.0;
-      return Math.max(1.0, Math.ceil(observedMax * 10.0) / 10.0);
-    }
-
-    function computeSecondsAxisMax(rows) {
-      const values = rows.map((row) => Number(row.seconds));
-      const observedMax = values.length > 0 ? Math.max(...values) : 1.0;
-      return Math.max(0.001, Math.ceil(observedMax * 1000.0) / 1000.0);
-    }
 
-    function flowColor(index) {
-      const palette = ['#1f6feb', '#2a9d8f', '#fb8500', '#8b5cf6', '#e63946', '#0e9f6e', '#f4a261', '#577590', '#4361ee', '#9c6644', '#3a86ff', '#bc4749', '#6a4c93', '#2d6a4f'];
-      return palette[index % palette.length];
-    }
+def compute_seconds_axis_max(rows: list[dict[str, Any]]) -> float:
+    observed_max = max((float(row["seconds"]) for row in rows), default=1.0)
+    return max(0.001, math.ceil(observed_max * 1000.0) / 1000.0)
 
-    function renderAxisRow(target, axisMax, oneMarkerPct) {
-      const label = document.createElement('div');
-      label.className = 'label chart-axis-label';
-      label.textContent = 'shared scale';
-
-      const wrap = document.createElement('div');
-      wrap.className = 'bar-wrap axis-wrap';
-
-      const tickLeft = document.createElement('div');
-      tickLeft.className = 'axis-tick left';
-      tickLeft.textContent = '0.0x';
-      wrap.appendChild(tickLeft);
-
-      const tickOne = document.createElement('div');
-      tickOne.className = 'axis-tick';
-      tickOne.style.left = `${oneMarkerPct.toFixed(4)}%`;
-      tickOne.textContent = '1.0x';
-      wrap.appendChild(tickOne);
-
-      const tickRight = document.createElement('div');
-      tickRight.className = 'axis-tick right';
-      tickRight.textContent = `${axisMax.toFixed(1)}x`;
-      wrap.appendChild(tickRight);
-
-      const value = document.createElement('div');
-      value.className = 'value';
-      value.textContent = 'ratio';
-
-      target.appendChild(label);
-      target.appendChild(wrap);
-      target.appendChild(value);
-    }
 
-    function renderSecondsAxisRow(target, axisMax) {
-      const label = document.createElement('div');
-      label.className = 'label chart-axis-label';
-      label.textContent = 'seconds';
+def chart_cell(label: str, bar: str, value: str, label_class: str = "label") -> str:
+    return (
+        f'<div class="{label_class}">{html.escape(label)}</div>'
+        f"{bar}"
+        f'<div class="value">{html.escape(value)}</div>'
+    )
 
-      const wrap = document.createElement('div');
-      wrap.className = 'bar-wrap axis-wrap';
 
-      const tickLeft = document.createElement('div');
-      tickLeft.className = 'axis-tick left';
-      tickLeft.textContent = '0.000s';
-      wrap.appendChild(tickLeft);
+def render_ratio_chart(
+    rows: list[FamilyRow] | list[ExampleRow],
+    key: str,
+    bar_class: str,
+    label_attr: str,
+    axis_max: float,
+) -> str:
+    one_marker_pct = min((1.0 / axis_max) * 100.0, 100.0)
+    axis = (
+        '<div class="bar-wrap axis-wrap">'
+        '<div class="axis-tick left">0.0x</div>'
+        f'<div class="axis-tick" style="left: {one_marker_pct:.4f}%;">1.0x</div>'
+        f'<div class="axis-tick right">{axis_max:.1f}x</div>'
+        "</div>"
+    )
+    parts = [chart_cell("shared scale", axis, "ratio", "label chart-axis-label")]
+    for row in rows:
+        value = getattr(row, key)
+        pct = min((value / axis_max) * 100, 100)
+        bar = (
+            '<div class="bar-wrap">'
+            f'<div class="one-marker" style="left: {one_marker_pct:.4f}%;"></div>'
+            f'<div class="bar {bar_class}" style="width: {pct:.2f}%;"></div>'
+            "</div>"
+        )
+        parts.append(chart_cell(getattr(row, label_attr), bar, f"{value:.6f}"))
+    return "".join(parts)
 
-      const tickRight = document.createElement('div');
-      tickRight.className = 'axis-tick right';
-      tickRight.textContent = `${axisMax.toFixed(3)}s`;
-      wrap.appendChild(tickRight);
 
-      const value = document.createElement('div');
-      value.className = 'value';
-      value.textContent = 'sec';
+def render_seconds_chart(rows: list[dict[str, Any]]) -> str:
+    axis_max = compute_seconds_axis_max(rows)
+    axis = (
+        '<div class="bar-wrap axis-wrap">'
+        '<div class="axis-tick left">0.000s</div>'
+        f'<div class="axis-tick right">{axis_max:.3f}s</div>'
+        "</div>"
+    )
+    parts = [chart_cell("seconds", axis, "sec", "label chart-axis-label")]
+    for row in rows:
+        seconds = float(row["seconds"])
+        pct = min((seconds / axis_max) * 100, 100)
+        bar = f'<div class="bar-wrap"><div class="bar detail" style="width: {pct:.2f}%;"></div></div>'
+        parts.append(chart_cell(str(row["id"]), bar, f"{seconds:.6f}s"))
+    return "".join(parts)
+
+
+def flow_color(index: int) -> str:
+    return FLOW_PALETTE[index % len(FLOW_PALETTE)]
+
+
+def render_flow_legend(flow: dict[str, Any]) -> str:
+    return "".join(
+        '<div class="flow-legend-item">'
+        f'<span class="flow-swatch" style="background: {flow_color(row["color_index"])};"></span>'
+        f"<span>{html.escape(row['id'])}</span>"
+        "</div>"
+        for row in flow["top_level_rows"]
+    )
 
-      target.appendChild(label);
-      target.appendChild(wrap);
-      target.appendChild(value);
-    }
 
-    function renderBars(rows, targetId, key, barClass, labelKey, axisMax, oneMarkerPct) {
-      const target = document.getElementById(targetId);
-      renderAxisRow(target, axisMax, oneMarkerPct);
-      rows.forEach((r) => {
-        const label = document.createElement('div');
-        label.className = 'label';
-        label.textContent = r[labelKey];
-
-        const wrap = document.createElement('div');
-        wrap.className = 'bar-wrap';
-
-        const marker = document.createElement('div');
-        marker.className = 'one-marker';
-        marker.style.left = `${oneMarkerPct.toFixed(4)}%`;
-        wrap.appendChild(marker);
-
-        const bar = document.createElement('div');
-        bar.className = `bar ${barClass}`;
-        const pct = Math.min((Number(r[key]) / axisMax) * 100, 100);
-        bar.style.width = `${pct.toFixed(2)}%`;
-        wrap.appendChild(bar);
-
-        const value = document.createElement('div');
-        value.className = 'value';
-        value.textContent = Number(r[key]).toFixed(6);
-
-        target.appendChild(label);
-        target.appendChild(wrap);
-        target.appendChild(value);
-      });
-    }
+def render_flow_bars(flow: dict[str, Any]) -> str:
+    parts: list[str] = []
+    for runtime, label in (("rust", "Rust"), ("zig", "Zig")):
+        total = float(flow[f"{runtime}_total_seconds"])
+        segments = []
+        for row in flow["top_level_rows"]:
+            share = float(row[f"{runtime}_share"])
+            title = f"{row['id']}: {float(row[f'{runtime}_seconds']):.6f}s ({share * 100.0:.2f}%)"
+            segments.append(
+                f'<div class="flow-segment" style="background: {flow_color(row["color_index"])}; '
+                f'width: {max(share * 100.0, 0.4):.3f}%;" title="{html.escape(title)}"></div>'
+            )
+        stack = f'<div class="flow-stack">{"".join(segments)}</div>'
+        parts.append(chart_cell(f"{label} ({total:.3f}s)", stack, f"{total:.6f}s"))
+    return "".join(parts)
+
+
+def table_row(cells: list[str]) -> str:
+    return "<tr>" + "".join(f"<td>{cell}</td>" for cell in cells) + "</tr>"
+
+
+def render_flow_table_rows(flow: dict[str, Any]) -> str:
+    return "".join(
+        table_row(
+            [
+                f'<span class="flow-swatch" style="background: {flow_color(row["color_index"])};"></span> '
+                + html.escape(row["id"]),
+                f"{row['rust_seconds']:.6f}",
+                f"{row['rust_share'] * 100.0:.2f}%",
+                f"{row['zig_seconds']:.6f}",
+                f"{row['zig_share'] * 100.0:.2f}%",
+                f"{row['zig_over_rust']:.6f}",
+            ]
+        )
+        for row in flow["top_level_rows"]
+    )
 
-    function renderSecondsBars(rows, targetId) {
-      const target = document.getElementById(targetId);
-      const axisMax = computeSecondsAxisMax(rows);
-      renderSecondsAxisRow(target, axisMax);
-      rows.forEach((row) => {
-        const label = document.createElement('div');
-        label.className = 'label';
-        label.textContent = row.id;
-
-        const wrap = document.createElement('div');
-        wrap.className = 'bar-wrap';
-
-        const bar = document.createElement('div');
-        bar.className = 'bar detail';
-        bar.style.width = `${Math.min((Number(row.seconds) / axisMax) * 100, 100).toFixed(2)}%`;
-        wrap.appendChild(bar);
-
-        const value = document.createElement('div');
-        value.className = 'value';
-        value.textContent = `${Number(row.seconds).toFixed(6)}s`;
-
-        target.appendChild(label);
-        target.appendChild(wrap);
-        target.appendChild(value);
-      });
-    }
 
-    function renderFlowLegend(flow) {
-      const target = document.getElementById('fib5000FlowLegend');
-      flow.top_level_rows.forEach((row) => {
-        const item = document.createElement('div');
-        item.className = 'flow-legend-item';
-        const swatch = document.createElement('span');
-        swatch.className = 'flow-swatch';
-        swatch.style.background = flowColor(row.color_index);
-        item.appendChild(swatch);
-        const label = document.createElement('span');
-        label.textContent = row.id;
-        item.appendChild(label);
-        target.appendChild(item);
-      });
-    }
+def render_family_table_rows(rows: list[FamilyRow]) -> str:
+    return "".join(
+        table_row(
+            [
+                html.escape(row.family),
+                html.escape(row.example),
+                f"{row.zig_over_rust_prove:.6f}",
+                f"{row.zig_over_rust_verify:.6f}",
+                f"{row.zig_over_rust_proof_wire_bytes:.6f}",
+                f"{row.zig_over_rust_peak_rss_kb:.6f}",
+                f"{row.rust_peak_rss_kb:.2f}",
+                f"{row.zig_peak_rss_kb:.2f}",
+                f"{row.rust_prove_avg_seconds:.6f}",
+                f"{row.zig_prove_avg_seconds:.6f}",
+                f"{row.rust_verify_avg_seconds:.6f}",
+                f"{row.zig_verify_avg_seconds:.6f}",
+            ]
+        )
+        for row in rows
+    )
 
-    function renderFlowBars(flow) {
-      const target = document.getElementById('fib5000FlowBars');
-      const runtimes = [
-        { key: 'rust', label: `Rust (${Number(flow.rust_total_seconds).toFixed(3)}s)` },
-        { key: 'zig', label: `Zig (${Number(flow.zig_total_seconds).toFixed(3)}s)` },
-      ];
-      runtimes.forEach((runtime) => {
-        const label = document.createElement('div');
-        label.className = 'label';
-        label.textContent = runtime.label;
-
-        const stack = document.createElement('div');
-        stack.className = 'flow-stack';
-        flow.top_level_rows.forEach((row) => {
-          const segment = document.createElement('div');
-          segment.className = 'flow-segment';
-          segment.style.background = flowColor(row.color_index);
-          const share = Number(row[`${runtime.key}_share`]);
-          segment.style.width = `${Math.max(share * 100.0, 0.4).toFixed(3)}%`;
-          segment.title = `${row.id}: ${Number(row[`${runtime.key}_seconds`]).toFixed(6)}s (${(share * 100.0).toFixed(2)}%)`;
-          stack.appendChild(segment);
-        });
-
-        const value = document.createElement('div');
-        value.className = 'value';
-        value.textContent = `${Number(flow[`${runtime.key}_total_seconds`]).toFixed(6)}s`;
-
-        target.appendChild(label);
-        target.appendChild(stack);
-        target.appendChild(value);
-      });
-    }
 
-    function renderFlowTable(flow) {
-      const body = document.querySelector('#fib5000FlowTable tbody');
-      flow.top_level_rows.forEach((row) => {
-        const tr = document.createElement('tr');
-        tr.innerHTML = `
-          <td><span class=\"flow-swatch\" style=\"background:${flowColor(row.color_index)}\"></span> ${row.id}</td>
-          <td>${Number(row.rust_seconds).toFixed(6)}</td>
-          <td>${(Number(row.rust_share) * 100.0).toFixed(2)}%</td>
-          <td>${Number(row.zig_seconds).toFixed(6)}</td>
-          <td>${(Number(row.zig_share) * 100.0).toFixed(2)}%</td>
-          <td>${Number(row.zig_over_rust).toFixed(6)}</td>
-        `;
-        body.appendChild(tr);
-      });
-    }
+def render_example_table_rows(rows: list[ExampleRow]) -> str:
+    return "".join(
+        table_row(
+            [
+                html.escape(row.name),
+                html.escape(row.example),
+                f"{row.zig_over_rust_prove:.6f}",
+                f"{row.zig_over_rust_verify:.6f}",
+                f"{row.zig_over_rust_proof_wire_bytes:.6f}",
+                f"{row.zig_over_rust_peak_rss_kb:.6f}",
+                f"{row.rust_prove_rss_peak_kb:.2f}",
+                f"{row.zig_prove_rss_peak_kb:.2f}",
+                f"{row.rust_verify_rss_peak_kb:.2f}",
+                f"{row.zig_verify_rss_peak_kb:.2f}",
+                f"{row.rust_prove_avg_seconds:.6f}",
+                f"{row.zig_prove_avg_seconds:.6f}",
+                f"{row.rust_verify_avg_seconds:.6f}",
+                f"{row.zig_verify_avg_seconds:.6f}",
+            ]
+        )
+        for row in rows
+    )
 
-    const sharedAxisMax = computeSharedAxisMax(familyRows, exampleRows);
-    const oneMarkerPct = Math.min((1.0 / sharedAxisMax) * 100.0, 100.0);
-
-    renderBars(familyRows, 'familyProveChart', 'zig_over_rust_prove', 'prove', 'family', sharedAxisMax, oneMarkerPct);
-    renderBars(familyRows, 'familyVerifyChart', 'zig_over_rust_verify', 'verify', 'family', sharedAxisMax, oneMarkerPct);
-    renderBars(familyRows, 'familySizeChart', 'zig_over_rust_proof_wire_bytes', 'size', 'family', sharedAxisMax, oneMarkerPct);
-    renderBars(familyRows, 'familyRssChart', 'zig_over_rust_peak_rss_kb', 'rss', 'family', sharedAxisMax, oneMarkerPct);
-
-    renderBars(exampleRows, 'exampleProveChart', 'zig_over_rust_prove', 'prove', 'name', sharedAxisMax, oneMarkerPct);
-    renderBars(exampleRows, 'exampleVerifyChart', 'zig_over_rust_verify', 'verify', 'name', sharedAxisMax, oneMarkerPct);
-    renderBars(exampleRows, 'exampleSizeChart', 'zig_over_rust_proof_wire_bytes', 'size', 'name', sharedAxisMax, oneMarkerPct);
-    renderBars(exampleRows, 'exampleRssChart', 'zig_over_rust_peak_rss_kb', 'rss', 'name', sharedAxisMax, oneMarkerPct);
-
-    const familyBody = document.querySelector('#familyTable tbody');
-    familyRows.forEach((r) => {
-      const tr = document.createElement('tr');
-      tr.innerHTML = `
-        <td>${r.family}</td>
-        <td>${r.example}</td>
-        <td>${Number(r.zig_over_rust_prove).toFixed(6)}</td>
-        <td>${Number(r.zig_over_rust_verify).toFixed(6)}</td>
-        <td>${Number(r.zig_over_rust_proof_wire_bytes).toFixed(6)}</td>
-        <td>${Number(r.zig_over_rust_peak_rss_kb).toFixed(6)}</td>
-        <td>${Number(r.rust_peak_rss_kb).toFixed(2)}</td>
-        <td>${Number(r.zig_peak_rss_kb).toFixed(2)}</td>
-        <td>${Number(r.rust_prove_avg_seconds).toFixed(6)}</td>
-        <td>${Number(r.zig_prove_avg_seconds).toFixed(6)}</td>
-        <td>${Number(r.rust_verify_avg_seconds).toFixed(6)}</td>
-        <td>${Number(r.zig_verify_avg_seconds).toFixed(6)}</td>
-      `;
-      familyBody.appendChild(tr);
-    });
-
-    const exampleBody = document.querySelector('#exampleTable tbody');
-    exampleRows.forEach((r) => {
-      const tr = document.createElement('tr');
-      tr.innerHTML = `
-        <td>${r.name}</td>
-        <td>${r.example}</td>
-        <td>${Number(r.zig_over_rust_prove).toFixed(6)}</td>
-        <td>${Number(r.zig_over_rust_verify).toFixed(6)}</td>
-        <td>${Number(r.zig_over_rust_proof_wire_bytes).toFixed(6)}</td>
-        <td>${Number(r.zig_over_rust_peak_rss_kb).toFixed(6)}</td>
-        <td>${Number(r.rust_prove_rss_peak_kb).toFixed(2)}</td>
-        <td>${Number(r.zig_prove_rss_peak_kb).toFixed(2)}</td>
-        <td>${Number(r.rust_verify_rss_peak_kb).toFixed(2)}</td>
-        <td>${Number(r.zig_verify_rss_peak_kb).toFixed(2)}</td>
-        <td>${Number(r.rust_prove_avg_seconds).toFixed(6)}</td>
-        <td>${Number(r.zig_prove_avg_seconds).toFixed(6)}</td>
-        <td>${Number(r.rust_verify_avg_seconds).toFixed(6)}</td>
-        <td>${Number(r.zig_verify_avg_seconds).toFixed(6)}</td>
-      `;
-      exampleBody.appendChild(tr);
-    });
-
-    if (fib5000Flow) {
-      renderFlowLegend(fib5000Flow);
-      renderFlowBars(fib5000Flow);
-      renderFlowTable(fib5000Flow);
-      renderSecondsBars(fib5000Flow.zig_main_trace_commit || [], 'fib5000MainTraceDetail');
-      renderSecondsBars(fib5000Flow.zig_core_prove || [], 'fib5000CoreProveDetail');
-    }
 
-    document.getElementById('meta').textContent = `schema=${data.schema_version} | families_source=${data.sources.families_report} | examples_source=${data.sources.examples_report} | shared_ratio_axis_max=${sharedAxisMax.toFixed(1)}x`;
-  </script>
-</body>
-</html>
-"""
+def render_index_html(payload: dict[str, Any]) -> str:
+    family_rows = payload["family_rows"]
+    example_rows = payload["example_rows"]
+    flow = payload["fib5000_flow"]
+    axis_max = compute_shared_axis_max([*family_rows, *example_rows])
+
+    charts: dict[str, str] = {}
+    for prefix, rows, label_attr in (("family", family_rows, "family"), ("example", example_rows, "name")):
+        for suffix, key, bar_class in (
+            ("prove", "zig_over_rust_prove", "prove"),
+            ("verify", "zig_over_rust_verify", "verify"),
+            ("size", "zig_over_rust_proof_wire_bytes", "size"),
+            ("rss", "zig_over_rust_peak_rss_kb", "rss"),
+        ):
+            charts[f"{prefix}_{suffix}_chart"] = render_ratio_chart(rows, key, bar_class, label_attr, axis_max)
+
+    meta = (
+        f"schema={payload['schema_version']} | families_source={payload['sources']['families_report']} | "
+        f"examples_source={payload['sources']['examples_report']} | shared_ratio_axis_max={axis_max:.1f}x"
+    )
+    return INDEX_HTML_TEMPLATE.substitute(
+        charts,
+        family_table_rows=render_family_table_rows(family_rows),
+        example_table_rows=render_example_table_rows(example_rows),
+        flow_legend=render_flow_legend(flow),
+        flow_bars=render_flow_bars(flow),
+        flow_table_rows=render_flow_table_rows(flow),
+        flow_main_trace_detail=render_seconds_chart(flow["zig_main_trace_commit"]),
+        flow_core_prove_detail=render_seconds_chart(flow["zig_core_prove"]),
+        meta=html.escape(meta),
+    )
 
 
 def load_ok_report(path: Path, label: str) -> dict[str, Any]:
     if not path.exists():
         raise RuntimeError(f"missing {label}: {path}")
-    report = json.loads(path.read_text(encoding="utf-8"))
+    report = loads_json(path.read_bytes())
     if report.get("status") != "ok":
         raise RuntimeError(f"{label} status is not ok: {path}")
     return report
 
 
+def asset_digest(source: Path | bytes) -> bytes:
+    # Streams files in 1 MiB chunks so validation holds one copy of each asset.
+    hasher = hashlib.blake2b(digest_size=16)
+    if isinstance(source, bytes):
+        hasher.update(source)
+        return hasher.digest()
+    with source.open("rb") as fp:
+        for chunk in iter(lambda: fp.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.digest()
+
+
+def asset_is_current(path: Path, expected: bytes) -> bool:
+    # A size mismatch rejects without reading the file.
+    return path.stat().st_size == len(expected) and asset_digest(path) == asset_digest(expected)
+
+
+def write_asset(path: Path, content: bytes) -> None:
+    # Write to a sibling temp file and rename over the target, so an interrupted
+    # run never leaves a truncated asset for --validate to trip over.
+    staging = path.with_name(path.name + ".tmp")
+    fd = os.open(staging, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+    os.replace(staging, path)
+
+
 def main() -> int:
     args = parse_args()
+
+    out_dir = args.out_dir
+    out_data = out_dir / "data.js"
+    out_index = out_dir / "index.html"
+
     family_report = load_ok_report(args.source_report, "family benchmark report")
     examples_report = load_ok_report(args.examples_report, "examples benchmark report")
 
@@ -744,25 +774,21 @@ def main() -> int:
         examples_report,
         args.examples_report,
     )
-    rendered_js = render_data_js(payload)
-    rendered_html = render_index_html()
-
-    out_dir = args.out_dir
-    out_data = out_dir / "data.js"
-    out_index = out_dir / "index.html"
+    rendered_js = render_data_js(payload, args.pretty).encode("utf-8")
+    rendered_html = render_index_html(payload).encode("utf-8")
 
     if args.validate:
         if not out_data.exists() or not out_index.exists():
             raise RuntimeError("benchmark page assets missing; run without --validate")
-        if out_data.read_text(encoding="utf-8") != rendered_js:
+        if not asset_is_current(out_data, rendered_js):
             raise RuntimeError("benchmark data.js is stale; regenerate assets")
-        if out_index.read_text(encoding="utf-8") != rendered_html:
+        if not asset_is_current(out_index, rendered_html):
             raise RuntimeError("benchmark index.html is stale; regenerate assets")
         return 0
 
     out_dir.mkdir(parents=True, exist_ok=True)
-    out_data.write_text(rendered_js, encoding="utf-8")
-    out_index.write_text(rendered_html, encoding="utf-8")
+    write_asset(out_data, rendered_js)
+    write_asset(out_index, rendered_html)
     return 0
 
 
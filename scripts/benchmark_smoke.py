@@ -9,15 +9,35 @@ from __future__ import annotations
 
 import argparse
 import hashlib
+import io
 import json
 import os
+import queue
+import random
+import resource
 import sys
 import shutil
+import statistics
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
-import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - full-parse fallback
+    ijson = None
+
+from bench_io import (
+    append_ndjson,
+    build_if_stale,
+    loads_json,
+    publish_latest,
+    split_cpu_groups,
+    write_json_report,
+)
 
 
 ROOT = Path(__file__).resolve().parent.parent
@@ -25,12 +45,14 @@ REPORT_DEFAULT = ROOT / "vectors" / "reports" / "benchmark_smoke_report.json"
 
 RUST_MANIFEST = ROOT / "tools" / "stwo-interop-rs" / "Cargo.toml"
 RUST_BIN = ROOT / "tools" / "stwo-interop-rs" / "target" / "release" / "stwo-interop-rs"
+RUST_SOURCE_ROOT = RUST_MANIFEST.parent
+ZIG_SOURCE_ROOT = ROOT / "src"
 ZIG_BIN = ROOT / "vectors" / ".bench.zig_interop"
 ARTIFACT_DIR = ROOT / "vectors" / ".bench_artifacts"
 
 RUST_TOOLCHAIN_DEFAULT = "nightly-2025-07-14"
-TIME_BIN = Path("/usr/bin/time")
-RSS_RE = re.compile(r"^\s*(\d+)\s+maximum resident set size\s*$", re.MULTILINE)
+# Raw monotonic clock where available: immune to NTP slewing during a sample.
+BENCH_CLOCK_ID = getattr(time, "CLOCK_MONOTONIC_RAW", time.CLOCK_MONOTONIC)
 
 COMMON_CONFIG_ARGS = [
     "--pow-bits",
@@ -190,101 +212,200 @@ def parse_workload_set(raw: str) -> Set[str]:
     return {item.strip() for item in raw.split(",") if item.strip()}
 
 
-def run(cmd: List[str], env: Optional[Dict[str, str]] = None) -> None:
-    subprocess.run(cmd, cwd=ROOT, check=True, env=merged_env(env))
-
-
 def maxrss_to_kb(raw_maxrss: int) -> int:
-    # `/usr/bin/time -l` reports max RSS in bytes on Darwin.
+    # `ru_maxrss` is in bytes on Darwin, KB elsewhere.
     if sys.platform == "darwin":
         return int(round(raw_maxrss / 1024.0))
     return raw_maxrss
 
 
+def inherited_maxrss_kb() -> int:
+    # Linux seeds an exec'd child's ru_maxrss with the spawning process's peak
+    # RSS, so the child reports max(harness peak, own peak). Darwin's
+    # posix_spawn starts the child in a fresh address space: nothing inherited.
+    if sys.platform == "darwin":
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
 def run_timed(cmd: List[str], env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-    start = time.perf_counter()
-    if TIME_BIN.exists():
-        proc = subprocess.run(
-            [str(TIME_BIN), "-l", *cmd],
-            cwd=ROOT,
-            text=True,
-            capture_output=True,
-            check=True,
-            env=merged_env(env),
-        )
-        match = RSS_RE.search(proc.stderr)
-        peak_rss_kb = maxrss_to_kb(int(match.group(1))) if match else None
-    else:
-        subprocess.run(cmd, cwd=ROOT, check=True, env=merged_env(env))
+    # Bench commands only use absolute paths, so they run without a cwd change
+    # and with close_fds=False: that lets CPython launch them via posix_spawn
+    # instead of fork+exec (our fds are non-inheritable anyway, PEP 446).
+    # Reaping with wait4 yields the child's peak RSS directly, without a
+    # `/usr/bin/time` wrapper process or parsing its stderr.
+    start_ns = time.clock_gettime_ns(BENCH_CLOCK_ID)
+    with subprocess.Popen(cmd, env=merged_env(env), close_fds=False) as proc:
+        _, status, rusage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+    elapsed_ns = time.clock_gettime_ns(BENCH_CLOCK_ID) - start_ns
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+    # Read the harness peak after reaping: it only grows, so it bounds whatever
+    # the child inherited at exec (Popen itself allocates after any earlier read).
+    inherited_kb = inherited_maxrss_kb()
+    peak_rss_kb: Optional[int] = maxrss_to_kb(rusage.ru_maxrss)
+    if peak_rss_kb <= inherited_kb:
+        # The reading is only the inherited baseline: the child stayed below it.
         peak_rss_kb = None
-    elapsed = time.perf_counter() - start
     return {
-        "seconds": elapsed,
+        "elapsed_ns": elapsed_ns,
         "peak_rss_kb": peak_rss_kb,
     }
 
 
-def summarize_samples(
-    name: str,
-    cmd: List[str],
-    warmups: int,
-    repeats: int,
-    env: Optional[Dict[str, str]] = None,
-    stage_profile_path: Optional[Path] = None,
-) -> Dict[str, Any]:
+def check_sample_counts(warmups: int, repeats: int) -> None:
     if repeats <= 0:
         raise ValueError("--repeats must be positive")
     if warmups < 0:
         raise ValueError("--warmups must be non-negative")
 
-    raw_runs: List[Dict[str, Any]] = []
-    samples: List[float] = []
-    rss_samples: List[int] = []
-    stage_profiles: List[Dict[str, Any]] = []
 
-    for i in range(warmups + repeats):
-        if stage_profile_path is not None and stage_profile_path.exists():
-            stage_profile_path.unlink()
-        run_result = run_timed(cmd, env)
-        raw_runs.append(
-            {
-                "kind": "warmup" if i < warmups else "sample",
-                "seconds": round(run_result["seconds"], 6),
-                "peak_rss_kb": run_result["peak_rss_kb"],
-            }
-        )
-        if i >= warmups:
-            samples.append(run_result["seconds"])
-            if run_result["peak_rss_kb"] is not None:
-                rss_samples.append(int(run_result["peak_rss_kb"]))
-            if stage_profile_path is not None:
-                if not stage_profile_path.exists():
-                    raise RuntimeError(f"missing stage profile for sampled run: {stage_profile_path}")
-                stage_profiles.append(json.loads(stage_profile_path.read_text(encoding="utf-8")))
-
-    avg_seconds = sum(samples) / len(samples)
+def timed_sample(
+    cmd: List[str],
+    env: Optional[Dict[str, str]],
+    stage_profile_path: Optional[Path],
+    collect_profile: bool,
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    if stage_profile_path is not None and stage_profile_path.exists():
+        stage_profile_path.unlink()
+    run_result = run_timed(cmd, env)
+    stage_profile = None
+    if collect_profile and stage_profile_path is not None:
+        if not stage_profile_path.exists():
+            raise RuntimeError(f"missing stage profile for sampled run: {stage_profile_path}")
+        stage_profile = loads_json(stage_profile_path.read_bytes())
+    return run_result, stage_profile
+
+
+def new_sample_log() -> Dict[str, List[Any]]:
+    return {"raw_runs": [], "samples": [], "rss_samples": [], "stage_profiles": []}
+
+
+def record_sample(
+    log: Dict[str, List[Any]],
+    kind: str,
+    run_result: Dict[str, Any],
+    stage_profile: Optional[Dict[str, Any]],
+    execution_order: Optional[int] = None,
+) -> None:
+    raw_run: Dict[str, Any] = {
+        "kind": kind,
+        "seconds": ns_to_seconds(run_result["elapsed_ns"]),
+        "peak_rss_kb": run_result["peak_rss_kb"],
+    }
+    if execution_order is not None:
+        raw_run["execution_order"] = execution_order
+    log["raw_runs"].append(raw_run)
+    if kind != "sample":
+        return
+    log["samples"].append(run_result["elapsed_ns"])
+    if run_result["peak_rss_kb"] is not None:
+        log["rss_samples"].append(int(run_result["peak_rss_kb"]))
+    if stage_profile is not None:
+        log["stage_profiles"].append(stage_profile)
+
+
+def ns_to_seconds(ns: float) -> float:
+    # Samples stay integer nanoseconds until they are emitted.
+    return round(ns / 1e9, 6)
+
+
+def percentile(ordered: List[int], q: float) -> float:
+    # Linear interpolation between closest ranks (NumPy's default method).
+    pos = (len(ordered) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def sample_summary(
+    name: str,
+    cmd: List[str],
+    warmups: int,
+    repeats: int,
+    log: Dict[str, List[Any]],
+    stage_profile_path: Optional[Path],
+) -> Dict[str, Any]:
+    samples = log["samples"]
+    rss_samples = log["rss_samples"]
+    # One sort yields the extremes and the order statistics.
+    ordered = sorted(samples)
+    avg_ns = sum(samples) / len(samples)
     result: Dict[str, Any] = {
         "name": name,
         "command": cmd,
         "warmups": warmups,
         "repeats": repeats,
-        "samples_seconds": [round(v, 6) for v in samples],
-        "min_seconds": round(min(samples), 6),
-        "max_seconds": round(max(samples), 6),
-        "avg_seconds": round(avg_seconds, 6),
-        "raw_runs": raw_runs,
+        "samples_seconds": [ns_to_seconds(v) for v in samples],
+        "min_seconds": ns_to_seconds(ordered[0]),
+        "max_seconds": ns_to_seconds(ordered[-1]),
+        "avg_seconds": ns_to_seconds(avg_ns),
+        "median_seconds": ns_to_seconds(percentile(ordered, 0.5)),
+        "p95_seconds": ns_to_seconds(percentile(ordered, 0.95)),
+        "raw_runs": log["raw_runs"],
     }
+    if len(samples) > 1:
+        result["stdev_seconds"] = ns_to_seconds(statistics.stdev(samples, avg_ns))
     if rss_samples:
         result["rss_samples_kb"] = rss_samples
         result["rss_avg_kb"] = round(sum(rss_samples) / len(rss_samples), 2)
         result["rss_peak_kb"] = max(rss_samples)
     if stage_profile_path is not None and stage_profile_path.exists():
         stage_profile_path.unlink()
-    if stage_profiles:
-        result["stage_flow"] = average_stage_profiles(stage_profiles)
+    if log["stage_profiles"]:
+        result["stage_flow"] = average_stage_profiles(log["stage_profiles"])
     return result
 
 
+def summarize_samples(
+    name: str,
+    cmd: List[str],
+    warmups: int,
+    repeats: int,
+    env: Optional[Dict[str, str]] = None,
+    stage_profile_path: Optional[Path] = None,
+) -> Dict[str, Any]:
+    check_sample_counts(warmups, repeats)
+    log = new_sample_log()
+    for i in range(warmups + repeats):
+        run_result, stage_profile = timed_sample(cmd, env, stage_profile_path, collect_profile=i >= warmups)
+        record_sample(log, "warmup" if i < warmups else "sample", run_result, stage_profile)
+    return sample_summary(name, cmd, warmups, repeats, log, stage_profile_path)
+
+
+def run_matrix(
+    specs: List[Dict[str, Any]],
+    warmups: int,
+    repeats: int,
+    rng: random.Random,
+) -> List[Dict[str, Any]]:
+    # Warmups run first, round-robin across specs; measured samples are then
+    # shuffled so no spec systematically runs on a hotter (or cooler) CPU.
+    # Each raw run records its position in the execution order for auditing.
+    check_sample_counts(warmups, repeats)
+    order = [(spec_idx, i) for i in range(warmups) for spec_idx in range(len(specs))]
+    sample_order = [(spec_idx, i) for spec_idx in range(len(specs)) for i in range(warmups, warmups + repeats)]
+    rng.shuffle(sample_order)
+    order.extend(sample_order)
+
+    logs = [new_sample_log() for _ in specs]
+    for execution_order, (spec_idx, i) in enumerate(order):
+        spec = specs[spec_idx]
+        is_sample = i >= warmups
+        run_result, stage_profile = timed_sample(
+            spec["cmd"],
+            spec["env"],
+            spec["stage_profile_path"],
+            collect_profile=is_sample,
+        )
+        record_sample(logs[spec_idx], "sample" if is_sample else "warmup", run_result, stage_profile, execution_order)
+    return [
+        sample_summary(spec["name"], spec["cmd"], warmups, repeats, log, spec["stage_profile_path"])
+        for spec, log in zip(specs, logs)
+    ]
+
+
 def average_stage_profiles(profiles: List[Dict[str, Any]]) -> Dict[str, Any]:
     if not profiles:
         raise ValueError("stage profiles are empty")
@@ -330,36 +451,141 @@ def average_stage_nodes(stage_lists: List[Any]) -> List[Dict[str, Any]]:
     return averaged
 
 
-def proof_metrics(artifact_path: Path) -> Dict[str, Any]:
-    artifact = json.loads(artifact_path.read_text(encoding="utf-8"))
-    proof_hex = artifact["proof_bytes_hex"]
-    proof_bytes = bytes.fromhex(proof_hex)
-    proof = json.loads(proof_bytes.decode("utf-8"))
+# Array-item prefixes (ijson event paths) counted when streaming a proof.
+PROOF_ITEM_PREFIXES = {
+    "commitments.item": "commitments",
+    "decommitments.item": "decommitments",
+    "decommitments.item.hash_witness.item": "trace_decommit_hashes",
+    "fri_proof.first_layer.fri_witness.item": "fri_first_layer_witness",
+    "fri_proof.first_layer.decommitment.hash_witness.item": "fri_first_hashes",
+    "fri_proof.inner_layers.item": "fri_inner_layers",
+    "fri_proof.inner_layers.item.decommitment.hash_witness.item": "fri_inner_hashes",
+    "fri_proof.last_layer_poly.item": "fri_last_layer_poly",
+}
+ITEM_START_SKIP_EVENTS = {"map_key", "end_map", "end_array"}
+
+
+def proof_shape_counts(proof_bytes: bytes) -> Dict[str, int]:
+    # Only array lengths are needed, so with a C ijson backend the proof is
+    # streamed and counted instead of being materialized as a nested dict.
+    if ijson is not None and ijson.backend in ("yajl2_c", "yajl2_cffi"):
+        counts = dict.fromkeys(PROOF_ITEM_PREFIXES.values(), 0)
+        for prefix, event, _ in ijson.parse(io.BytesIO(proof_bytes)):
+            key = PROOF_ITEM_PREFIXES.get(prefix)
+            if key is not None and event not in ITEM_START_SKIP_EVENTS:
+                counts[key] += 1
+        return counts
+
+    proof = loads_json(proof_bytes)
+    fri_proof = proof["fri_proof"]
+    return {
+        "commitments": len(proof["commitments"]),
+        "decommitments": len(proof["decommitments"]),
+        "trace_decommit_hashes": sum(
+            len(decommitment["hash_witness"]) for decommitment in proof["decommitments"]
+        ),
+        "fri_first_layer_witness": len(fri_proof["first_layer"]["fri_witness"]),
+        "fri_first_hashes": len(fri_proof["first_layer"]["decommitment"]["hash_witness"]),
+        "fri_inner_layers": len(fri_proof["inner_layers"]),
+        "fri_inner_hashes": sum(
+            len(layer["decommitment"]["hash_witness"]) for layer in fri_proof["inner_layers"]
+        ),
+        "fri_last_layer_poly": len(fri_proof["last_layer_poly"]),
+    }
 
-    trace_decommit_hashes = sum(
-        len(decommitment["hash_witness"]) for decommitment in proof["decommitments"]
-    )
-    fri_first_hashes = len(proof["fri_proof"]["first_layer"]["decommitment"]["hash_witness"])
-    fri_inner_hashes = sum(
-        len(layer["decommitment"]["hash_witness"]) for layer in proof["fri_proof"]["inner_layers"]
-    )
+
+def flat_array_len(proof_bytes: bytes, key: bytes, start: int, stop: int) -> Optional[Tuple[int, int]]:
+    # Length of the array under `key` whose items are flat int arrays (hashes,
+    # QM31 values), found with C-level bytes scans. None when `key` is missing
+    # or an item is not an int array (std.json writes UTF-8-valid [32]u8 as a
+    # string), in which case "]]" no longer marks the end of the array.
+    begin = proof_bytes.find(key, start, stop)
+    if begin < 0:
+        return None
+    begin += len(key)
+    if proof_bytes.startswith(b"[]", begin):
+        return 0, begin + 2
+    end = proof_bytes.find(b"]]", begin, stop)
+    if end < 0 or proof_bytes.find(b'"', begin, end) >= 0:
+        return None
+    return proof_bytes.count(b"[", begin + 1, end), end + 2
+
+
+def hash_witness_totals(proof_bytes: bytes, start: int, stop: int) -> Optional[Tuple[int, int]]:
+    # (decommitment count, total hashes) over the hash_witness arrays in a range.
+    decommitments = hashes = 0
+    pos = start
+    while True:
+        found = flat_array_len(proof_bytes, b'"hash_witness":', pos, stop)
+        if found is None:
+            break
+        decommitments += 1
+        hashes += found[0]
+        pos = found[1]
+    if proof_bytes.find(b'"hash_witness":', pos, stop) >= 0:
+        return None
+    return decommitments, hashes
+
+
+def proof_shape_counts_fast(proof_bytes: bytes) -> Optional[Dict[str, int]]:
+    # Both wire encoders (serde_json::to_vec, std.json.Stringify) write compact
+    # JSON with ProofWire fields in declaration order, so every count can be
+    # read off key positions without parsing. Returns None on any deviation.
+    fri_start = proof_bytes.find(b'"fri_proof":')
+    inner_start = proof_bytes.find(b'"inner_layers":', fri_start)
+    last_start = proof_bytes.find(b'"last_layer_poly":', inner_start)
+    if min(fri_start, inner_start, last_start) < 0:
+        return None
+    commitments = flat_array_len(proof_bytes, b'"commitments":', 0, fri_start)
+    trace = hash_witness_totals(proof_bytes, 0, fri_start)
+    first_witness = flat_array_len(proof_bytes, b'"fri_witness":', fri_start, inner_start)
+    first = hash_witness_totals(proof_bytes, fri_start, inner_start)
+    inner = hash_witness_totals(proof_bytes, inner_start, last_start)
+    last_layer_poly = flat_array_len(proof_bytes, b'"last_layer_poly":', last_start, len(proof_bytes))
+    if None in (commitments, trace, first_witness, first, inner, last_layer_poly) or first[0] != 1:
+        return None
+    return {
+        "commitments": commitments[0],
+        "decommitments": trace[0],
+        "trace_decommit_hashes": trace[1],
+        "fri_first_layer_witness": first_witness[0],
+        "fri_first_hashes": first[1],
+        "fri_inner_layers": inner[0],
+        "fri_inner_hashes": inner[1],
+        "fri_last_layer_poly": last_layer_poly[0],
+    }
+
+
+def proof_metrics(artifact_path: Path, fast: bool = False) -> Dict[str, Any]:
+    artifact = loads_json(artifact_path.read_bytes())
+    proof_bytes = bytes.fromhex(artifact["proof_bytes_hex"])
+    counts = proof_shape_counts_fast(proof_bytes) if fast else None
+    if counts is None:
+        counts = proof_shape_counts(proof_bytes)
 
     return {
         "artifact_bytes": artifact_path.stat().st_size,
         "proof_wire_bytes": len(proof_bytes),
-        "commitments_count": len(proof["commitments"]),
-        "decommitments_count": len(proof["decommitments"]),
-        "trace_decommit_hashes": trace_decommit_hashes,
-        "fri_inner_layers_count": len(proof["fri_proof"]["inner_layers"]),
-        "fri_first_layer_witness_len": len(proof["fri_proof"]["first_layer"]["fri_witness"]),
-        "fri_last_layer_poly_len": len(proof["fri_proof"]["last_layer_poly"]),
-        "fri_decommit_hashes_total": fri_first_hashes + fri_inner_hashes,
+        "commitments_count": counts["commitments"],
+        "decommitments_count": counts["decommitments"],
+        "trace_decommit_hashes": counts["trace_decommit_hashes"],
+        "fri_inner_layers_count": counts["fri_inner_layers"],
+        "fri_first_layer_witness_len": counts["fri_first_layer_witness"],
+        "fri_last_layer_poly_len": counts["fri_last_layer_poly"],
+        "fri_decommit_hashes_total": counts["fri_first_hashes"] + counts["fri_inner_hashes"],
     }
 
 
+# Shared encoder: json.dumps builds a fresh JSONEncoder on every call that
+# passes non-default options.
+CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
 def canonical_hash(payload: Any) -> str:
-    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return hashlib.sha256(encoded).hexdigest()
+    # The digest only fingerprints settings, so OpenSSL's FIPS gate is skipped.
+    hasher = hashlib.sha256(usedforsecurity=False)
+    hasher.update(CANONICAL_ENCODER.encode(payload).encode("utf-8"))
+    return hasher.hexdigest()
 
 
 def workload_matrix(workloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -373,17 +599,21 @@ def workload_matrix(workloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     ]
 
 
-def ensure_binaries(rust_toolchain: str, zig_opt_mode: str, zig_cpu: str) -> None:
-    run(
-        [
-            "cargo",
-            f"+{rust_toolchain}",
-            "build",
-            "--release",
-            "--manifest-path",
-            str(RUST_MANIFEST),
-        ]
-    )
+def ensure_binaries(
+    rust_toolchain: str,
+    zig_opt_mode: str,
+    zig_cpu: str,
+    parallel_builds: bool = False,
+    force_rebuild: bool = False,
+) -> None:
+    cargo_cmd = [
+        "cargo",
+        f"+{rust_toolchain}",
+        "build",
+        "--release",
+        "--manifest-path",
+        str(RUST_MANIFEST),
+    ]
     zig_cmd = [
         "zig",
         "build-exe",
@@ -394,7 +624,30 @@ def ensure_binaries(rust_toolchain: str, zig_opt_mode: str, zig_cpu: str) -> Non
     ]
     if zig_cpu != "baseline":
         zig_cmd.append("-mcpu=" + zig_cpu)
-    run(zig_cmd)
+    builds = [
+        ("rust", cargo_cmd, RUST_BIN, RUST_SOURCE_ROOT, ["rustc", f"+{rust_toolchain}", "--version"]),
+        ("zig", zig_cmd, ZIG_BIN, ZIG_SOURCE_ROOT, ["zig", "version"]),
+    ]
+
+    def build(spec: Tuple[str, List[str], Path, Path, List[str]]) -> None:
+        label, cmd, binary, source_root, toolchain_version_cmd = spec
+        build_if_stale(
+            label=label,
+            cmd=cmd,
+            binary=binary,
+            source_root=source_root,
+            toolchain_version_cmd=toolchain_version_cmd,
+            force_rebuild=force_rebuild,
+        )
+
+    if not parallel_builds:
+        for spec in builds:
+            build(spec)
+        return
+    # The two toolchains share no build state, so wall time drops to the slower
+    # build. `map` re-raises the first failing build's RuntimeError.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(pool.map(build, builds))
 
 
 def runtime_cmd(runtime: str) -> List[str]:
@@ -405,19 +658,22 @@ def runtime_cmd(runtime: str) -> List[str]:
     raise ValueError(f"unknown runtime {runtime}")
 
 
-def benchmark_runtime(
+def runtime_plan(
     *,
     runtime: str,
     workload: Dict[str, Any],
-    warmups: int,
-    repeats: int,
+    cpus: Optional[str] = None,
     zig_blake2_backend: str,
     zig_bench_proof_codec: str,
     merkle_workers: Optional[int],
     merkle_pool_reuse: bool,
     merkle_pool_reuse_workloads: Set[str],
+    fast_proof_metrics: bool = False,
 ) -> Dict[str, Any]:
     prefix = runtime_cmd(runtime)
+    if cpus is not None:
+        # Absolute taskset path keeps run_timed on the posix_spawn fast path.
+        prefix = [str(shutil.which("taskset")), "-c", cpus] + prefix
     artifact_path = ARTIFACT_DIR / f"{runtime}_{workload['name']}.json"
     stage_profile_path = (
         ARTIFACT_DIR / f"{runtime}_{workload['name']}_stage_profile.json"
@@ -466,30 +722,92 @@ def benchmark_runtime(
     )
     verify_cmd = prefix + ["--mode", "verify", "--artifact", str(artifact_path)] + backend_args
 
+    return {
+        "runtime": runtime,
+        "name": f"{runtime}_{workload['name']}",
+        "artifact_path": artifact_path,
+        "stage_profile_path": stage_profile_path,
+        "env": runtime_env,
+        "generate_cmd": generate_cmd,
+        "verify_cmd": verify_cmd,
+        "fast_proof_metrics": fast_proof_metrics,
+    }
+
+
+def runtime_result(
+    plan: Dict[str, Any],
+    prove_stats: Dict[str, Any],
+    verify_stats: Dict[str, Any],
+    metrics: Dict[str, Any],
+) -> Dict[str, Any]:
+    return {
+        "runtime": plan["runtime"],
+        "artifact": str(plan["artifact_path"].relative_to(ROOT)),
+        "prove": prove_stats,
+        "verify": verify_stats,
+        "proof_metrics": metrics,
+    }
+
+
+def benchmark_runtime(*, warmups: int, repeats: int, **plan_kwargs: Any) -> Dict[str, Any]:
+    plan = runtime_plan(**plan_kwargs)
     prove_stats = summarize_samples(
-        f"{runtime}_{workload['name']}_prove",
-        generate_cmd,
+        f"{plan['name']}_prove",
+        plan["generate_cmd"],
         warmups,
         repeats,
-        runtime_env,
-        stage_profile_path=stage_profile_path,
+        plan["env"],
+        stage_profile_path=plan["stage_profile_path"],
     )
-    metrics = proof_metrics(artifact_path)
+    metrics = proof_metrics(plan["artifact_path"], fast=plan["fast_proof_metrics"])
     verify_stats = summarize_samples(
-        f"{runtime}_{workload['name']}_verify",
-        verify_cmd,
+        f"{plan['name']}_verify",
+        plan["verify_cmd"],
         warmups,
         repeats,
-        runtime_env,
+        plan["env"],
     )
+    return runtime_result(plan, prove_stats, verify_stats, metrics)
 
-    return {
-        "runtime": runtime,
-        "artifact": str(artifact_path.relative_to(ROOT)),
-        "prove": prove_stats,
-        "verify": verify_stats,
-        "proof_metrics": metrics,
-    }
+
+def benchmark_runtimes_interleaved(
+    plans: List[Dict[str, Any]],
+    warmups: int,
+    repeats: int,
+    rng: random.Random,
+) -> List[Dict[str, Any]]:
+    # Prove samples of all runtimes are interleaved, then verify samples: every
+    # verify needs the artifact its runtime's prove phase left behind.
+    prove_stats = run_matrix(
+        [
+            {
+                "name": f"{plan['name']}_prove",
+                "cmd": plan["generate_cmd"],
+                "env": plan["env"],
+                "stage_profile_path": plan["stage_profile_path"],
+            }
+            for plan in plans
+        ],
+        warmups,
+        repeats,
+        rng,
+    )
+    metrics = [proof_metrics(plan["artifact_path"], fast=plan["fast_proof_metrics"]) for plan in plans]
+    verify_stats = run_matrix(
+        [
+            {
+                "name": f"{plan['name']}_verify",
+                "cmd": plan["verify_cmd"],
+                "env": plan["env"],
+                "stage_profile_path": None,
+            }
+            for plan in plans
+        ],
+        warmups,
+        repeats,
+        rng,
+    )
+    return [runtime_result(*parts) for parts in zip(plans, prove_stats, verify_stats, metrics)]
 
 
 def ratio(numerator: float, denominator: float) -> float:
@@ -498,6 +816,13 @@ def ratio(numerator: float, denominator: float) -> float:
     return numerator / denominator
 
 
+SUMMARY_RATIO_KEYS = ("zig_over_rust_prove", "zig_over_rust_verify", "zig_over_rust_peak_rss_kb")
+
+
+def ratio_average(stats: Dict[str, Any]) -> float:
+    return round(stats["total"] / stats["count"], 6) if stats["count"] else 0.0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Comparable Rust-vs-Zig benchmark protocol")
     parser.add_argument("--warmups", type=int, default=1)
@@ -543,6 +868,32 @@ def main() -> int:
         default="",
         help="Comma-separated workload names where STWO_ZIG_MERKLE_POOL_REUSE=1 is enabled for Zig runs.",
     )
+    parser.add_argument(
+        "--parallel-builds",
+        action="store_true",
+        help="Build the Rust and Zig binaries concurrently (both compilers are multi-threaded).",
+    )
+    parser.add_argument(
+        "--parallel-workloads",
+        type=int,
+        default=1,
+        help="Benchmark up to N workloads concurrently, each pinned to its own CPU group when taskset is available.",
+    )
+    parser.add_argument(
+        "--force-rebuild",
+        action="store_true",
+        help="Rebuild the Rust and Zig binaries even when their build stamps are current.",
+    )
+    parser.add_argument(
+        "--interleave-samples",
+        action="store_true",
+        help="Shuffle Rust and Zig samples of each workload (fixed seed) instead of running them back to back.",
+    )
+    parser.add_argument(
+        "--fast-proof-metrics",
+        action="store_true",
+        help="Count proof arrays with a byte scan of the compact wire JSON (falls back to a full parse if the layout differs).",
+    )
     parser.add_argument(
         "--report-label",
         default="benchmark_smoke",
@@ -570,13 +921,21 @@ def main() -> int:
         help="Path for JSON report output",
     )
     args = parser.parse_args()
+    if args.parallel_workloads <= 0:
+        raise ValueError("--parallel-workloads must be positive")
     if args.merkle_workers is not None and args.merkle_workers <= 0:
         raise ValueError("--merkle-workers must be positive when provided")
     merkle_pool_reuse_workloads = parse_workload_set(args.merkle_pool_reuse_workloads)
 
     ARTIFACT_DIR.mkdir(parents=True, exist_ok=True)
 
-    ensure_binaries(args.rust_toolchain, args.zig_opt_mode, args.zig_cpu)
+    ensure_binaries(
+        args.rust_toolchain,
+        args.zig_opt_mode,
+        args.zig_cpu,
+        parallel_builds=args.parallel_builds,
+        force_rebuild=args.force_rebuild,
+    )
 
     workloads = list(BASE_WORKLOADS)
     if args.include_medium:
@@ -586,32 +945,53 @@ def main() -> int:
     if args.include_long:
         workloads.extend(LONG_WORKLOADS)
 
-    workloads_report: List[Dict[str, Any]] = []
-    failures: List[str] = []
-
-    for workload in workloads:
-        rust = benchmark_runtime(
-            runtime="rust",
-            workload=workload,
-            warmups=args.warmups,
-            repeats=args.repeats,
-            zig_blake2_backend=args.blake2_backend,
-            zig_bench_proof_codec=args.zig_bench_proof_codec,
-            merkle_workers=args.merkle_workers,
-            merkle_pool_reuse=args.merkle_pool_reuse,
-            merkle_pool_reuse_workloads=merkle_pool_reuse_workloads,
-        )
-        zig = benchmark_runtime(
-            runtime="zig",
-            workload=workload,
-            warmups=args.warmups,
-            repeats=args.repeats,
-            zig_blake2_backend=args.blake2_backend,
-            zig_bench_proof_codec=args.zig_bench_proof_codec,
-            merkle_workers=args.merkle_workers,
-            merkle_pool_reuse=args.merkle_pool_reuse,
-            merkle_pool_reuse_workloads=merkle_pool_reuse_workloads,
-        )
+    parallel_workloads = min(args.parallel_workloads, len(workloads))
+    # Each running workload borrows a CPU group and returns it when done, so
+    # concurrently benched binaries never share cores.
+    cpu_groups = split_cpu_groups(parallel_workloads)
+    free_cpu_groups: "queue.SimpleQueue[List[int]]" = queue.SimpleQueue()
+    for group in cpu_groups or ():
+        free_cpu_groups.put(group)
+
+    # Completed workloads are streamed to a sibling NDJSON file as they finish
+    # so a crash mid-matrix keeps every finished measurement. It is removed once
+    # the aggregate report has been written.
+    args.report_out.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = args.report_out.with_suffix(".ndjson")
+    partial_lock = threading.Lock()
+
+    def bench_workload(workload: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        cpu_group = free_cpu_groups.get() if cpu_groups else None
+        try:
+            result = measure_workload(workload, None if cpu_group is None else ",".join(map(str, cpu_group)))
+        finally:
+            if cpu_group is not None:
+                free_cpu_groups.put(cpu_group)
+        append_ndjson(partial, partial_lock, {"entry": result[0], "failures": result[1]})
+        return result
+
+    def measure_workload(workload: Dict[str, Any], cpus: Optional[str]) -> Tuple[Dict[str, Any], List[str]]:
+        plan_kwargs: Dict[str, Any] = {
+            "workload": workload,
+            "cpus": cpus,
+            "zig_blake2_backend": args.blake2_backend,
+            "zig_bench_proof_codec": args.zig_bench_proof_codec,
+            "merkle_workers": args.merkle_workers,
+            "merkle_pool_reuse": args.merkle_pool_reuse,
+            "merkle_pool_reuse_workloads": merkle_pool_reuse_workloads,
+            "fast_proof_metrics": args.fast_proof_metrics,
+        }
+        if args.interleave_samples:
+            # Seeded per workload, so the shuffled order is reproducible.
+            rust, zig = benchmark_runtimes_interleaved(
+                [runtime_plan(runtime=runtime, **plan_kwargs) for runtime in ("rust", "zig")],
+                args.warmups,
+                args.repeats,
+                random.Random(canonical_hash(workload)),
+            )
+        else:
+            rust = benchmark_runtime(runtime="rust", warmups=args.warmups, repeats=args.repeats, **plan_kwargs)
+            zig = benchmark_runtime(runtime="zig", warmups=args.warmups, repeats=args.repeats, **plan_kwargs)
 
         prove_ratio = ratio(zig["prove"]["avg_seconds"], rust["prove"]["avg_seconds"])
         verify_ratio = ratio(zig["verify"]["avg_seconds"], rust["verify"]["avg_seconds"])
@@ -620,6 +1000,7 @@ def main() -> int:
             float(rust["proof_metrics"]["proof_wire_bytes"]),
         )
 
+        failures: List[str] = []
         if prove_ratio > args.max_zig_over_rust:
             failures.append(
                 f"{workload['name']} prove ratio {prove_ratio:.6f} exceeds {args.max_zig_over_rust:.2f}"
@@ -655,24 +1036,45 @@ def main() -> int:
         if verify_rss_ratio is not None:
             ratios_payload["zig_over_rust_verify_peak_rss_kb"] = round(verify_rss_ratio, 6)
 
-        workloads_report.append(
-            {
-                "name": workload["name"],
-                "example": workload["example"],
-                "params": workload["args"],
-                "rust": rust,
-                "zig": zig,
-                "ratios": ratios_payload,
-            }
-        )
-
-    prove_ratios = [w["ratios"]["zig_over_rust_prove"] for w in workloads_report]
-    verify_ratios = [w["ratios"]["zig_over_rust_verify"] for w in workloads_report]
-    prove_rss_ratios = [
-        w["ratios"]["zig_over_rust_peak_rss_kb"]
-        for w in workloads_report
-        if "zig_over_rust_peak_rss_kb" in w["ratios"]
-    ]
+        entry = {
+            "name": workload["name"],
+            "example": workload["example"],
+            "params": workload["args"],
+            "rust": rust,
+            "zig": zig,
+            "ratios": ratios_payload,
+        }
+        return entry, failures
+
+    with partial_path.open("w", encoding="utf-8") as partial:
+        try:
+            # Workloads share no artifacts, so they can run side by side. `map`
+            # yields in workload order, keeping report and failure order
+            # deterministic.
+            if parallel_workloads > 1:
+                with ThreadPoolExecutor(max_workers=parallel_workloads) as pool:
+                    workload_results = list(pool.map(bench_workload, workloads))
+            else:
+                workload_results = [bench_workload(workload) for workload in workloads]
+        except BaseException:
+            print(f"warning: benchmark aborted; completed workloads kept in {partial_path}", file=sys.stderr)
+            raise
+
+    # Summary ratios are accumulated while collecting entries, in workload
+    # order, instead of re-walking the report afterwards.
+    workloads_report: List[Dict[str, Any]] = []
+    failures: List[str] = []
+    ratio_stats = {key: {"max": 0.0, "total": 0.0, "count": 0} for key in SUMMARY_RATIO_KEYS}
+    for entry, workload_failures in workload_results:
+        workloads_report.append(entry)
+        failures.extend(workload_failures)
+        for key, stats in ratio_stats.items():
+            value = entry["ratios"].get(key)
+            if value is None:
+                continue
+            stats["max"] = value if not stats["count"] else max(stats["max"], value)
+            stats["total"] += value
+            stats["count"] += 1
     status = "ok" if not failures else "failed"
 
     workload_tier = "base_only"
@@ -694,7 +1096,7 @@ def main() -> int:
         "rust_toolchain": args.rust_toolchain,
         "include_medium": args.include_medium,
         "workload_tier": workload_tier,
-        "collector": "time -l" if TIME_BIN.exists() else "wall-clock-only",
+        "collector": "wait4",
         "zig_opt_mode": args.zig_opt_mode,
         "zig_cpu": args.zig_cpu,
         "blake2_backend": args.blake2_backend,
@@ -711,6 +1113,11 @@ def main() -> int:
         settings["include_large"] = True
     if args.include_long:
         settings["include_long"] = True
+    if args.interleave_samples:
+        settings["interleave_samples"] = True
+    if parallel_workloads > 1:
+        settings["parallel_workloads"] = parallel_workloads
+        settings["cpu_groups"] = cpu_groups
     thresholds = {
         "max_zig_over_rust_ratio": args.max_zig_over_rust,
         "conformance_reference": "CONFORMANCE.md Section 9.2",
@@ -741,18 +1148,12 @@ def main() -> int:
         "settings": settings,
         "summary": {
             "workloads": len(workloads_report),
-            "max_zig_over_rust_prove": max(prove_ratios) if prove_ratios else 0.0,
-            "max_zig_over_rust_verify": max(verify_ratios) if verify_ratios else 0.0,
-            "avg_zig_over_rust_prove": round(sum(prove_ratios) / len(prove_ratios), 6)
-            if prove_ratios
-            else 0.0,
-            "avg_zig_over_rust_verify": round(sum(verify_ratios) / len(verify_ratios), 6)
-            if verify_ratios
-            else 0.0,
-            "max_zig_over_rust_peak_rss_kb": max(prove_rss_ratios) if prove_rss_ratios else 0.0,
-            "avg_zig_over_rust_peak_rss_kb": round(sum(prove_rss_ratios) / len(prove_rss_ratios), 6)
-            if prove_rss_ratios
-            else 0.0,
+            "max_zig_over_rust_prove": ratio_stats["zig_over_rust_prove"]["max"],
+            "max_zig_over_rust_verify": ratio_stats["zig_over_rust_verify"]["max"],
+            "avg_zig_over_rust_prove": ratio_average(ratio_stats["zig_over_rust_prove"]),
+            "avg_zig_over_rust_verify": ratio_average(ratio_stats["zig_over_rust_verify"]),
+            "max_zig_over_rust_peak_rss_kb": ratio_stats["zig_over_rust_peak_rss_kb"]["max"],
+            "avg_zig_over_rust_peak_rss_kb": ratio_average(ratio_stats["zig_over_rust_peak_rss_kb"]),
             "failure_count": len(failures),
         },
         "workloads": workloads_report,
@@ -760,12 +1161,12 @@ def main() -> int:
     }
 
     out = args.report_out
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    write_json_report(out, report)
+    partial_path.unlink()
 
     latest = out.parent / "latest_benchmark_smoke_report.json"
     if latest != out:
-        shutil.copyfile(out, latest)
+        publish_latest(out, latest)
 
     return 0 if status == "ok" else 1
 
@@ -3,18 +3,17 @@
 
 from __future__ import annotations
 
-import json
 import re
 import sys
 from pathlib import Path
 
+from parity_ledger import parse_api_parity_json, parse_upstream_commit
+
 
 ROOT = Path(__file__).resolve().parent.parent
-API_PARITY_PATH = ROOT / "API_PARITY.md"
-UPSTREAM_PATH = ROOT / "UPSTREAM.md"
 
-API_PARITY_JSON_START = "<!-- API_PARITY_JSON_START -->"
-API_PARITY_JSON_END = "<!-- API_PARITY_JSON_END -->"
+# `[^\S\n]` is whitespace other than newline, so a match never spans lines.
+EXPORT_RE = re.compile(r"^pub[^\S\n]+(const|fn)[^\S\n]+([A-Za-z0-9_]+)", re.MULTILINE)
 
 EXPORT_FILES: dict[str, str] = {
     "src/stwo.zig": "stwo",
@@ -43,43 +42,18 @@ EXPORT_FILES: dict[str, str] = {
 }
 
 
-def parse_upstream_commit() -> str:
-    text = UPSTREAM_PATH.read_text(encoding="utf-8")
-    match = re.search(r"Pinned commit:\s*`([0-9a-f]{40})`", text)
-    if not match:
-        raise RuntimeError("failed to parse pinned commit from UPSTREAM.md")
-    return match.group(1)
-
-
 def parse_exports() -> dict[str, dict[str, str]]:
-    pat = re.compile(r"^pub\s+(const|fn)\s+([A-Za-z0-9_]+)")
     out: dict[str, dict[str, str]] = {}
     for rel_path, prefix in EXPORT_FILES.items():
         path = ROOT / rel_path
         text = path.read_text(encoding="utf-8")
-        for line in text.splitlines():
-            match = pat.match(line)
-            if not match:
-                continue
+        for match in EXPORT_RE.finditer(text):
             kind, name = match.group(1), match.group(2)
             symbol = f"{prefix}.{name}"
             out[symbol] = {"kind": kind, "source": rel_path}
     return out
 
 
-def parse_api_parity_json() -> dict:
-    text = API_PARITY_PATH.read_text(encoding="utf-8")
-    start = text.find(API_PARITY_JSON_START)
-    end = text.find(API_PARITY_JSON_END)
-    if start < 0 or end < 0 or end <= start:
-        raise RuntimeError("failed to locate API parity JSON markers in API_PARITY.md")
-    snippet = text[start + len(API_PARITY_JSON_START) : end]
-    match = re.search(r"```json\s*(\{.*\})\s*```", snippet, re.DOTALL)
-    if not match:
-        raise RuntimeError("failed to locate JSON code block between parity markers")
-    return json.loads(match.group(1))
-
-
 def validate() -> int:
     upstream_commit = parse_upstream_commit()
     expected_exports = parse_exports()
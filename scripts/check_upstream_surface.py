@@ -4,20 +4,34 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import http.client
 import json
-import re
+import os
 import sys
-import urllib.error
-import urllib.request
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from parity_ledger import parse_api_parity_json, parse_upstream_commit
+
 
 ROOT = Path(__file__).resolve().parent.parent
-API_PARITY_PATH = ROOT / "API_PARITY.md"
-UPSTREAM_PATH = ROOT / "UPSTREAM.md"
 
-API_PARITY_JSON_START = "<!-- API_PARITY_JSON_START -->"
-API_PARITY_JSON_END = "<!-- API_PARITY_JSON_END -->"
+# Existence of a path at a pinned commit never changes, so confirmed paths are
+# remembered per commit and skipped on later runs. Misses are always re-probed.
+CACHE_PATH = ROOT / "vectors" / ".upstream_surface_cache.json"
+
+UPSTREAM_HOST = "raw.githubusercontent.com"
+UPSTREAM_TIMEOUT_SECONDS = 20
+UPSTREAM_WORKERS = 16
+UPSTREAM_CONNECTIONS = threading.local()
+
+# With a token, existence is resolved through GitHub GraphQL: one aliased
+# `object(expression: "<commit>:<path>")` field per path, up to 100 per query.
+GRAPHQL_HOST = "api.github.com"
+GRAPHQL_BATCH_SIZE = 100
 
 REQUIRED_CRATE_ROOTS = {
     "crates/stwo/src/lib.rs",
@@ -29,46 +43,105 @@ REQUIRED_CRATE_ROOTS = {
 }
 
 
-def parse_upstream_commit() -> str:
-    text = UPSTREAM_PATH.read_text(encoding="utf-8")
-    match = re.search(r"Pinned commit:\s*`([0-9a-f]{40})`", text)
-    if not match:
-        raise RuntimeError("failed to parse pinned commit from UPSTREAM.md")
-    return match.group(1)
+def upstream_connection(reset: bool = False) -> http.client.HTTPSConnection:
+    # One keep-alive connection per worker thread, so the TLS handshake is paid
+    # once per worker rather than once per path.
+    conn = getattr(UPSTREAM_CONNECTIONS, "conn", None)
+    if conn is not None and reset:
+        conn.close()
+        conn = None
+    if conn is None:
+        conn = http.client.HTTPSConnection(UPSTREAM_HOST, timeout=UPSTREAM_TIMEOUT_SECONDS)
+        UPSTREAM_CONNECTIONS.conn = conn
+    return conn
 
 
-def parse_api_parity_json() -> dict:
-    text = API_PARITY_PATH.read_text(encoding="utf-8")
-    start = text.find(API_PARITY_JSON_START)
-    end = text.find(API_PARITY_JSON_END)
-    if start < 0 or end < 0 or end <= start:
-        raise RuntimeError("failed to locate API parity JSON markers in API_PARITY.md")
-    snippet = text[start + len(API_PARITY_JSON_START) : end]
-    match = re.search(r"```json\s*(\{.*\})\s*```", snippet, re.DOTALL)
-    if not match:
-        raise RuntimeError("failed to locate JSON code block between parity markers")
-    return json.loads(match.group(1))
+def send_request(conn: http.client.HTTPSConnection, method: str, url_path: str) -> int:
+    conn.request(method, url_path)
+    response = conn.getresponse()
+    # Drain the body so the connection can carry the next request.
+    response.read()
+    return response.status
+
+
+def request_status(method: str, url_path: str) -> int:
+    # A pooled connection may have been closed by the server between requests;
+    # retry once on a fresh connection before reporting the error.
+    try:
+        return send_request(upstream_connection(), method, url_path)
+    except (http.client.HTTPException, OSError):
+        return send_request(upstream_connection(reset=True), method, url_path)
 
 
 def exists_in_upstream(repo: str, commit: str, path: str) -> tuple[bool, str]:
-    url = f"https://raw.githubusercontent.com/{repo}/{commit}/{path}"
-    req = urllib.request.Request(url=url, method="HEAD")
+    url_path = f"/{repo}/{commit}/{path}"
+    url = f"https://{UPSTREAM_HOST}{url_path}"
     try:
-        with urllib.request.urlopen(req, timeout=20):
-            return True, url
-    except urllib.error.HTTPError as e:
-        if e.code == 405:
+        status = request_status("HEAD", url_path)
+        if status == 405:
             # Some paths may not support HEAD in intermediate proxies; retry GET.
-            try:
-                with urllib.request.urlopen(url, timeout=20):
-                    return True, url
-            except urllib.error.HTTPError as inner:
-                return False, f"{url} (HTTP {inner.code})"
-            except urllib.error.URLError as inner:
-                return False, f"{url} ({inner})"
-        return False, f"{url} (HTTP {e.code})"
-    except urllib.error.URLError as e:
+            status = request_status("GET", url_path)
+    except (http.client.HTTPException, OSError) as e:
         return False, f"{url} ({e})"
+    # http.client does not follow redirects, so a 3xx is not proof the path
+    # exists at the pinned commit; only a 2xx confirms it.
+    if not 200 <= status < 300:
+        return False, f"{url} (HTTP {status})"
+    return True, url
+
+
+def graphql_exists_in_upstream(repo: str, commit: str, paths: list[str], token: str) -> list[tuple[bool, str]]:
+    owner, name = repo.split("/", 1)
+    results: list[tuple[bool, str]] = []
+    conn = http.client.HTTPSConnection(GRAPHQL_HOST, timeout=UPSTREAM_TIMEOUT_SECONDS)
+    try:
+        for start in range(0, len(paths), GRAPHQL_BATCH_SIZE):
+            batch = paths[start : start + GRAPHQL_BATCH_SIZE]
+            fields = " ".join(
+                f"p{i}: object(expression: {json.dumps(f'{commit}:{path}')}) {{ __typename }}"
+                for i, path in enumerate(batch)
+            )
+            query = f"query {{ repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ {fields} }} }}"
+            conn.request(
+                "POST",
+                "/graphql",
+                body=json.dumps({"query": query}),
+                headers={
+                    "Authorization": f"bearer {token}",
+                    "Content-Type": "application/json",
+                    "User-Agent": "stwo-zig-check-upstream-surface",
+                },
+            )
+            response = conn.getresponse()
+            body = response.read()
+            if response.status != 200:
+                raise RuntimeError(f"GitHub GraphQL returned HTTP {response.status}")
+            payload = json.loads(body)
+            repository = (payload.get("data") or {}).get("repository")
+            if payload.get("errors") or not isinstance(repository, dict):
+                raise RuntimeError(f"GitHub GraphQL query failed: {payload.get('errors')}")
+            for i, path in enumerate(batch):
+                detail = f"github graphql {repo} {commit}:{path}"
+                results.append((repository.get(f"p{i}") is not None, detail))
+    finally:
+        conn.close()
+    return results
+
+
+def load_cache(path: Path) -> dict[str, dict[str, bool]]:
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def write_cache(path: Path, cache: dict[str, dict[str, bool]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, delete=False) as fp:
+        json.dump(cache, fp, indent=2, sort_keys=True)
+        fp.write("\n")
+    os.replace(fp.name, path)
 
 
 def main() -> int:
@@ -78,6 +151,11 @@ def main() -> int:
         default="starkware-libs/stwo",
         help="GitHub repo path used for rust_path verification",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-probe every rust_path instead of trusting paths already confirmed for the pinned commit",
+    )
     args = parser.parse_args()
 
     commit = parse_upstream_commit()
@@ -99,10 +177,31 @@ def main() -> int:
     if missing_roots:
         failures.append("missing required crate root mappings: " + ", ".join(missing_roots))
 
-    for path in sorted(rust_paths):
-        ok, detail = exists_in_upstream(args.repo, commit, path)
-        if not ok:
+    cache = {} if args.no_cache else load_cache(CACHE_PATH)
+    confirmed = cache.get(commit)
+    if not isinstance(confirmed, dict):
+        confirmed = {}
+    paths = sorted(path for path in rust_paths if not confirmed.get(path))
+
+    results: list[tuple[bool, str]] | None = None
+    token = os.environ.get("GITHUB_TOKEN")
+    if token and paths:
+        try:
+            results = graphql_exists_in_upstream(args.repo, commit, paths, token)
+        except (RuntimeError, ValueError, http.client.HTTPException, OSError) as e:
+            print(f"warning: GraphQL lookup failed, probing paths individually: {e}", file=sys.stderr)
+    if results is None:
+        # Lookups are independent round trips; `map` keeps failures in path order.
+        with ThreadPoolExecutor(max_workers=UPSTREAM_WORKERS) as pool:
+            results = list(pool.map(functools.partial(exists_in_upstream, args.repo, commit), paths))
+    for path, (ok, detail) in zip(paths, results):
+        if ok:
+            confirmed[path] = True
+        else:
             failures.append(f"rust_path not found upstream: {path} ({detail})")
+    if any(ok for ok, _ in results):
+        cache[commit] = confirmed
+        write_cache(CACHE_PATH, cache)
 
     if failures:
         sys.stderr.write("upstream surface check failed:\n")
@@ -4,15 +4,21 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
+import functools
 import hashlib
 import json
+import os
 import statistics
-import shutil
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
+from bench_io import loads_json, publish_latest, write_json_report
+
 
 ROOT = Path(__file__).resolve().parent.parent
 REPORTS_DIR = ROOT / "vectors" / "reports"
@@ -26,12 +32,46 @@ PROFILE_REPORT_DEFAULT = REPORTS_DIR / "profile_smoke_report.json"
 KERNEL_REPORT_DEFAULT = REPORTS_DIR / "benchmark_kernels_report.json"
 BENCHMARK_FULL_REPORT_DEFAULT = REPORTS_DIR / "benchmark_full_report.json"
 TARGET_FAMILY_DEFAULTS = "eval_at_point,eval_at_point_by_folding,fft"
+# One worker per report a single invocation may read.
+REPORT_LOAD_WORKERS = 5
+
+
+# Per-workload delta fields and the ratio each one compares.
+WORKLOAD_DELTA_KEYS = (
+    ("prove_delta_pct", "zig_over_rust_prove"),
+    ("verify_delta_pct", "zig_over_rust_verify"),
+    ("rss_delta_pct", "zig_over_rust_peak_rss_kb"),
+)
+
+
+# Parsed JSON keyed by file identity: a report reached through two names (the
+# latest_* files are hard links) or loaded by several paths is parsed once.
+PARSED_JSON: Dict[Tuple[int, int, int, int], Any] = {}
 
 
 class CompareError(RuntimeError):
     pass
 
 
+# Current-run ratios for one benchmark workload. Field names match the
+# baseline's `workload_ratios` JSON keys; dataclasses.asdict restores that shape.
+@dataclass(frozen=True, slots=True)
+class WorkloadRatios:
+    zig_over_rust_prove: float
+    zig_over_rust_verify: float
+    zig_over_rust_proof_wire_bytes: float
+    zig_over_rust_peak_rss_kb: float
+
+
+# Current-run ratios for one full-benchmark family, shaped like the baseline's
+# `target_families.ratios` entries.
+@dataclass(frozen=True, slots=True)
+class FamilyRatios:
+    zig_over_rust_prove: float
+    zig_over_rust_verify: float
+    zig_over_rust_peak_rss_kb: float
+
+
 def rel(path: Path) -> str:
     try:
         return str(path.relative_to(ROOT))
@@ -40,63 +80,123 @@ def rel(path: Path) -> str:
 
 
 def run_capture(cmd: list[str]) -> str:
-    proc = subprocess.run(cmd, cwd=ROOT, text=True, capture_output=True, check=False)
+    proc = subprocess.run(
+        cmd,
+        cwd=ROOT,
+        stdin=subprocess.DEVNULL,
+        text=True,
+        capture_output=True,
+        check=False,
+    )
     return proc.stdout.strip() if proc.returncode == 0 else ""
 
 
-def load_json(path: Path, *, name: str) -> Dict[str, Any]:
-    if not path.exists():
-        raise CompareError(f"missing required {name}: {rel(path)}")
-    payload = json.loads(path.read_text(encoding="utf-8"))
+def head_sha() -> str:
+    # CI runners already export the checked-out commit; only spawn git locally.
+    return (
+        os.environ.get("GITHUB_SHA")
+        or os.environ.get("CI_COMMIT_SHA")
+        or run_capture(["git", "rev-parse", "HEAD"])
+    )
+
+
+def read_json_file(path: Path) -> Any:
+    # One open per report: the identity comes from fstat on the open file, and
+    # a missing file surfaces as FileNotFoundError with no separate exists()
+    # probe. Reports are never mutated here, so one parsed object can be shared
+    # by every name that resolves to the same unchanged file.
+    with path.open("rb") as fp:
+        st = os.fstat(fp.fileno())
+        identity = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+        payload = PARSED_JSON.get(identity)
+        if payload is None:
+            payload = loads_json(fp.read())
+            PARSED_JSON[identity] = payload
+    return payload
+
+
+def checked_report(payload: Any, path: Path, name: str) -> Dict[str, Any]:
     if not isinstance(payload, dict):
         raise CompareError(f"invalid {name} payload at {rel(path)}")
     return payload
 
 
+def load_json(path: Path, *, name: str) -> Dict[str, Any]:
+    try:
+        payload = read_json_file(path)
+    except FileNotFoundError:
+        raise CompareError(f"missing required {name}: {rel(path)}") from None
+    return checked_report(payload, path, name)
+
+
 def maybe_load_json(path: Path, *, name: str) -> Dict[str, Any] | None:
-    if not path.exists():
+    try:
+        payload = read_json_file(path)
+    except FileNotFoundError:
         return None
-    return load_json(path, name=name)
+    return checked_report(payload, path, name)
+
+
+# Shared encoder: json.dumps builds a fresh JSONEncoder on every call that
+# passes non-default options.
+CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
 
 
 def canonical_hash(payload: Any) -> str:
-    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return hashlib.sha256(encoded).hexdigest()
+    # One update over the encoded buffer; OpenSSL picks SHA-NI/ARMv8 SHA
+    # instructions itself. The digest only fingerprints settings, so the FIPS
+    # gate is skipped.
+    hasher = hashlib.sha256(usedforsecurity=False)
+    hasher.update(CANONICAL_ENCODER.encode(payload).encode("utf-8"))
+    return hasher.hexdigest()
 
 
-def benchmark_workload_matrix_hash(report: Dict[str, Any]) -> str:
+def recorded_matrix_hash(report: Dict[str, Any]) -> str | None:
     existing = report.get("workload_matrix_hash")
     if isinstance(existing, str) and existing:
         return existing
+    return None
 
-    workloads = report.get("workloads", [])
-    matrix = [
-        {
-            "name": str(workload.get("name", "unknown")),
-            "example": str(workload.get("example", "unknown")),
-            "params": workload.get("params", []),
-        }
-        for workload in workloads
-    ]
-    return canonical_hash(matrix)
 
+def summarize_workloads(report: Dict[str, Any]) -> Tuple[str, Dict[str, WorkloadRatios]]:
+    # One walk over the workloads yields both the matrix hash (unless the report
+    # records one) and the per-workload ratios.
+    matrix_hash = recorded_matrix_hash(report)
+    matrix: list[Dict[str, Any]] = []
+    ratios_out: Dict[str, WorkloadRatios] = {}
+    for workload in report.get("workloads", []):
+        name = str(workload.get("name", "unknown"))
+        if matrix_hash is None:
+            matrix.append(
+                {
+                    "name": name,
+                    "example": str(workload.get("example", "unknown")),
+                    "params": workload.get("params", []),
+                }
+            )
+        ratios_out[name] = workload_ratio_entry(workload)
+    return matrix_hash or canonical_hash(matrix), ratios_out
 
-def profile_workload_matrix_hash(report: Dict[str, Any]) -> str:
-    existing = report.get("workload_matrix_hash")
-    if isinstance(existing, str) and existing:
-        return existing
 
-    profiles = report.get("profiles", [])
-    matrix = [
-        {
-            "runtime": str(profile.get("runtime", "unknown")),
-            "workload": str(profile.get("workload", "unknown")),
-            "example": str(profile.get("example", "unknown")),
-            "command": profile.get("command", []),
-        }
-        for profile in profiles
-    ]
-    return canonical_hash(matrix)
+def summarize_profiles(report: Dict[str, Any]) -> Tuple[str, Dict[str, float]]:
+    # Same single walk for profiles: matrix hash plus Zig avg seconds by workload.
+    matrix_hash = recorded_matrix_hash(report)
+    matrix: list[Dict[str, Any]] = []
+    zig_seconds: Dict[str, float] = {}
+    for profile in report.get("profiles", []):
+        workload = str(profile.get("workload", "unknown"))
+        if matrix_hash is None:
+            matrix.append(
+                {
+                    "runtime": str(profile.get("runtime", "unknown")),
+                    "workload": workload,
+                    "example": str(profile.get("example", "unknown")),
+                    "command": profile.get("command", []),
+                }
+            )
+        if profile.get("runtime") == "zig":
+            zig_seconds[workload] = float(profile.get("summary", {}).get("avg_seconds", 0.0))
+    return matrix_hash or canonical_hash(matrix), zig_seconds
 
 
 def kernel_workload_matrix_hash(report: Dict[str, Any]) -> str:
@@ -116,47 +216,32 @@ def kernel_workload_matrix_hash(report: Dict[str, Any]) -> str:
     return canonical_hash(matrix)
 
 
-def workload_ratios(report: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
-    out: Dict[str, Dict[str, float]] = {}
-    for workload in report.get("workloads", []):
-        name = str(workload.get("name", "unknown"))
-        ratios = workload.get("ratios", {})
-        prove_rss_ratio = ratios.get("zig_over_rust_peak_rss_kb")
-        if prove_rss_ratio is None:
-            rust_prove = (((workload.get("rust", {}) or {}).get("prove", {}) or {}).get("rss_peak_kb"))
-            zig_prove = (((workload.get("zig", {}) or {}).get("prove", {}) or {}).get("rss_peak_kb"))
-            if rust_prove not in (None, 0) and zig_prove is not None:
-                prove_rss_ratio = float(zig_prove) / float(rust_prove)
-        out[name] = {
-            "zig_over_rust_prove": float(ratios.get("zig_over_rust_prove", 0.0)),
-            "zig_over_rust_verify": float(ratios.get("zig_over_rust_verify", 0.0)),
-            "zig_over_rust_proof_wire_bytes": float(ratios.get("zig_over_rust_proof_wire_bytes", 0.0)),
-            "zig_over_rust_peak_rss_kb": float(prove_rss_ratio) if prove_rss_ratio is not None else 0.0,
-        }
-    return out
+def workload_ratio_entry(workload: Dict[str, Any]) -> WorkloadRatios:
+    ratios = workload.get("ratios", {})
+    prove_rss_ratio = ratios.get("zig_over_rust_peak_rss_kb")
+    if prove_rss_ratio is None:
+        rust_prove = (((workload.get("rust", {}) or {}).get("prove", {}) or {}).get("rss_peak_kb"))
+        zig_prove = (((workload.get("zig", {}) or {}).get("prove", {}) or {}).get("rss_peak_kb"))
+        if rust_prove not in (None, 0) and zig_prove is not None:
+            prove_rss_ratio = float(zig_prove) / float(rust_prove)
+    return WorkloadRatios(
+        zig_over_rust_prove=float(ratios.get("zig_over_rust_prove", 0.0)),
+        zig_over_rust_verify=float(ratios.get("zig_over_rust_verify", 0.0)),
+        zig_over_rust_proof_wire_bytes=float(ratios.get("zig_over_rust_proof_wire_bytes", 0.0)),
+        zig_over_rust_peak_rss_kb=float(prove_rss_ratio) if prove_rss_ratio is not None else 0.0,
+    )
 
 
-def benchmark_family_ratios(report: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
-    out: Dict[str, Dict[str, float]] = {}
+def benchmark_family_ratios(report: Dict[str, Any]) -> Dict[str, FamilyRatios]:
+    out: Dict[str, FamilyRatios] = {}
     for family in report.get("families", []):
         family_name = str(family.get("family", "unknown"))
         ratios = family.get("ratios", {})
-        out[family_name] = {
-            "zig_over_rust_prove": float(ratios.get("zig_over_rust_prove", 0.0)),
-            "zig_over_rust_verify": float(ratios.get("zig_over_rust_verify", 0.0)),
-            "zig_over_rust_peak_rss_kb": float(ratios.get("zig_over_rust_peak_rss_kb", 0.0)),
-        }
-    return out
-
-
-def zig_profile_seconds(report: Dict[str, Any]) -> Dict[str, float]:
-    out: Dict[str, float] = {}
-    for profile in report.get("profiles", []):
-        if profile.get("runtime") != "zig":
-            continue
-        workload = str(profile.get("workload", "unknown"))
-        summary = profile.get("summary", {})
-        out[workload] = float(summary.get("avg_seconds", 0.0))
+        out[family_name] = FamilyRatios(
+            zig_over_rust_prove=float(ratios.get("zig_over_rust_prove", 0.0)),
+            zig_over_rust_verify=float(ratios.get("zig_over_rust_verify", 0.0)),
+            zig_over_rust_peak_rss_kb=float(ratios.get("zig_over_rust_peak_rss_kb", 0.0)),
+        )
     return out
 
 
@@ -201,18 +286,25 @@ def capture_baseline(
     benchmark_full_report_path: Path | None,
     target_families: list[str],
 ) -> Dict[str, Any]:
-    benchmark_report = load_json(benchmark_report_path, name="benchmark report")
-    profile_report = load_json(profile_report_path, name="profile report")
-    kernel_report = (
-        maybe_load_json(kernel_report_path, name="kernel benchmark report")
-        if kernel_report_path is not None
-        else None
-    )
-    benchmark_full_report = (
-        maybe_load_json(benchmark_full_report_path, name="full benchmark report")
-        if benchmark_full_report_path is not None
-        else None
-    )
+    # Independent reads: load them side by side, then collect results in the
+    # original order so the first missing report is still the one reported.
+    with ThreadPoolExecutor(max_workers=REPORT_LOAD_WORKERS) as pool:
+        benchmark_job = pool.submit(load_json, benchmark_report_path, name="benchmark report")
+        profile_job = pool.submit(load_json, profile_report_path, name="profile report")
+        kernel_job = (
+            pool.submit(maybe_load_json, kernel_report_path, name="kernel benchmark report")
+            if kernel_report_path is not None
+            else None
+        )
+        benchmark_full_job = (
+            pool.submit(maybe_load_json, benchmark_full_report_path, name="full benchmark report")
+            if benchmark_full_report_path is not None
+            else None
+        )
+    benchmark_report = benchmark_job.result()
+    profile_report = profile_job.result()
+    kernel_report = kernel_job.result() if kernel_job is not None else None
+    benchmark_full_report = benchmark_full_job.result() if benchmark_full_job is not None else None
 
     benchmark_settings_hash = benchmark_report.get("settings_hash")
     profile_settings_hash = profile_report.get("settings_hash")
@@ -221,24 +313,28 @@ def capture_baseline(
     if not profile_settings_hash:
         raise CompareError("profile report missing settings_hash")
 
+    bench_matrix_hash, bench_workload_ratios = summarize_workloads(benchmark_report)
+    profile_matrix_hash, zig_seconds_by_workload = summarize_profiles(profile_report)
     baseline = {
         "schema_version": 5,
         "created_at_unix": int(time.time()),
-        "git_head_sha": run_capture(["git", "rev-parse", "HEAD"]),
+        "git_head_sha": head_sha(),
         "benchmark": {
             "settings_hash": benchmark_settings_hash,
-            "workload_matrix_hash": benchmark_workload_matrix_hash(benchmark_report),
+            "workload_matrix_hash": bench_matrix_hash,
             "report_path": rel(benchmark_report_path),
             "summary": benchmark_report.get("summary", {}),
             "thresholds": benchmark_report.get("thresholds", {}),
-            "workload_ratios": workload_ratios(benchmark_report),
+            "workload_ratios": {
+                name: dataclasses.asdict(ratios) for name, ratios in bench_workload_ratios.items()
+            },
         },
         "profile": {
             "settings_hash": profile_settings_hash,
-            "workload_matrix_hash": profile_workload_matrix_hash(profile_report),
+            "workload_matrix_hash": profile_matrix_hash,
             "report_path": rel(profile_report_path),
             "summary": profile_report.get("summary", {}),
-            "zig_avg_seconds_by_workload": zig_profile_seconds(profile_report),
+            "zig_avg_seconds_by_workload": zig_seconds_by_workload,
         },
     }
     if kernel_report is not None:
@@ -259,14 +355,13 @@ def capture_baseline(
         for family in target_families:
             if family not in full_family_ratios:
                 raise CompareError(f"missing target family in full benchmark report: {family}")
-            selected_family_ratios[family] = full_family_ratios[family]
+            selected_family_ratios[family] = dataclasses.asdict(full_family_ratios[family])
         baseline["target_families"] = {
             "report_path": rel(benchmark_full_report_path),
             "ratios": selected_family_ratios,
         }
 
-    baseline_out.parent.mkdir(parents=True, exist_ok=True)
-    baseline_out.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    write_json_report(baseline_out, baseline)
     return baseline
 
 
@@ -299,15 +394,26 @@ def evaluate_comparison(
     baseline_profile_hash = baseline_profile.get("settings_hash")
     current_bench_hash = benchmark_report.get("settings_hash")
     current_profile_hash = profile_report.get("settings_hash")
-    baseline_bench_matrix_hash = baseline_bench.get("workload_matrix_hash")
-    baseline_profile_matrix_hash = baseline_profile.get("workload_matrix_hash")
-    current_bench_matrix_hash = benchmark_workload_matrix_hash(benchmark_report)
-    current_profile_matrix_hash = profile_workload_matrix_hash(profile_report)
 
     if baseline_bench_hash != current_bench_hash:
         failures.append("benchmark settings hash mismatch versus baseline")
     if baseline_profile_hash != current_profile_hash:
         failures.append("profile settings hash mismatch versus baseline")
+    if failures:
+        # Runs under different settings are not comparable; skip the matrix
+        # hashing and ratio walks entirely.
+        return "failed", failures, {
+            "baseline_benchmark_settings_hash": baseline_bench_hash,
+            "current_benchmark_settings_hash": current_bench_hash,
+            "baseline_profile_settings_hash": baseline_profile_hash,
+            "current_profile_settings_hash": current_profile_hash,
+        }
+
+    baseline_bench_matrix_hash = baseline_bench.get("workload_matrix_hash")
+    baseline_profile_matrix_hash = baseline_profile.get("workload_matrix_hash")
+    current_bench_matrix_hash, curr_workloads = summarize_workloads(benchmark_report)
+    current_profile_matrix_hash, _ = summarize_profiles(profile_report)
+
     if baseline_bench_matrix_hash and baseline_bench_matrix_hash != current_bench_matrix_hash:
         failures.append("benchmark workload matrix hash mismatch versus baseline")
     if baseline_profile_matrix_hash and baseline_profile_matrix_hash != current_profile_matrix_hash:
@@ -334,8 +440,8 @@ def evaluate_comparison(
     if curr_max_rss == 0.0:
         curr_max_rss = max(
             (
-                float((ratios or {}).get("zig_over_rust_peak_rss_kb", 0.0))
-                for ratios in workload_ratios(benchmark_report).values()
+                ratios.zig_over_rust_peak_rss_kb
+                for ratios in curr_workloads.values()
             ),
             default=0.0,
         )
@@ -372,34 +478,19 @@ def evaluate_comparison(
 
     per_workload_deltas: Dict[str, Dict[str, float]] = {}
     base_workloads = baseline_bench.get("workload_ratios", {})
-    curr_workloads = workload_ratios(benchmark_report)
     for name, base_ratios in base_workloads.items():
         if name not in curr_workloads:
             failures.append(f"missing workload in current benchmark report: {name}")
             continue
+        # Current ratios are WorkloadRatios fields; only the baseline, read back
+        # from JSON, needs defaults and coercion.
         current_ratios = curr_workloads[name]
         per_workload_deltas[name] = {
-            "prove_delta_pct": round(
-                pct_delta(
-                    float(base_ratios.get("zig_over_rust_prove", 0.0)),
-                    float(current_ratios.get("zig_over_rust_prove", 0.0)),
-                ),
-                6,
-            ),
-            "verify_delta_pct": round(
-                pct_delta(
-                    float(base_ratios.get("zig_over_rust_verify", 0.0)),
-                    float(current_ratios.get("zig_over_rust_verify", 0.0)),
-                ),
+            delta_key: round(
+                pct_delta(float(base_ratios.get(ratio_key, 0.0)), getattr(current_ratios, ratio_key)),
                 6,
-            ),
-            "rss_delta_pct": round(
-                pct_delta(
-                    float(base_ratios.get("zig_over_rust_peak_rss_kb", 0.0)),
-                    float(current_ratios.get("zig_over_rust_peak_rss_kb", 0.0)),
-                ),
-                6,
-            ),
+            )
+            for delta_key, ratio_key in WORKLOAD_DELTA_KEYS
         }
 
     baseline_kernel_settings_hash: str | None = None
@@ -483,15 +574,15 @@ def evaluate_comparison(
                 current_ratios = current_families[family_key]
                 prove_delta = pct_delta(
                     float(base_ratios.get("zig_over_rust_prove", 0.0)),
-                    float(current_ratios.get("zig_over_rust_prove", 0.0)),
+                    current_ratios.zig_over_rust_prove,
                 )
                 verify_delta = pct_delta(
                     float(base_ratios.get("zig_over_rust_verify", 0.0)),
-                    float(current_ratios.get("zig_over_rust_verify", 0.0)),
+                    current_ratios.zig_over_rust_verify,
                 )
                 rss_delta = pct_delta(
                     float(base_ratios.get("zig_over_rust_peak_rss_kb", 0.0)),
-                    float(current_ratios.get("zig_over_rust_peak_rss_kb", 0.0)),
+                    current_ratios.zig_over_rust_peak_rss_kb,
                 )
                 per_target_family_deltas[family_key] = {
                     "prove_delta_pct": round(prove_delta, 6),
@@ -676,6 +767,30 @@ def run_self_test() -> None:
     if status != "failed" or not failures:
         raise CompareError("self-test failed to detect regression")
 
+    mismatched_bench = dict(improved_bench)
+    mismatched_bench["settings_hash"] = "h1-changed"
+    status, failures, details = evaluate_comparison(
+        baseline=baseline,
+        benchmark_report=mismatched_bench,
+        profile_report=improved_profile,
+        kernel_report=None,
+        benchmark_full_report=None,
+        require_prove_improvement_pct=0.0,
+        max_prove_regression_pct=0.0,
+        max_verify_regression_pct=0.0,
+        max_rss_regression_pct=0.0,
+        max_zig_profile_regression_pct=0.0,
+        max_kernel_regression_pct=0.0,
+        kernel_min_baseline_seconds=0.0,
+        kernel_min_absolute_delta_seconds=0.0,
+        max_target_family_regression_pct=0.0,
+        max_target_family_rss_regression_pct=0.0,
+    )
+    if status != "failed" or failures != ["benchmark settings hash mismatch versus baseline"]:
+        raise CompareError("self-test failed to reject mismatched benchmark settings")
+    if details.get("current_benchmark_settings_hash") != "h1-changed":
+        raise CompareError("self-test missing settings hashes in mismatch details")
+
     baseline_with_kernels = dict(baseline)
     baseline_with_kernels["kernels"] = {
         "settings_hash": "hk",
@@ -754,7 +869,10 @@ def parse_target_families(raw: str) -> list[str]:
     return families
 
 
-def parse_args() -> argparse.Namespace:
+@functools.lru_cache(maxsize=None)
+def build_parser() -> argparse.ArgumentParser:
+    # Built once per process, so in-process callers of parse_args (e.g. a CI
+    # service running the gate per PR) do not re-register every action.
     parser = argparse.ArgumentParser(description="Compare optimization runs against baseline")
     parser.add_argument("--baseline", type=Path, default=BASELINE_DEFAULT)
     parser.add_argument("--benchmark-report", type=Path, default=BENCHMARK_REPORT_DEFAULT)
@@ -797,7 +915,11 @@ def parse_args() -> argparse.Namespace:
         default=TARGET_FAMILY_DEFAULTS,
         help="Comma-separated family names tracked for targeted regressions.",
     )
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    return build_parser().parse_args(argv)
 
 
 def main() -> int:
@@ -834,14 +956,23 @@ def main() -> int:
         )
         return 0
 
-    baseline = load_json(args.baseline, name="optimization baseline")
-    benchmark_report = load_json(args.benchmark_report, name="benchmark report")
-    profile_report = load_json(args.profile_report, name="profile report")
-    kernel_report = maybe_load_json(args.kernel_report, name="kernel benchmark report")
-    benchmark_full_report = maybe_load_json(
-        args.benchmark_full_report,
-        name="full benchmark report",
-    )
+    # Independent reads: load them side by side, then collect results in the
+    # original order so the first missing report is still the one reported.
+    with ThreadPoolExecutor(max_workers=REPORT_LOAD_WORKERS) as pool:
+        baseline_job = pool.submit(load_json, args.baseline, name="optimization baseline")
+        benchmark_job = pool.submit(load_json, args.benchmark_report, name="benchmark report")
+        profile_job = pool.submit(load_json, args.profile_report, name="profile report")
+        kernel_job = pool.submit(maybe_load_json, args.kernel_report, name="kernel benchmark report")
+        benchmark_full_job = pool.submit(
+            maybe_load_json,
+            args.benchmark_full_report,
+            name="full benchmark report",
+        )
+    baseline = baseline_job.result()
+    benchmark_report = benchmark_job.result()
+    profile_report = profile_job.result()
+    kernel_report = kernel_job.result()
+    benchmark_full_report = benchmark_full_job.result()
 
     status, failures, details = evaluate_comparison(
         baseline=baseline,
@@ -886,10 +1017,9 @@ def main() -> int:
         "failures": failures,
     }
 
-    args.compare_out.parent.mkdir(parents=True, exist_ok=True)
-    args.compare_out.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    write_json_report(args.compare_out, report)
     if args.compare_out != LATEST_COMPARE_REPORT:
-        shutil.copyfile(args.compare_out, LATEST_COMPARE_REPORT)
+        publish_latest(args.compare_out, LATEST_COMPARE_REPORT)
 
     print(json.dumps({"status": status, "failures": failures}, sort_keys=True))
     return 0 if status == "ok" else 1
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Parsers for the pinned upstream commit and the API parity ledger."""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+API_PARITY_PATH = ROOT / "API_PARITY.md"
+UPSTREAM_PATH = ROOT / "UPSTREAM.md"
+
+API_PARITY_JSON_START = "<!-- API_PARITY_JSON_START -->"
+API_PARITY_JSON_END = "<!-- API_PARITY_JSON_END -->"
+PINNED_COMMIT_RE = re.compile(r"Pinned commit:\s*`([0-9a-f]{40})`")
+API_PARITY_JSON_RE = re.compile(r"```json\s*(\{.*\})\s*```", re.DOTALL)
+
+
+def parse_upstream_commit() -> str:
+    text = UPSTREAM_PATH.read_text(encoding="utf-8")
+    match = PINNED_COMMIT_RE.search(text)
+    if not match:
+        raise RuntimeError("failed to parse pinned commit from UPSTREAM.md")
+    return match.group(1)
+
+
+def parse_api_parity_json() -> dict:
+    text = API_PARITY_PATH.read_text(encoding="utf-8")
+    start = text.find(API_PARITY_JSON_START)
+    end = text.find(API_PARITY_JSON_END)
+    if start < 0 or end < 0 or end <= start:
+        raise RuntimeError("failed to locate API parity JSON markers in API_PARITY.md")
+    snippet = text[start + len(API_PARITY_JSON_START) : end]
+    match = API_PARITY_JSON_RE.search(snippet)
+    if not match:
+        raise RuntimeError("failed to locate JSON code block between parity markers")
+    return json.loads(match.group(1))
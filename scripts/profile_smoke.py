@@ -26,8 +26,13 @@ SAMPLE_DIR = ROOT / "vectors" / ".profile_samples"
 
 RUST_TOOLCHAIN_DEFAULT = "nightly-2025-07-14"
 TIME_BIN = Path("/usr/bin/time")
+# Probed once: run_profiled_once sits on the per-sample path and the answer
+# cannot change during a run.
+HAS_TIME_BIN = TIME_BIN.exists()
 SAMPLE_BIN = Path("/usr/bin/sample")
 
+# `time -l` metric patterns are compiled once here and only ever used through
+# `.search`; keep per-sample parsing free of re.compile/re.search(str, ...) calls.
 RSS_RE = re.compile(r"^\s*(\d+)\s+maximum resident set size\s*$", re.MULTILINE)
 INSTR_RE = re.compile(r"^\s*(\d+)\s+instructions retired\s*$", re.MULTILINE)
 CYCLES_RE = re.compile(r"^\s*(\d+)\s+cycles elapsed\s*$", re.MULTILINE)
@@ -219,7 +224,7 @@ def parse_time_metrics(stderr: str) -> Dict[str, Any]:
 
 def run_profiled_once(cmd: List[str], env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     start = time.perf_counter()
-    if TIME_BIN.exists():
+    if HAS_TIME_BIN:
         proc = subprocess.run(
             [str(TIME_BIN), "-l", *cmd],
             cwd=ROOT,
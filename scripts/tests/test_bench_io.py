@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Unit tests for the shared benchmark report and build helpers."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS = ROOT / "scripts"
+MODULE_PATH = SCRIPTS / "bench_io.py"
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("bench_io", MODULE_PATH)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"failed to load module from {MODULE_PATH}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def python_cmd(source: str) -> list[str]:
+    return [sys.executable, "-c", source]
+
+
+class PublishLatestTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mod = load_module()
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.report = self.dir / "report_1.json"
+        self.latest = self.dir / "latest_report.json"
+        self.report.write_text('{"run": 1}\n', encoding="utf-8")
+
+    def test_latest_shares_report_inode(self) -> None:
+        self.mod.publish_latest(self.report, self.latest)
+        self.assertTrue(os.path.samefile(self.report, self.latest))
+        self.assertFalse(self.latest.with_name(self.latest.name + ".tmp").exists())
+
+    def test_republish_replaces_previous_latest(self) -> None:
+        self.mod.publish_latest(self.report, self.latest)
+        second = self.dir / "report_2.json"
+        second.write_text('{"run": 2}\n', encoding="utf-8")
+        self.mod.publish_latest(second, self.latest)
+        self.assertTrue(os.path.samefile(second, self.latest))
+        self.assertEqual(self.report.read_text(encoding="utf-8"), '{"run": 1}\n')
+
+    def test_copies_when_link_fails(self) -> None:
+        with mock.patch.object(self.mod.os, "link", side_effect=OSError("cross-device link")):
+            self.mod.publish_latest(self.report, self.latest)
+        self.assertFalse(os.path.samefile(self.report, self.latest))
+        self.assertEqual(self.latest.read_bytes(), self.report.read_bytes())
+        self.assertFalse(self.latest.with_name(self.latest.name + ".tmp").exists())
+
+
+class AppendNdjsonTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mod = load_module()
+
+    def test_concurrent_writers_produce_whole_lines(self) -> None:
+        writers, per_writer = 8, 50
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "records.ndjson"
+            lock = threading.Lock()
+            with path.open("w", encoding="utf-8") as fp:
+
+                def write_records(writer: int) -> None:
+                    for seq in range(per_writer):
+                        record = {"writer": writer, "seq": seq, "padding": "x" * 4096}
+                        self.mod.append_ndjson(fp, lock, record)
+
+                threads = [threading.Thread(target=write_records, args=(w,)) for w in range(writers)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+            lines = path.read_text(encoding="utf-8").splitlines()
+        records = [json.loads(line) for line in lines]
+        self.assertEqual(len(records), writers * per_writer)
+        for writer in range(writers):
+            seqs = [record["seq"] for record in records if record["writer"] == writer]
+            self.assertEqual(seqs, list(range(per_writer)))
+
+
+class BuildStampTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mod = load_module()
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.source_root = self.dir / "src"
+        (self.source_root / "core").mkdir(parents=True)
+        self.source = self.source_root / "core" / "lib.zig"
+        self.source.write_text("pub fn f() void {}\n", encoding="utf-8")
+        self.cmd = ["zig", "build-exe", "-OReleaseFast"]
+        self.toolchain = python_cmd("print('0.15.1')")
+
+    def stamp(self) -> str:
+        return self.mod.build_stamp(self.cmd, self.source_root, self.toolchain)
+
+    def test_touch_keeps_stamp(self) -> None:
+        before = self.stamp()
+        later = self.source.stat().st_mtime + 3600
+        os.utime(self.source, (later, later))
+        self.assertEqual(self.stamp(), before)
+
+    def test_content_change_alters_stamp(self) -> None:
+        before = self.stamp()
+        self.source.write_text("pub fn f() void { return; }\n", encoding="utf-8")
+        self.assertNotEqual(self.stamp(), before)
+
+    def test_toolchain_change_alters_stamp(self) -> None:
+        before = self.stamp()
+        self.toolchain = python_cmd("print('0.16.0')")
+        self.assertNotEqual(self.stamp(), before)
+
+    def test_command_change_alters_stamp(self) -> None:
+        before = self.stamp()
+        self.cmd = ["zig", "build-exe", "-OReleaseSafe"]
+        self.assertNotEqual(self.stamp(), before)
+
+    def test_target_tree_is_ignored(self) -> None:
+        before = self.stamp()
+        (self.source_root / "target").mkdir()
+        (self.source_root / "target" / "out.bin").write_bytes(b"\0" * 64)
+        self.assertEqual(self.stamp(), before)
+
+
+class BuildIfStaleTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mod = load_module()
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.source_root = self.dir / "src"
+        self.source_root.mkdir()
+        (self.source_root / "main.zig").write_text("pub fn main() void {}\n", encoding="utf-8")
+        self.binary = self.dir / "bench"
+        self.builds = self.dir / "builds.log"
+        # The fake build writes the binary and logs one line per invocation.
+        self.cmd = python_cmd(
+            "import sys; open(sys.argv[1], 'w').write('bin');"
+            " open(sys.argv[2], 'a').write('build\\n')"
+        ) + [str(self.binary), str(self.builds)]
+
+    def build(self, force_rebuild: bool = False) -> None:
+        self.mod.build_if_stale(
+            label="test",
+            cmd=self.cmd,
+            binary=self.binary,
+            source_root=self.source_root,
+            toolchain_version_cmd=python_cmd("print('1')"),
+            force_rebuild=force_rebuild,
+        )
+
+    def build_count(self) -> int:
+        return len(self.builds.read_text(encoding="utf-8").splitlines()) if self.builds.exists() else 0
+
+    def test_fresh_stamp_skips_build(self) -> None:
+        self.build()
+        self.assertEqual(self.build_count(), 1)
+        self.assertTrue(self.mod.stamp_path(self.binary).exists())
+        self.build()
+        self.assertEqual(self.build_count(), 1)
+
+    def test_source_change_force_and_missing_binary_rebuild(self) -> None:
+        self.build()
+        (self.source_root / "main.zig").write_text("pub fn main() void { _ = 1; }\n", encoding="utf-8")
+        self.build()
+        self.assertEqual(self.build_count(), 2)
+        self.build(force_rebuild=True)
+        self.assertEqual(self.build_count(), 3)
+        self.binary.unlink()
+        self.build()
+        self.assertEqual(self.build_count(), 4)
+
+    def test_failed_build_raises_and_leaves_no_stamp(self) -> None:
+        self.cmd = python_cmd("import sys; sys.stderr.write('boom'); sys.exit(1)")
+        with self.assertRaisesRegex(RuntimeError, "test benchmark binary build failed:\nboom"):
+            self.build()
+        self.assertFalse(self.mod.stamp_path(self.binary).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Unit tests for benchmark full report loading."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS = ROOT / "scripts"
+
+
+def load_module(name: str):
+    # Scripts import their shared helpers (bench_io) as sibling modules.
+    if str(SCRIPTS) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS))
+    module_path = SCRIPTS / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name, module_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"failed to load module from {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def inf_ratio_report() -> bytes:
+    # benchmark_full writes reports with stdlib json; a zero divisor in ratio()
+    # serializes as the non-standard Infinity token.
+    report = {
+        "families": [
+            {"family": "wide_fibonacci", "zig_over_rust": float("inf")},
+            {"family": "xor", "zig_over_rust": 1.25},
+        ],
+    }
+    return json.dumps(report, indent=2).encode("utf-8")
+
+
+class LoadsJsonTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.modules = [load_module("benchmark_full"), load_module("benchmark_contrast_long_ab")]
+
+    def test_loads_inf_ratio_report(self) -> None:
+        raw = inf_ratio_report()
+        for module in self.modules:
+            with self.subTest(module=module.__name__):
+                payload = module.loads_json(raw)
+                self.assertEqual(payload["families"][0]["zig_over_rust"], float("inf"))
+                self.assertEqual(payload["families"][1]["zig_over_rust"], 1.25)
+
+    def test_full_ratio_round_trips_through_report(self) -> None:
+        module = self.modules[0]
+        raw = json.dumps({"ratio": module.ratio(1.0, 0.0)}).encode("utf-8")
+        self.assertEqual(module.loads_json(raw), {"ratio": float("inf")})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,19 +5,28 @@ from __future__ import annotations
 
 import copy
 import importlib.util
+import json
+import sys
+import tempfile
 import unittest
 from pathlib import Path
 
 
 ROOT = Path(__file__).resolve().parents[2]
-MODULE_PATH = ROOT / "scripts" / "benchmark_pages.py"
+SCRIPTS = ROOT / "scripts"
+MODULE_PATH = SCRIPTS / "benchmark_pages.py"
 
 
 def load_module():
+    # Scripts import their shared helpers (bench_io) as sibling modules.
+    if str(SCRIPTS) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS))
     spec = importlib.util.spec_from_file_location("benchmark_pages", MODULE_PATH)
     if spec is None or spec.loader is None:
         raise RuntimeError(f"failed to load module from {MODULE_PATH}")
     module = importlib.util.module_from_spec(spec)
+    # Registered before execution so dataclasses can resolve the module namespace.
+    sys.modules[spec.name] = module
     spec.loader.exec_module(module)
     return module
 
@@ -164,6 +173,58 @@ class BenchmarkPagesTests(unittest.TestCase):
                 ROOT / "vectors" / "reports" / "benchmark_contrast_long_report.json",
             )
 
+    def test_family_rows_render_as_objects(self) -> None:
+        family_report = copy.deepcopy(self.family_report)
+        family_report["families"] = [
+            {
+                "family": "wide_fibonacci",
+                "mapped_workload": {"example": "wide_fibonacci"},
+                "ratios": {"zig_over_rust_prove": 1.5, "zig_over_rust_verify": 0.5},
+                "rust": {"prove": {"avg_seconds": 2.0}, "peak_rss_kb": 1000},
+                "zig": {"prove": {"avg_seconds": 3.0}, "peak_rss_kb": 1500},
+            }
+        ]
+        payload = self.mod.build_payload(
+            family_report,
+            ROOT / "vectors" / "reports" / "benchmark_full_report.json",
+            self.examples_report,
+            ROOT / "vectors" / "reports" / "benchmark_contrast_long_report.json",
+        )
+        rendered = self.mod.render_data_js(payload)
+        prefix = "window.BENCHMARK_PAGE_DATA = "
+        data = json.loads(rendered[len(prefix) : -len(";\n")])
+        row = data["family_rows"][0]
+        self.assertEqual(row["family"], "wide_fibonacci")
+        self.assertEqual(row["zig_over_rust_prove"], 1.5)
+        self.assertEqual(row["zig_over_rust_proof_wire_bytes"], 0.0)
+        self.assertEqual(row["zig_verify_avg_seconds"], 0.0)
+        self.assertEqual(row["zig_over_rust_peak_rss_kb"], 1.5)
+        self.assertEqual(data["example_rows"][0]["name"], "wide_fibonacci_fib5000")
+        self.assertIn("<td>wide_fibonacci</td>", self.mod.render_index_html(payload))
+
+    def test_load_ok_report_accepts_inf_ratio(self) -> None:
+        report = copy.deepcopy(self.family_report)
+        report["summary"]["zig_over_rust_prove_max"] = float("inf")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "benchmark_full_report.json"
+            path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+            loaded = self.mod.load_ok_report(path, "benchmark full report")
+        self.assertEqual(loaded["summary"]["zig_over_rust_prove_max"], float("inf"))
+
+    def test_index_html_is_prerendered(self) -> None:
+        payload = self.mod.build_payload(
+            self.family_report,
+            ROOT / "vectors" / "reports" / "benchmark_full_report.json",
+            self.examples_report,
+            ROOT / "vectors" / "reports" / "benchmark_contrast_long_report.json",
+        )
+        rendered = self.mod.render_index_html(payload)
+        self.assertNotIn("<script", rendered)
+        self.assertNotIn("$", rendered)
+        self.assertIn("<td>wide_fibonacci_fib5000</td>", rendered)
+        self.assertIn("main_trace_commit", rendered)
+        self.assertIn("shared_ratio_axis_max=", rendered)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Unit tests for benchmark smoke proof-shape metrics."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import resource
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS = ROOT / "scripts"
+MODULE_PATH = SCRIPTS / "benchmark_smoke.py"
+
+
+def load_module():
+    # Scripts import their shared helpers (bench_io) as sibling modules.
+    if str(SCRIPTS) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS))
+    spec = importlib.util.spec_from_file_location("benchmark_smoke", MODULE_PATH)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"failed to load module from {MODULE_PATH}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def hashes(count: int, seed: int) -> list[list[int]]:
+    return [[(seed + i + j) % 256 for j in range(32)] for i in range(count)]
+
+
+def qm31s(count: int) -> list[list[int]]:
+    return [[i, i + 1, i + 2, i + 3] for i in range(count)]
+
+
+def fri_layer(witness_len: int, hash_count: int, seed: int) -> dict:
+    return {
+        "fri_witness": qm31s(witness_len),
+        "decommitment": {"hash_witness": hashes(hash_count, seed)},
+        "commitment": hashes(1, seed)[0],
+    }
+
+
+def proof_wire(inner_hash_counts: list[int], trace_hash_counts: list[int]) -> dict:
+    return {
+        "config": {
+            "pow_bits": 0,
+            "fri_config": {"log_blowup_factor": 1, "log_last_layer_degree_bound": 0, "n_queries": 3},
+        },
+        "commitments": hashes(len(trace_hash_counts), 7),
+        "sampled_values": [[qm31s(2), []], [qm31s(1)]],
+        "decommitments": [
+            {"hash_witness": hashes(count, 11 + idx)} for idx, count in enumerate(trace_hash_counts)
+        ],
+        "queried_values": [[[1, 2, 3]], [[4]]],
+        "proof_of_work": 0,
+        "fri_proof": {
+            "first_layer": fri_layer(3, 5, 13),
+            "inner_layers": [fri_layer(2, count, 17 + idx) for idx, count in enumerate(inner_hash_counts)],
+            "last_layer_poly": qm31s(1),
+        },
+    }
+
+
+def encode(proof: dict) -> bytes:
+    return json.dumps(proof, separators=(",", ":")).encode("utf-8")
+
+
+class ProofShapeCountsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = load_module()
+
+    def test_fast_counts_match_full_parse(self) -> None:
+        cases = [
+            proof_wire([4, 3, 0], [6, 0, 9]),
+            proof_wire([], [2]),
+            proof_wire([1], []),
+        ]
+        for proof in cases:
+            proof_bytes = encode(proof)
+            with self.subTest(proof=proof_bytes[:48]):
+                self.assertEqual(
+                    self.module.proof_shape_counts_fast(proof_bytes),
+                    self.module.proof_shape_counts(proof_bytes),
+                )
+
+    def test_fast_counts_reject_string_hashes(self) -> None:
+        proof = proof_wire([2], [3])
+        proof["decommitments"][0]["hash_witness"][1] = "]]" + "a" * 30
+        self.assertIsNone(self.module.proof_shape_counts_fast(encode(proof)))
+
+    def test_fast_counts_reject_pretty_json(self) -> None:
+        proof_bytes = json.dumps(proof_wire([2], [3]), indent=2).encode("utf-8")
+        self.assertIsNone(self.module.proof_shape_counts_fast(proof_bytes))
+
+
+class RunTimedRssTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = load_module()
+
+    def test_child_above_harness_peak_reports_own_rss(self) -> None:
+        harness_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            harness_kb //= 1024
+        target_mib = harness_kb // 1024 + 64
+        script = f"b = bytearray({target_mib} << 20)\nfor i in range(0, len(b), 4096): b[i] = 1"
+        result = self.module.run_timed([sys.executable, "-c", script])
+        self.assertIsNotNone(result["peak_rss_kb"])
+        self.assertGreaterEqual(result["peak_rss_kb"], target_mib * 1024)
+
+    @unittest.skipIf(sys.platform == "darwin", "Darwin children start without inherited RSS")
+    def test_child_below_harness_peak_reports_none(self) -> None:
+        # Raise the harness peak well above what a trivial child needs.
+        ballast = bytearray(128 << 20)
+        for i in range(0, len(ballast), 4096):
+            ballast[i] = 1
+        result = self.module.run_timed([sys.executable, "-c", "pass"])
+        self.assertIsNone(result["peak_rss_kb"])
+
+
+class PartialReportTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = load_module()
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.report_out = self.dir / "smoke.json"
+        self.workloads = [
+            {"name": f"w{index}", "example": "xor", "args": ["--log-n-rows", str(index)]} for index in range(4)
+        ]
+        self.completed: list[str] = []
+        self.completed_lock = threading.Lock()
+
+    def fake_runtime(self, abort_at: str, abort: BaseException):
+        def benchmark_runtime(*, runtime: str, warmups: int, repeats: int, **plan_kwargs):
+            name = plan_kwargs["workload"]["name"]
+            if name == abort_at:
+                raise abort
+            if runtime == "zig":
+                with self.completed_lock:
+                    self.completed.append(name)
+            return {
+                "prove": {"avg_seconds": 1.0},
+                "verify": {"avg_seconds": 1.0},
+                "proof_metrics": {"proof_wire_bytes": 100, "commitments_count": 3, "decommitments_count": 3},
+            }
+
+        return benchmark_runtime
+
+    def run_aborted(self, abort_at: str, abort: BaseException, *extra_args: str) -> list[str]:
+        argv = ["benchmark_smoke.py", "--report-out", str(self.report_out), *extra_args]
+        with (
+            mock.patch.object(sys, "argv", argv),
+            mock.patch.object(self.module, "ARTIFACT_DIR", self.dir / "artifacts"),
+            mock.patch.object(self.module, "BASE_WORKLOADS", self.workloads),
+            mock.patch.object(self.module, "ensure_binaries"),
+            mock.patch.object(self.module, "split_cpu_groups", return_value=None),
+            mock.patch.object(self.module, "benchmark_runtime", self.fake_runtime(abort_at, abort)),
+            mock.patch("sys.stderr"),
+        ):
+            with self.assertRaises(type(abort)):
+                self.module.main()
+        self.assertFalse(self.report_out.exists())
+        lines = self.report_out.with_suffix(".ndjson").read_text(encoding="utf-8").splitlines()
+        return [json.loads(line)["entry"]["name"] for line in lines]
+
+    def test_sidecar_keeps_workloads_completed_before_interrupt(self) -> None:
+        names = self.run_aborted("w2", KeyboardInterrupt())
+        self.assertEqual(names, ["w0", "w1"])
+
+    def test_sidecar_keeps_every_completed_parallel_workload(self) -> None:
+        names = self.run_aborted("w1", RuntimeError("bench failed"), "--parallel-workloads", "2")
+        self.assertNotIn("w1", names)
+        self.assertEqual(sorted(names), sorted(self.completed))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -31,6 +31,16 @@ const BenchResult = struct {
     checksum: [4]u32,
 };
 
+const BatchEntry = struct {
+    kernel: []const u8,
+    log_size: u32,
+    iterations: usize,
+    samples: usize,
+};
+
+// Batch specs arrive on stdin; anything larger is rejected rather than truncated.
+const MAX_BATCH_SPEC_BYTES: usize = 1 << 20;
+
 pub fn listKernels(writer: anytype) !void {
     const rendered = try std.json.Stringify.valueAlloc(std.heap.page_allocator, KERNEL_NAMES, .{});
     defer std.heap.page_allocator.free(rendered);
@@ -204,6 +214,71 @@ fn benchKernel(
     };
 }
 
+// Runs one kernel `sample_count` times and emits the results as one JSON array.
+fn benchSamples(
+    allocator: std.mem.Allocator,
+    kernel: Kernel,
+    log_size: u32,
+    iterations: usize,
+    sample_count: usize,
+    writer: anytype,
+) !void {
+    if (sample_count == 0) return error.InvalidSamples;
+    const results = try allocator.alloc(BenchResult, sample_count);
+    defer allocator.free(results);
+    for (results) |*result| {
+        result.* = try benchKernel(allocator, kernel, log_size, iterations);
+    }
+
+    const rendered = try std.json.Stringify.valueAlloc(allocator, results, .{});
+    defer allocator.free(rendered);
+    try writer.writeAll(rendered);
+    try writer.writeAll("\n");
+}
+
+// Parses a JSON batch spec and validates every entry before anything is timed.
+fn parseBatchSpec(allocator: std.mem.Allocator, spec: []const u8) !std.json.Parsed([]const BatchEntry) {
+    const parsed = try std.json.parseFromSlice([]const BatchEntry, allocator, spec, .{
+        .ignore_unknown_fields = false,
+    });
+    errdefer parsed.deinit();
+
+    if (parsed.value.len == 0) return error.EmptyBatch;
+    for (parsed.value) |entry| {
+        _ = try parseKernel(entry.kernel);
+        if (entry.iterations == 0) return error.InvalidIterations;
+        if (entry.log_size == 0 or entry.log_size > 20) return error.InvalidLogSize;
+        if (entry.samples == 0) return error.InvalidSamples;
+    }
+    return parsed;
+}
+
+// Runs every entry of a JSON batch spec back to back and emits one flat array
+// holding `samples` results per entry, in spec order.
+fn benchBatch(allocator: std.mem.Allocator, spec: []const u8, writer: anytype) !void {
+    const parsed = try parseBatchSpec(allocator, spec);
+    defer parsed.deinit();
+
+    var total: usize = 0;
+    for (parsed.value) |entry| total += entry.samples;
+
+    const results = try allocator.alloc(BenchResult, total);
+    defer allocator.free(results);
+    var next: usize = 0;
+    for (parsed.value) |entry| {
+        const kernel = try parseKernel(entry.kernel);
+        for (results[next..][0..entry.samples]) |*result| {
+            result.* = try benchKernel(allocator, kernel, entry.log_size, entry.iterations);
+        }
+        next += entry.samples;
+    }
+
+    const rendered = try std.json.Stringify.valueAlloc(allocator, results, .{});
+    defer allocator.free(rendered);
+    try writer.writeAll(rendered);
+    try writer.writeAll("\n");
+}
+
 pub fn main() !void {
     const allocator = std.heap.page_allocator;
     const args = try std.process.argsAlloc(allocator);
@@ -213,6 +288,7 @@ pub fn main() !void {
     var kernel_name: ?[]const u8 = null;
     var log_size: u32 = 11;
     var iterations: usize = 200;
+    var samples: ?usize = null;
 
     var i: usize = 1;
     while (i < args.len) : (i += 1) {
@@ -230,6 +306,8 @@ pub fn main() !void {
             log_size = try parseU32(value);
         } else if (std.mem.eql(u8, arg, "--iterations")) {
             iterations = try parseUsize(value);
+        } else if (std.mem.eql(u8, arg, "--samples")) {
+            samples = try parseUsize(value);
         } else {
             return error.InvalidArgument;
         }
@@ -241,12 +319,32 @@ pub fn main() !void {
         return;
     }
 
+    // `--mode bench-batch` reads `[{"kernel":..,"log_size":..,"iterations":..,"samples":..}]`
+    // from stdin and covers the whole kernel matrix in a single process invocation.
+    if (std.mem.eql(u8, selected_mode, "bench-batch")) {
+        const spec = std.fs.File.stdin().readToEndAlloc(allocator, MAX_BATCH_SPEC_BYTES) catch |err| switch (err) {
+            error.FileTooBig => return error.BatchSpecTooLarge,
+            else => return err,
+        };
+        defer allocator.free(spec);
+        try benchBatch(allocator, spec, std.fs.File.stdout());
+        return;
+    }
+
     if (!std.mem.eql(u8, selected_mode, "bench")) return error.InvalidMode;
     if (iterations == 0) return error.InvalidIterations;
     if (log_size == 0 or log_size > 20) return error.InvalidLogSize;
 
     const selected_kernel_name = kernel_name orelse return error.MissingKernel;
     const kernel = try parseKernel(selected_kernel_name);
+
+    // `--samples N` runs the kernel N times in this process and emits an array,
+    // so harnesses pay process startup once per kernel instead of once per sample.
+    if (samples) |sample_count| {
+        try benchSamples(allocator, kernel, log_size, iterations, sample_count, std.fs.File.stdout());
+        return;
+    }
+
     const result = try benchKernel(allocator, kernel, log_size, iterations);
 
     const rendered = try std.json.Stringify.valueAlloc(allocator, result, .{});
@@ -263,3 +361,84 @@ test "bench kernels: kernel list is stable and unique" {
         }
     }
 }
+
+test "bench kernels: batch spec rejects bad and missing fields" {
+    const allocator = std.testing.allocator;
+    try std.testing.expectError(error.InvalidKernel, parseBatchSpec(
+        allocator,
+        \\[{"kernel":"nope","log_size":4,"iterations":1,"samples":1}]
+    ));
+    try std.testing.expectError(error.MissingField, parseBatchSpec(
+        allocator,
+        \\[{"kernel":"fft","log_size":4,"iterations":1}]
+    ));
+    try std.testing.expectError(error.UnknownField, parseBatchSpec(
+        allocator,
+        \\[{"kernel":"fft","log_size":4,"iterations":1,"samples":1,"extra":0}]
+    ));
+    try std.testing.expectError(error.InvalidSamples, parseBatchSpec(
+        allocator,
+        \\[{"kernel":"fft","log_size":4,"iterations":1,"samples":0}]
+    ));
+    try std.testing.expectError(error.InvalidLogSize, parseBatchSpec(
+        allocator,
+        \\[{"kernel":"fft","log_size":21,"iterations":1,"samples":1}]
+    ));
+    try std.testing.expectError(error.InvalidIterations, parseBatchSpec(
+        allocator,
+        \\[{"kernel":"fft","log_size":4,"iterations":0,"samples":1}]
+    ));
+    try std.testing.expectError(error.EmptyBatch, parseBatchSpec(allocator, "[]"));
+}
+
+test "bench kernels: batch results follow spec order with per-entry sample counts" {
+    const allocator = std.testing.allocator;
+    const spec =
+        \\[{"kernel":"fft","log_size":4,"iterations":1,"samples":2},
+        \\ {"kernel":"eval_at_point","log_size":4,"iterations":1,"samples":3},
+        \\ {"kernel":"fft","log_size":5,"iterations":1,"samples":1}]
+    ;
+
+    var out = std.ArrayList(u8).empty;
+    defer out.deinit(allocator);
+    try benchBatch(allocator, spec, out.writer(allocator));
+
+    const parsed = try std.json.parseFromSlice([]const BenchResult, allocator, out.items, .{});
+    defer parsed.deinit();
+    const results = parsed.value;
+
+    const expected = [_]struct { kernel: []const u8, log_size: u32 }{
+        .{ .kernel = "fft", .log_size = 4 },
+        .{ .kernel = "fft", .log_size = 4 },
+        .{ .kernel = "eval_at_point", .log_size = 4 },
+        .{ .kernel = "eval_at_point", .log_size = 4 },
+        .{ .kernel = "eval_at_point", .log_size = 4 },
+        .{ .kernel = "fft", .log_size = 5 },
+    };
+    try std.testing.expectEqual(expected.len, results.len);
+    for (expected, results) |want, got| {
+        try std.testing.expectEqualStrings(want.kernel, got.kernel);
+        try std.testing.expectEqual(want.log_size, got.log_size);
+    }
+}
+
+test "bench kernels: samples mode emits one result per sample" {
+    const allocator = std.testing.allocator;
+    var out = std.ArrayList(u8).empty;
+    defer out.deinit(allocator);
+    try benchSamples(allocator, .eval_at_point, 4, 1, 3, out.writer(allocator));
+
+    const parsed = try std.json.parseFromSlice([]const BenchResult, allocator, out.items, .{});
+    defer parsed.deinit();
+    try std.testing.expectEqual(@as(usize, 3), parsed.value.len);
+    for (parsed.value) |result| {
+        try std.testing.expectEqualStrings("eval_at_point", result.kernel);
+        try std.testing.expectEqual(@as(u32, 4), result.log_size);
+    }
+
+    out.clearRetainingCapacity();
+    try std.testing.expectError(
+        error.InvalidSamples,
+        benchSamples(allocator, .fft, 4, 1, 0, out.writer(allocator)),
+    );
+}
@@ -1,3 +1,8 @@
 const impl = @import("bench/kernels.zig");
 
 pub const main = impl.main;
+
+test {
+    // `zig test src/bench_kernels.zig` runs the runner's own tests.
+    _ = impl;
+}